@@ -0,0 +1,79 @@
+"""Indexes for hot queries
+
+Revision ID: 39488cbf7310
+Revises: a619bd414ff0
+Create Date: 2026-10-18 10:12:31.284519
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "39488cbf7310"
+down_revision = "a619bd414ff0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_job_triggers_type_trigger_id",
+        "job_triggers",
+        ["type", "trigger_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_copr_build_targets_owner_project_name_commit_sha_target",
+        "copr_build_targets",
+        ["owner", "project_name", "commit_sha", "target"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_copr_build_targets_status_pending",
+        "copr_build_targets",
+        ["status"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_tft_test_run_targets_commit_sha_target",
+        "tft_test_run_targets",
+        ["commit_sha", "target"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tft_test_run_targets_status_not_completed",
+        "tft_test_run_targets",
+        ["status"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('new', 'queued', 'running')"),
+    )
+    op.create_index(
+        "ix_srpm_builds_build_submitted_time_with_logs",
+        "srpm_builds",
+        ["build_submitted_time"],
+        unique=False,
+        postgresql_where=sa.text("logs IS NOT NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_srpm_builds_build_submitted_time_with_logs", table_name="srpm_builds"
+    )
+    op.drop_index(
+        "ix_tft_test_run_targets_status_not_completed",
+        table_name="tft_test_run_targets",
+    )
+    op.drop_index(
+        "ix_tft_test_run_targets_commit_sha_target", table_name="tft_test_run_targets"
+    )
+    op.drop_index(
+        "ix_copr_build_targets_status_pending", table_name="copr_build_targets"
+    )
+    op.drop_index(
+        "ix_copr_build_targets_owner_project_name_commit_sha_target",
+        table_name="copr_build_targets",
+    )
+    op.drop_index("ix_job_triggers_type_trigger_id", table_name="job_triggers")
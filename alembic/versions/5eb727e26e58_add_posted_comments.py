@@ -0,0 +1,40 @@
+"""Add posted comments
+
+Revision ID: 5eb727e26e58
+Revises: 39488cbf7310
+Create Date: 2026-10-18 11:02:45.931207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5eb727e26e58"
+down_revision = "39488cbf7310"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "posted_comments",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_url", sa.String(), nullable=True),
+        sa.Column("pr_id", sa.Integer(), nullable=True),
+        sa.Column("commit_sha", sa.String(), nullable=True),
+        sa.Column("body_hash", sa.String(), nullable=True),
+        sa.Column("posted_time", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_posted_comments_target",
+        "posted_comments",
+        ["project_url", "pr_id", "commit_sha"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_posted_comments_target", table_name="posted_comments")
+    op.drop_table("posted_comments")
@@ -0,0 +1,103 @@
+"""Compressed SRPM build logs
+
+Revision ID: d3a4c2b9e1f7
+Revises: 5eb727e26e58
+Create Date: 2026-10-18 12:41:09.512847
+
+"""
+import gzip
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d3a4c2b9e1f7"
+down_revision = "5eb727e26e58"
+branch_labels = None
+depends_on = None
+
+# logs are moved in batches so that they don't need to fit into memory at once
+BATCH_SIZE = 1000
+
+srpm_builds = sa.table(
+    "srpm_builds",
+    sa.column("id", sa.Integer),
+    sa.column("logs", sa.Text),
+)
+srpm_build_logs = sa.table(
+    "srpm_build_logs",
+    sa.column("srpm_build_id", sa.Integer),
+    sa.column("compressed_logs", sa.LargeBinary),
+)
+
+
+def upgrade():
+    op.create_table(
+        "srpm_build_logs",
+        sa.Column("srpm_build_id", sa.Integer(), nullable=False),
+        sa.Column("compressed_logs", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["srpm_build_id"],
+            ["srpm_builds.id"],
+        ),
+        sa.PrimaryKeyConstraint("srpm_build_id"),
+    )
+
+    bind = op.get_bind()
+    last_id = 0
+    while rows := bind.execute(
+        sa.select(srpm_builds.c.id, srpm_builds.c.logs)
+        .where(srpm_builds.c.logs.isnot(None), srpm_builds.c.id > last_id)
+        .order_by(srpm_builds.c.id)
+        .limit(BATCH_SIZE)
+    ).fetchall():
+        bind.execute(
+            srpm_build_logs.insert(),
+            [
+                {"srpm_build_id": id_, "compressed_logs": gzip.compress(logs.encode())}
+                for id_, logs in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+    op.drop_index(
+        "ix_srpm_builds_build_submitted_time_with_logs", table_name="srpm_builds"
+    )
+    op.drop_column("srpm_builds", "logs")
+    op.create_index(
+        "ix_srpm_builds_build_submitted_time",
+        "srpm_builds",
+        ["build_submitted_time"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_srpm_builds_build_submitted_time", table_name="srpm_builds")
+    op.add_column("srpm_builds", sa.Column("logs", sa.Text(), nullable=True))
+
+    bind = op.get_bind()
+    last_id = 0
+    while rows := bind.execute(
+        sa.select(srpm_build_logs.c.srpm_build_id, srpm_build_logs.c.compressed_logs)
+        .where(srpm_build_logs.c.srpm_build_id > last_id)
+        .order_by(srpm_build_logs.c.srpm_build_id)
+        .limit(BATCH_SIZE)
+    ).fetchall():
+        for id_, compressed_logs in rows:
+            bind.execute(
+                srpm_builds.update()
+                .where(srpm_builds.c.id == id_)
+                .values(logs=gzip.decompress(compressed_logs).decode(errors="replace"))
+            )
+        last_id = rows[-1][0]
+
+    op.create_index(
+        "ix_srpm_builds_build_submitted_time_with_logs",
+        "srpm_builds",
+        ["build_submitted_time"],
+        unique=False,
+        postgresql_where=sa.text("logs IS NOT NULL"),
+    )
+    op.drop_table("srpm_build_logs")
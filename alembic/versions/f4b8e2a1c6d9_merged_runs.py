@@ -0,0 +1,65 @@
+"""Summaries of the merged runs
+
+Revision ID: f4b8e2a1c6d9
+Revises: d3a4c2b9e1f7
+Create Date: 2026-10-18 20:14:37.208316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f4b8e2a1c6d9"
+down_revision = "d3a4c2b9e1f7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # the summaries of the existing pipelines are created by backfill_merged_runs.py
+    op.create_table(
+        "merged_runs",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("datetime", sa.DateTime(), nullable=True),
+        sa.Column("job_trigger_id", sa.Integer(), nullable=True),
+        sa.Column("srpm_build_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "copr_build_ids",
+            sa.ARRAY(sa.Integer()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column(
+            "koji_build_ids",
+            sa.ARRAY(sa.Integer()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column(
+            "test_run_ids",
+            sa.ARRAY(sa.Integer()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column(
+            "propose_downstream_run_ids",
+            sa.ARRAY(sa.Integer()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["job_trigger_id"],
+            ["job_triggers.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["srpm_build_id"],
+            ["srpm_builds.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("srpm_build_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("merged_runs")
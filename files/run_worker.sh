@@ -29,17 +29,24 @@ if [[ "${CELERY_COMMAND}" == "beat" ]]; then
     exec celery --app="${APP}" beat --loglevel="${LOGLEVEL:-DEBUG}" --pidfile=/tmp/celerybeat.pid --schedule=/tmp/celerybeat-schedule
 
 elif [[ "${CELERY_COMMAND}" == "worker" ]]; then
-    # define queues to serve
-    DEFAULT_QUEUES="short-running,long-running"
+    # define queues to serve (see task_routes in celery_config.py)
+    DEFAULT_QUEUES="short-running,long-running,io-bound"
     QUEUES="${QUEUES:-$DEFAULT_QUEUES}"
 
+    if [[ "$QUEUES" == "io-bound" ]]; then
+      # The tasks only wait for the APIs, many of them can run at once.
+      DEFAULT_CONCURRENCY="16"
+      DEFAULT_POOL="threads"
+    else
+      DEFAULT_CONCURRENCY="1"
+      DEFAULT_POOL="solo"
+    fi
+
     # Number of concurrent worker threads executing tasks.
-    DEFAULT_CONCURRENCY="1"
     CONCURRENCY="${CONCURRENCY:-$DEFAULT_CONCURRENCY}"
 
-    # Options: prefork | eventlet | gevent | solo
+    # Options: prefork | eventlet | gevent | solo | threads
     # https://www.distributedpython.com/2018/10/26/celery-execution-pool/
-    DEFAULT_POOL="solo"
     POOL="${POOL:-$DEFAULT_POOL}"
 
     # if this worker serves the long-running queue, it needs the repository cache
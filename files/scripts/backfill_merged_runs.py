@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+"""
+Create the summaries of the merged runs (the merged_runs table)
+for the pipelines created before the table was introduced.
+
+Safe to run while the service is running and to re-run,
+the runs that already have a summary are skipped.
+"""
+import logging
+
+import click
+
+from packit_service.models import MergedRunModel
+
+
+@click.command()
+@click.option(
+    "--batch-size",
+    default=1000,
+    type=click.IntRange(min=1),
+    help="Number of SRPM builds (or pipelines without them) processed in one transaction.",
+)
+@click.option("--verbose", is_flag=True, help="Log the progress.")
+def backfill(batch_size, verbose):
+    if verbose:
+        logging.basicConfig(level=logging.DEBUG)
+    created = MergedRunModel.backfill(batch_size=batch_size)
+    click.echo(f"Created {created} summaries of merged runs.")
+
+
+if __name__ == "__main__":
+    backfill()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+"""
+Micro-benchmark of the event serialization.
+
+For each fixture, the parsed event is serialized as many times as it would be
+when creating signatures of the tasks for multiple jobs. Compares deep-copying
+the event (what get_dict used to do), building the dict every time (get_dict)
+and reusing the cached dict (get_cached_dict), the JSON serialization
+done by Celery is included in all of them.
+
+Some parsers query the database or the service configuration, so run this
+where the worker runs, fixtures that fail to parse are reported as errors.
+"""
+import copy
+import json
+from pathlib import Path
+from timeit import timeit
+
+import click
+
+from packit_service.worker.parser import Parser
+from parser_benchmark import DATA_DIR, get_fixtures
+
+
+@click.command()
+@click.option(
+    "--number", default=100, type=int, help="How many times to serialize each event."
+)
+@click.option(
+    "--signatures",
+    default=5,
+    type=int,
+    help="How many signatures are created for each event.",
+)
+@click.option(
+    "--data-dir",
+    default=DATA_DIR,
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory with the JSON fixtures.",
+)
+def run(number, signatures, data_dir):
+    click.echo(
+        f"{'fixture':<50} {'deepcopy [us]':>14} {'get_dict [us]':>14} {'cached [us]':>14}"
+    )
+    for name, event, event_type in get_fixtures(data_dir):
+        try:
+            event_object = Parser.parse_event(event, event_type=event_type)
+            if not event_object:
+                continue
+
+            def deepcopy():
+                for _ in range(signatures):
+                    copy.deepcopy(event_object.__dict__)
+                    json.dumps(event_object.get_dict())
+
+            def get_dict():
+                for _ in range(signatures):
+                    json.dumps(event_object.get_dict())
+
+            def cached():
+                # a new event is serialized in each run
+                event_object.__dict__.pop("_cached_dict", None)
+                for _ in range(signatures):
+                    json.dumps(event_object.get_cached_dict())
+
+            times = [timeit(f, number=number) for f in (deepcopy, get_dict, cached)]
+        except Exception as ex:
+            click.echo(f"{name:<50} error: {ex!r}")
+            continue
+
+        click.echo(
+            f"{name:<50} " + " ".join(f"{t / number * 1e6:>14.1f}" for t in times)
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the list queries of the API.
+
+Measures the latency of fetching a deep page of each list by its offset
+(the `page` argument) and by the cursor of the preceding page
+(the `cursor` argument, keyset pagination).
+
+The queries are run against the database configured for the service,
+so run this where the API runs, ideally with a copy of the production data.
+"""
+from timeit import repeat
+from typing import Callable, Iterable, Optional
+
+import click
+
+from packit_service.models import (
+    CoprBuildTargetModel,
+    KojiBuildTargetModel,
+    MergedRunModel,
+    ProposeDownstreamModel,
+    SRPMBuildModel,
+    TFTTestRunTargetModel,
+    end_session,
+)
+
+# name of the list -> its query and the pagination key of the entries
+LISTS = {
+    "copr-builds": (
+        CoprBuildTargetModel.get_merged_chroots,
+        lambda build: build.new_id,
+    ),
+    "koji-builds": (KojiBuildTargetModel.get_range, lambda build: build.id),
+    "propose-downstreams": (ProposeDownstreamModel.get_range, lambda run: run.id),
+    "runs": (MergedRunModel.get_range, lambda run: run.id),
+    "srpm-builds": (SRPMBuildModel.get_range, lambda build: build.id),
+    "test-results": (TFTTestRunTargetModel.get_range, lambda run: run.id),
+}
+
+
+def measure(fetch: Callable[[], Iterable], repetitions: int) -> float:
+    """Return the best time of fetching the page in milliseconds."""
+
+    def run():
+        list(fetch())
+        end_session(commit=False)
+
+    return min(repeat(run, number=1, repeat=repetitions)) * 1000
+
+
+@click.command()
+@click.option("--page", default=1000, type=click.IntRange(min=2), help="Page to fetch.")
+@click.option("--per-page", default=20, type=int, help="Results per page.")
+@click.option(
+    "--repetitions", default=5, type=int, help="How many times to fetch each page."
+)
+def run(page, per_page, repetitions):
+    click.echo(f"{'list':<25} {'offset [ms]':>12} {'cursor [ms]':>12}")
+    first, last = (page - 1) * per_page, page * per_page
+    for name, (get_range, get_key) in LISTS.items():
+        # the cursor the client would get with the preceding page
+        preceding = list(get_range(first - per_page, first))
+        before: Optional[int] = get_key(preceding[-1]) if preceding else None
+        end_session(commit=False)
+        if before is None:
+            click.echo(f"{name:<25} fewer than {page - 1} pages")
+            continue
+
+        offset_time = measure(lambda: get_range(first, last), repetitions)
+        cursor_time = measure(
+            lambda: get_range(0, per_page, before=before), repetitions
+        )
+        click.echo(f"{name:<25} {offset_time:>12.1f} {cursor_time:>12.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+"""
+Micro-benchmark of the event parsing.
+
+Compares the per-event latency of trying all the parsers in sequence (how
+the events of an unknown type are parsed) with picking the parsers by the type
+of the event (webhook header, fedmsg topic).
+
+Some parsers query the database or the service configuration, so run this
+where the worker runs, fixtures that fail to parse are reported as errors.
+"""
+import json
+from pathlib import Path
+from timeit import timeit
+from typing import Iterator, Optional, Tuple
+
+import click
+
+from packit_service.worker.parser import PARSERS, Parser
+
+DATA_DIR = Path(__file__).parent.parent.parent / "tests" / "data"
+
+# prefixes of the fixture names -> X-GitHub-Event header
+# (the header is not a part of the stored payloads)
+GITHUB_FIXTURE_TO_EVENT_TYPE = (
+    ("checkrun", "check_run"),
+    ("installation", "installation"),
+    ("issue", "issue_comment"),
+    ("pr_comment", "issue_comment"),
+    ("pr", "pull_request"),
+    ("push", "push"),
+    ("release", "release"),
+)
+
+
+def get_fixtures(data_dir: Path) -> Iterator[Tuple[str, dict, Optional[str]]]:
+    """
+    Yield name, payload and event type of the JSON fixtures.
+    """
+    for path in sorted(data_dir.glob("**/*.json")):
+        event = json.loads(path.read_text())
+        event_type = None
+        if path.parent.name in ("github", "copr_build"):
+            event_type = next(
+                (
+                    event_type
+                    for prefix, event_type in GITHUB_FIXTURE_TO_EVENT_TYPE
+                    if path.name.startswith(prefix)
+                ),
+                None,
+            )
+        elif path.parent.name == "testing_farm":
+            if path.name != "notification.json":
+                # responses of the Testing Farm API, not events
+                continue
+            # added by our webhook
+            event["source"] = "testing-farm"
+
+        yield str(path.relative_to(data_dir)), event, event_type
+
+
+def parse_sequentially(event: dict):
+    for parser in PARSERS:
+        if response := parser(event):
+            return response
+    return None
+
+
+@click.command()
+@click.option(
+    "--number", default=100, type=int, help="How many times to parse each event."
+)
+@click.option(
+    "--data-dir",
+    default=DATA_DIR,
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory with the JSON fixtures.",
+)
+def run(number, data_dir):
+    click.echo(f"{'fixture':<50} {'sequential [us]':>16} {'dispatched [us]':>16}")
+    for name, event, event_type in get_fixtures(data_dir):
+        try:
+            before = timeit(lambda: parse_sequentially(event), number=number)
+            after = timeit(
+                lambda: Parser.parse_event(event, event_type=event_type),
+                number=number,
+            )
+        except Exception as ex:
+            click.echo(f"{name:<50} error: {ex!r}")
+            continue
+
+        click.echo(
+            f"{name:<50} {before / number * 1e6:>16.1f} {after / number * 1e6:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -1,14 +1,25 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import time
 from os import getenv
 
 from celery import Celery
+from celery.signals import before_task_publish
 from lazy_object_proxy import Proxy
 
 from packit_service.sentry_integration import configure_sentry
 
 
+def get_redis_url() -> str:
+    """Create redis connection string (used by Celery and the caches)."""
+    host = getenv("REDIS_SERVICE_HOST", "redis")
+    password = getenv("REDIS_PASSWORD", "")
+    port = getenv("REDIS_SERVICE_PORT", "6379")
+    db = getenv("REDIS_SERVICE_DB", "0")
+    return f"redis://:{password}@{host}:{port}/{db}"
+
+
 class Celerizer:
     def __init__(self):
         self._celery_app = None
@@ -16,14 +27,8 @@ class Celerizer:
     @property
     def celery_app(self):
         if self._celery_app is None:
-            host = getenv("REDIS_SERVICE_HOST", "redis")
-            password = getenv("REDIS_PASSWORD", "")
-            port = getenv("REDIS_SERVICE_PORT", "6379")
-            db = getenv("REDIS_SERVICE_DB", "0")
-            broker_url = f"redis://:{password}@{host}:{port}/{db}"
-
             # http://docs.celeryq.dev/en/stable/reference/celery.html#celery.Celery
-            self._celery_app = Celery(broker=broker_url)
+            self._celery_app = Celery(broker=get_redis_url())
 
             # https://docs.celeryq.dev/en/stable/getting-started/first-steps-with-celery.html#configuration
             self._celery_app.config_from_object("packit_service.celery_config")
@@ -43,3 +48,9 @@ def get_celery_application():
 
 
 celery_app: Celery = Proxy(get_celery_application)
+
+
+@before_task_publish.connect
+def add_sent_time(headers=None, **kwargs):
+    # the workers measure how long the tasks wait in the queues
+    headers["sent_at"] = time.time()
@@ -7,6 +7,44 @@ import packit_service.constants
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_default_queue
 task_default_queue = packit_service.constants.CELERY_TASK_DEFAULT_QUEUE
 
+# The tasks are routed by their cost so that the cheap ones don't wait
+# behind the ones running for minutes, tasks not listed here
+# (e.g. task.steve_jobs.process_message, task.run_testing_farm_handler)
+# go to the default queue.
+# https://docs.celeryq.dev/en/stable/userguide/routing.html#manual-routing
+task_routes = {
+    **{
+        task_name: {"queue": packit_service.constants.CELERY_TASK_IO_BOUND_QUEUE}
+        for task_name in (
+            "task.run_copr_build_start_handler",
+            "task.run_copr_build_end_handler",
+            "task.run_testing_farm_results_handler",
+            "task.run_koji_build_report_handler",
+            "task.run_downstream_koji_build_report_handler",
+            "task.run_installation_handler",
+            "task.github_fas_verification",
+            "task.babysit_copr_build",
+            "packit_service.worker.tasks.monitor_queues",
+        )
+    },
+    **{
+        task_name: {"queue": packit_service.constants.CELERY_TASK_LONG_RUNNING_QUEUE}
+        for task_name in (
+            "task.run_copr_build_handler",
+            "task.run_propose_downstream_handler",
+            "task.run_koji_build_handler",
+            "task.run_sync_from_downstream_handler",
+            "task.run_downstream_koji_build_handler",
+            "task.bodhi_update",
+            "task.retrigger_bodhi_update",
+            "packit_service.worker.tasks.babysit_pending_copr_builds",
+            "packit_service.worker.tasks.babysit_pending_tft_runs",
+            "packit_service.worker.tasks.babysit_pending_koji_builds",
+            "packit_service.worker.tasks.database_maintenance",
+        )
+    },
+}
+
 # https://docs.celeryq.dev/en/stable/userguide/periodic-tasks.html
 beat_schedule = {
     "update-pending-copr-builds": {
@@ -19,11 +57,21 @@ beat_schedule = {
         "schedule": 600.0,
         "options": {"queue": "long-running"},
     },
+    "update-pending-koji-builds": {
+        "task": "packit_service.worker.tasks.babysit_pending_koji_builds",
+        "schedule": 600.0,
+        "options": {"queue": "long-running"},
+    },
     "database-maintenance": {
         "task": "packit_service.worker.tasks.database_maintenance",
         "schedule": crontab(minute=0, hour=1),  # nightly at 1AM
         "options": {"queue": "long-running"},
     },
+    "monitor-queues": {
+        "task": "packit_service.worker.tasks.monitor_queues",
+        "schedule": 60.0,
+        "options": {"expires": 60.0},
+    },
 }
 
 # http://mher.github.io/flower/prometheus-integration.html#set-up-your-celery-application
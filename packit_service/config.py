@@ -105,9 +105,11 @@ class ServiceConfig(Config):
         dashboard_url: str = "",
         koji_logs_url: str = "https://kojipkgs.fedoraproject.org",
         koji_web_url: str = "https://koji.fedoraproject.org",
+        koji_hub_url: str = "https://koji.fedoraproject.org/kojihub",
         enabled_projects_for_srpm_in_copr: Union[Set[str], List[str]] = None,
         comment_command_prefix: str = "/packit",
         allowed_forge_projects_for_copr_project: Dict[str, List[str]] = None,
+        propose_downstream_concurrency: int = 1,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -158,6 +160,8 @@ class ServiceConfig(Config):
         self.dashboard_url = dashboard_url
         self.koji_logs_url = koji_logs_url
         self.koji_web_url = koji_web_url
+        # XML-RPC API of Koji, used to poll the state of the builds
+        self.koji_hub_url = koji_hub_url
 
         self.enabled_projects_for_srpm_in_copr: Set[str] = set(
             enabled_projects_for_srpm_in_copr or []
@@ -172,6 +176,10 @@ class ServiceConfig(Config):
             allowed_forge_projects_for_copr_project or {}
         )
 
+        # How many dist-git branches are synced at once by propose downstream,
+        # each in its own worktree of the upstream clone. 1 syncs them one by one.
+        self.propose_downstream_concurrency = propose_downstream_concurrency
+
     service_config = None
 
     def __repr__(self):
@@ -197,9 +205,11 @@ class ServiceConfig(Config):
             f"dashboard_url='{self.dashboard_url}', "
             f"koji_logs_url='{self.koji_logs_url}', "
             f"koji_web_url='{self.koji_web_url}', "
+            f"koji_hub_url='{self.koji_hub_url}', "
             f"enabled_projects_for_srpm_in_copr= '{self.enabled_projects_for_srpm_in_copr}', "
             f"forge_projects_for_copr_project={self.allowed_forge_projects_for_copr_project}"
-            f"comment_command_prefix='{self.comment_command_prefix}')"
+            f"comment_command_prefix='{self.comment_command_prefix}', "
+            f"propose_downstream_concurrency={self.propose_downstream_concurrency})"
         )
 
     @classmethod
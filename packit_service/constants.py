@@ -84,10 +84,65 @@ BASE_RETRY_INTERVAL_IN_SECONDS_FOR_INTERNAL_ERRORS = 10
 # timeout/internal error. Nothing should hopefully run for 7 days.
 DEFAULT_JOB_TIMEOUT = 7 * 24 * 3600
 
+# Maximum number of concurrent requests when polling the state of pending
+# builds/test runs in the babysit tasks.
+BABYSIT_CONCURRENCY = 10
+
+# Maximum number of Koji builds (targets) submitted concurrently
+KOJI_BUILD_SUBMIT_CONCURRENCY = 5
+
+# Maximum number of Koji tasks whose state is queried in one multicall
+# to the Koji hub when polling the pending Koji builds.
+KOJI_MULTICALL_BATCH_SIZE = 500
+# Timeout (in seconds) of connecting to the Koji hub and of waiting for its response
+KOJI_HUB_TIMEOUT = 60
+
+# Number of package configs kept in the in-process cache of each worker
+PACKAGE_CONFIG_CACHE_SIZE = 256
+# How long (in seconds) are the package configs kept in the shared (redis) cache
+PACKAGE_CONFIG_CACHE_TTL = 24 * 3600
+
+# Number of task payloads (events, package configs) kept in the in-process
+# cache of each worker
+PAYLOAD_STORE_CACHE_SIZE = 64
+# How long (in seconds) are the task payloads kept in redis, it has to cover
+# the time the tasks can wait in the queue (including retries)
+PAYLOAD_STORE_TTL = 24 * 3600
+
+# Maximum number of concurrent requests when reporting statuses of multiple checks
+REPORTING_CONCURRENCY = 8
+# How long (in seconds) are the reported statuses remembered in the shared (redis)
+# cache, kept short so that a status changed by someone else is not left stale
+REPORTED_STATUSES_TTL = 5 * 60
+
+# How often (in seconds) at most are the metrics of a worker pushed
+# to the pushgateway, the pushes are done by a background thread
+PUSHGATEWAY_FLUSH_INTERVAL = 15
+
+# How long (in seconds) is the allowlist cached by each worker,
+# changes done through the Allowlist class invalidate the cache right away
+ALLOWLIST_CACHE_TTL = 60
+
 # SRPM builds older than this number of days are considered
 # outdated and their logs can be discarded.
 SRPMBUILDS_OUTDATED_AFTER_DAYS = 30
 
+# How many SRPM builds get their logs discarded in a single UPDATE
+SRPMBUILDS_DISCARD_BATCH_SIZE = 1000
+
+# Database connections kept open by each worker process (SQLALCHEMY_POOL_SIZE)
+# and how many more can be opened at peaks (SQLALCHEMY_MAX_OVERFLOW),
+# workers with concurrent pools need at least one per thread
+DEFAULT_SQLALCHEMY_POOL_SIZE = 5
+DEFAULT_SQLALCHEMY_MAX_OVERFLOW = 10
+
+# Size of the parts of the multipart upload of the database backup,
+# S3 requires at least 5 MiB and allows up to 10000 parts per upload
+DB_BACKUP_PART_SIZE = 16 * 1024 * 1024
+# Maximum number of parts of the database backup uploaded concurrently
+# (the memory needed for buffering is about this times the part size)
+DB_BACKUP_UPLOAD_CONCURRENCY = 4
+
 DATE_OF_DEFAULT_SRPM_BUILD_IN_COPR = datetime.datetime(
     year=2022,
     month=9,
@@ -106,6 +161,11 @@ ALLOWLIST_CONSTANTS = {
 }
 
 CELERY_TASK_DEFAULT_QUEUE = "short-running"
+# Tasks which only talk to the APIs (reporting of the results),
+# their workers can run many of them concurrently (threads pool).
+CELERY_TASK_IO_BOUND_QUEUE = "io-bound"
+# Tasks running the actions in sandcastle, cloning the repositories etc.
+CELERY_TASK_LONG_RUNNING_QUEUE = "long-running"
 
 CELERY_DEFAULT_MAIN_TASK_NAME = "task.steve_jobs.process_message"
 
@@ -5,17 +5,21 @@
 Data layer on top of PSQL using sqlalch
 """
 
+import codecs
 import enum
+import gzip
+import hashlib
 import logging
 import os
 from contextlib import contextmanager
-from datetime import datetime, timedelta, timezone
-
-# from pathlib import Path
+from datetime import datetime, timedelta
+from io import BytesIO
 from typing import (
     Dict,
     Iterable,
+    Iterator,
     List,
+    NamedTuple,
     Optional,
     TYPE_CHECKING,
     Tuple,
@@ -32,30 +36,47 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     JSON,
+    LargeBinary,
     String,
     Text,
+    and_,
     create_engine,
+    delete,
     desc,
+    distinct,
+    exists,
     func,
     null,
     case,
+    or_,
+    select,
+    tuple_,
+    update,
 )
-from sqlalchemy.dialects.postgresql import array as psql_array
+from sqlalchemy.dialects.postgresql import array as psql_array, insert as psql_insert
 from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import (
     Session as SQLASession,
+    aliased,
+    joinedload,
     relationship,
     scoped_session,
+    selectinload,
     sessionmaker,
 )
 from sqlalchemy.types import ARRAY
 
 from packit.config import JobConfigTriggerType
 from packit.exceptions import PackitException
-from packit_service.constants import ALLOWLIST_CONSTANTS
+from packit_service.constants import (
+    ALLOWLIST_CONSTANTS,
+    DEFAULT_SQLALCHEMY_MAX_OVERFLOW,
+    DEFAULT_SQLALCHEMY_POOL_SIZE,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -70,24 +91,51 @@ def get_pg_url() -> str:
 
 
 # To log SQL statements, set echo=True
-engine = create_engine(get_pg_url(), echo=False)
-Session = sessionmaker(bind=engine)
-
-# Temporary disable singleton session to ensure it's not causing #1728 & #1763
-# if Path("/usr/bin/run_worker.sh").exists():
-if False:
-    # Multi-(green)threaded workers can't use scoped_session()
-    # Downside of a single session is that if postgres is (oom)killed and a transaction
-    # fails to rollback you have to restart the workers so that they pick another session.
-    singleton_session = Session()
-else:  # service/httpd
-    Session = scoped_session(Session)
-    singleton_session = None
+engine = create_engine(
+    get_pg_url(),
+    echo=False,
+    # connections kept open by each process and how many more can be opened
+    # temporarily, size it according to the concurrency of the worker
+    pool_size=int(os.getenv("SQLALCHEMY_POOL_SIZE", DEFAULT_SQLALCHEMY_POOL_SIZE)),
+    max_overflow=int(
+        os.getenv("SQLALCHEMY_MAX_OVERFLOW", DEFAULT_SQLALCHEMY_MAX_OVERFLOW)
+    ),
+    # check the connection before using it so that the workers recover
+    # when postgres is restarted (e.g. oomkilled)
+    pool_pre_ping=os.getenv("SQLALCHEMY_POOL_PRE_PING", "true").lower() == "true",
+)
+# Every thread (greenlet with the monkeypatched threading) gets its own session,
+# Celery tasks and HTTP requests end it when they finish (see end_session).
+Session = scoped_session(sessionmaker(bind=engine))
 
 
 def sa_session() -> SQLASession:
-    """If we use single session, return it, otherwise return a new session from registry."""
-    return singleton_session or Session()
+    """Return the session of the current thread (task) from registry."""
+    return Session()
+
+
+def end_session(commit: bool = True) -> None:
+    """
+    End the session of the current thread (task), the next call of sa_session()
+    in this thread creates a new one.
+
+    Args:
+        commit: Whether to commit or roll back what was not committed yet.
+    """
+    if not Session.registry.has():
+        return
+
+    try:
+        if commit:
+            Session.commit()
+        else:
+            Session.rollback()
+    except Exception as ex:
+        logger.warning(f"Failed to end the database session: {ex!r}")
+        Session.rollback()
+    finally:
+        # closes the session, the connection is returned to the pool
+        Session.remove()
 
 
 @contextmanager
@@ -318,11 +366,57 @@ class BuildsAndTestsConnector:
 class ProjectAndTriggersConnector:
     """
     Abstract class that is inherited by build/test models
-    to share methods for accessing project and trigger models.
+    to share methods for accessing project and trigger models
+    and for updating the models.
     """
 
     runs: Optional[List["PipelineModel"]]
 
+    def update(self, **fields) -> None:
+        """
+        Sets the given attributes of the model and commits them
+        in a single transaction.
+
+        Args:
+            **fields: Attribute names and their new values,
+                `None` is stored as `NULL`.
+
+        Raises:
+            AttributeError: If the model has no such attribute.
+        """
+        for name in fields:
+            if not hasattr(type(self), name):
+                raise AttributeError(
+                    f"{type(self).__name__} has no attribute {name!r}."
+                )
+
+        with sa_session_transaction() as session:
+            for name, value in fields.items():
+                if value is None and name in self.__table__.columns:
+                    value = null()
+                setattr(self, name, value)
+            session.add(self)
+
+    @classmethod
+    def get_by_ids(cls, ids: Iterable[int]) -> Iterable["AbstractBuildTestDbType"]:
+        """
+        Returns all models with the given IDs in one query, with their pipelines
+        and job triggers loaded eagerly, so that accessing the trigger of each
+        returned model does not cause additional queries.
+
+        Args:
+            ids: Packit IDs of the models.
+
+        Returns:
+            Models matching the given IDs (in no particular order).
+        """
+        return (
+            sa_session()
+            .query(cls)
+            .filter(cls.id.in_(set(ids)))
+            .options(selectinload(cls.runs).joinedload(PipelineModel.job_trigger))
+        )
+
     def get_job_trigger_model(self) -> Optional["JobTriggerModel"]:
         return self.runs[0].job_trigger if self.runs else None
 
@@ -359,6 +453,16 @@ class ProjectAndTriggersConnector:
         return None
 
 
+class GitProjectSummary(NamedTuple):
+    """Project with the numbers of its related objects handled by Packit."""
+
+    project: "GitProjectModel"
+    prs_handled: int
+    branches_handled: int
+    releases_handled: int
+    issues_handled: int
+
+
 class GitProjectModel(Base):
     __tablename__ = "git_projects"
     id = Column(Integer, primary_key=True)
@@ -404,25 +508,30 @@ class GitProjectModel(Base):
         return sa_session().query(GitProjectModel).filter_by(id=id_).first()
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["GitProjectModel"]:
-        return (
-            sa_session()
-            .query(GitProjectModel)
-            .order_by(GitProjectModel.namespace)
-            .slice(first, last)
+    def get_range(
+        cls, first: int, last: int, after: Optional[Tuple[str, int]] = None
+    ) -> Iterable["GitProjectModel"]:
+        query = sa_session().query(GitProjectModel)
+        if after is not None:
+            query = query.filter(
+                tuple_(GitProjectModel.namespace, GitProjectModel.id) > tuple_(*after)
+            )
+        return query.order_by(GitProjectModel.namespace, GitProjectModel.id).slice(
+            first, last
         )
 
     @classmethod
     def get_by_forge(
-        cls, first: int, last: int, forge: str
+        cls, first: int, last: int, forge: str, after: Optional[Tuple[str, int]] = None
     ) -> Iterable["GitProjectModel"]:
         """Return projects of given forge"""
-        return (
-            sa_session()
-            .query(GitProjectModel)
-            .filter_by(instance_url=forge)
-            .order_by(GitProjectModel.namespace)
-            .slice(first, last)
+        query = sa_session().query(GitProjectModel).filter_by(instance_url=forge)
+        if after is not None:
+            query = query.filter(
+                tuple_(GitProjectModel.namespace, GitProjectModel.id) > tuple_(*after)
+            )
+        return query.order_by(GitProjectModel.namespace, GitProjectModel.id).slice(
+            first, last
         )
 
     @classmethod
@@ -448,11 +557,80 @@ class GitProjectModel(Base):
             .one_or_none()
         )
 
+    @classmethod
+    def get_summaries(
+        cls,
+        first: Optional[int] = None,
+        last: Optional[int] = None,
+        forge: Optional[str] = None,
+        namespace: Optional[str] = None,
+        repo_name: Optional[str] = None,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> List[GitProjectSummary]:
+        """
+        Return projects matching the given criteria together with the counts
+        of their PRs, branches, releases and issues.
+
+        The counts are computed by the database within the same query
+        instead of loading the whole related collections for each project.
+
+        Args:
+            first: Index of the first project to return (for pagination).
+            last: Index after the last project to return (for pagination).
+            forge: Hostname of the forge, e.g. `github.com`.
+            namespace: Namespace of the projects.
+            repo_name: Name of the repository.
+            after: Namespace and ID of the project the list should start after
+                (cursor of the keyset pagination), `first` and `last` are then
+                counted from it.
+
+        Returns:
+            List of project summaries ordered by the namespace.
+        """
+        counts = [
+            sa_session()
+            .query(func.count(model.id))
+            .filter(model.project_id == GitProjectModel.id)
+            .correlate(GitProjectModel)
+            .scalar_subquery()
+            for model in (
+                PullRequestModel,
+                GitBranchModel,
+                ProjectReleaseModel,
+                IssueModel,
+            )
+        ]
+        filters = {
+            "instance_url": forge,
+            "namespace": namespace,
+            "repo_name": repo_name,
+        }
+        query = (
+            sa_session()
+            .query(GitProjectModel, *counts)
+            .filter_by(**{column: value for column, value in filters.items() if value})
+            .order_by(GitProjectModel.namespace, GitProjectModel.id)
+        )
+        if after is not None:
+            query = query.filter(
+                tuple_(GitProjectModel.namespace, GitProjectModel.id) > tuple_(*after)
+            )
+        if first is not None and last is not None:
+            query = query.slice(first, last)
+
+        return [GitProjectSummary(*row) for row in query]
+
     @classmethod
     def get_project_prs(
-        cls, first: int, last: int, forge: str, namespace: str, repo_name: str
+        cls,
+        first: int,
+        last: int,
+        forge: str,
+        namespace: str,
+        repo_name: str,
+        before: Optional[int] = None,
     ) -> Iterable["PullRequestModel"]:
-        return (
+        query = (
             sa_session()
             .query(PullRequestModel)
             .join(PullRequestModel.project)
@@ -461,9 +639,10 @@ class GitProjectModel(Base):
                 GitProjectModel.namespace == namespace,
                 GitProjectModel.repo_name == repo_name,
             )
-            .order_by(desc(PullRequestModel.pr_id))
-            .slice(first, last)
         )
+        if before is not None:
+            query = query.filter(PullRequestModel.pr_id < before)
+        return query.order_by(desc(PullRequestModel.pr_id)).slice(first, last)
 
     @classmethod
     def get_project_issues(
@@ -735,6 +914,8 @@ class JobTriggerModel(Base):
 
     runs = relationship("PipelineModel", back_populates="job_trigger")
 
+    __table_args__ = (Index("ix_job_triggers_type_trigger_id", type, trigger_id),)
+
     @classmethod
     def get_or_create(
         cls, type: JobTriggerModelType, trigger_id: int
@@ -764,6 +945,47 @@ class JobTriggerModel(Base):
             .first()
         )
 
+    @classmethod
+    def get_trigger_objects(
+        cls, job_triggers: Iterable["JobTriggerModel"]
+    ) -> Dict[int, AbstractTriggerDbType]:
+        """
+        Loads trigger objects (with their projects) for multiple job triggers
+        using one query per trigger type instead of one query per job trigger.
+
+        Args:
+            job_triggers: Job triggers to load the trigger objects for.
+
+        Returns:
+            Dictionary mapping IDs of the job triggers to their trigger objects.
+        """
+        job_triggers = list(job_triggers)
+        trigger_ids_per_type: Dict[JobTriggerModelType, Set[int]] = {}
+        for job_trigger in job_triggers:
+            trigger_ids_per_type.setdefault(job_trigger.type, set()).add(
+                job_trigger.trigger_id
+            )
+
+        trigger_objects: Dict[
+            Tuple[JobTriggerModelType, int], AbstractTriggerDbType
+        ] = {}
+        for type_, trigger_ids in trigger_ids_per_type.items():
+            model = MODEL_FOR_TRIGGER[type_]
+            for trigger_object in (
+                sa_session()
+                .query(model)
+                .filter(model.id.in_(trigger_ids))
+                .options(joinedload(model.project))
+            ):
+                trigger_objects[(type_, trigger_object.id)] = trigger_object
+
+        return {
+            job_trigger.id: trigger_objects.get(
+                (job_trigger.type, job_trigger.trigger_id)
+            )
+            for job_trigger in job_triggers
+        }
+
     def __repr__(self):
         return f"JobTriggerModel(type={self.type}, trigger_id={self.trigger_id})"
 
@@ -843,25 +1065,55 @@ class PipelineModel(Base):
         )
 
     @classmethod
-    def get_merged_chroots(cls, first: int, last: int) -> Iterable["PipelineModel"]:
-        return (
-            cls.__query_merged_runs()
-            .group_by(
-                PipelineModel.srpm_build_id,
-                case(
-                    [(PipelineModel.srpm_build_id.isnot(null()), 0)],
-                    else_=PipelineModel.id,
-                ),
+    def get_merged_chroots(
+        cls, first: int, last: int, before: Optional[int] = None
+    ) -> Iterable["PipelineModel"]:
+        """
+        Return the runs merged by their SRPM builds.
+
+        The runs on the page are picked by their first pipelines before merging,
+        so that only the pipelines of those runs are aggregated.
+
+        The API lists the maintained summaries instead (see `MergedRunModel`),
+        this aggregation is kept as the reference the summaries are checked
+        against in the tests.
+
+        Args:
+            first: Index of the first merged run to return.
+            last: Index after the last merged run to return.
+            before: Return only the merged runs with `merged_id` lower than this
+                (cursor of the keyset pagination), `first` and `last` are then
+                counted from it.
+
+        Returns:
+            Merged runs ordered by `merged_id` descending.
+        """
+        earlier_pipeline = aliased(PipelineModel)
+        page = (
+            sa_session()
+            .query(PipelineModel.id, PipelineModel.srpm_build_id)
+            .filter(
+                ~exists().where(
+                    and_(
+                        earlier_pipeline.srpm_build_id == PipelineModel.srpm_build_id,
+                        earlier_pipeline.id < PipelineModel.id,
+                    )
+                )
             )
-            .order_by(desc("merged_id"))
-            .slice(first, last)
         )
+        if before is not None:
+            page = page.filter(PipelineModel.id < before)
+        page = page.order_by(desc(PipelineModel.id)).slice(first, last).subquery()
 
-    @classmethod
-    def get_merged_run(cls, first_id: int) -> Optional[Iterable["PipelineModel"]]:
         return (
             cls.__query_merged_runs()
-            .filter(PipelineModel.id >= first_id, PipelineModel.id <= first_id + 100)
+            .filter(
+                or_(
+                    PipelineModel.srpm_build_id.in_(select(page.c.srpm_build_id)),
+                    # pipelines without SRPM builds are not merged
+                    PipelineModel.id.in_(select(page.c.id)),
+                )
+            )
             .group_by(
                 PipelineModel.srpm_build_id,
                 case(
@@ -869,7 +1121,7 @@ class PipelineModel(Base):
                     else_=PipelineModel.id,
                 ),
             )
-            .first()
+            .order_by(desc("merged_id"))
         )
 
     @classmethod
@@ -877,6 +1129,168 @@ class PipelineModel(Base):
         return sa_session().query(PipelineModel).filter_by(id=id_).first()
 
 
+class MergedRunModel(Base):
+    """
+    Summary of the pipelines merged by their SRPM build (one run in the API).
+
+    Maintained incrementally whenever a pipeline is created or gets a build/test
+    (see `refresh`), so that the runs don't have to be merged by aggregating
+    the pipelines on every request. The pipelines without an SRPM build are not
+    merged, each of them has its own summary.
+
+    The statuses and the trigger info are not copied here,
+    they are loaded in bulk from the referenced models.
+    """
+
+    __tablename__ = "merged_runs"
+    # ID of the first pipeline of the run
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    datetime = Column(DateTime)
+    job_trigger_id = Column(Integer, ForeignKey("job_triggers.id"))
+    srpm_build_id = Column(Integer, ForeignKey("srpm_builds.id"), unique=True)
+    copr_build_ids = Column(ARRAY(Integer), nullable=False, server_default="{}")
+    koji_build_ids = Column(ARRAY(Integer), nullable=False, server_default="{}")
+    test_run_ids = Column(ARRAY(Integer), nullable=False, server_default="{}")
+    propose_downstream_run_ids = Column(
+        ARRAY(Integer), nullable=False, server_default="{}"
+    )
+
+    @staticmethod
+    def _aggregated_columns() -> list:
+        """Columns of the summary aggregated over the pipelines of a run."""
+
+        def ids(column):
+            return func.array_remove(func.array_agg(distinct(column)), null())
+
+        return [
+            func.min(PipelineModel.id).label("id"),
+            func.min(PipelineModel.datetime).label("datetime"),
+            func.min(PipelineModel.job_trigger_id).label("job_trigger_id"),
+            PipelineModel.srpm_build_id,
+            ids(PipelineModel.copr_build_id).label("copr_build_ids"),
+            ids(PipelineModel.koji_build_id).label("koji_build_ids"),
+            ids(PipelineModel.test_run_id).label("test_run_ids"),
+            ids(PipelineModel.propose_downstream_run_id).label(
+                "propose_downstream_run_ids"
+            ),
+        ]
+
+    @classmethod
+    def refresh(cls, session: SQLASession, pipeline: PipelineModel) -> None:
+        """
+        Update the summary of the run the pipeline belongs to.
+
+        The summary is locked while the pipelines of the run are aggregated,
+        so that the concurrent updates of the same run are serialized
+        and the last one sees all the pipelines.
+
+        Args:
+            session: Session of the transaction that changed the pipeline.
+            pipeline: Created or changed pipeline.
+        """
+        session.flush()
+        if pipeline.srpm_build_id is None:
+            pipelines = PipelineModel.id == pipeline.id
+            summary = cls.id == pipeline.id
+        else:
+            pipelines = PipelineModel.srpm_build_id == pipeline.srpm_build_id
+            summary = cls.srpm_build_id == pipeline.srpm_build_id
+
+        session.execute(
+            psql_insert(cls)
+            .values(id=pipeline.id, srpm_build_id=pipeline.srpm_build_id)
+            .on_conflict_do_nothing()
+        )
+        merged_run = (
+            session.query(cls)
+            .filter(summary)
+            .with_for_update()
+            .populate_existing()
+            .one()
+        )
+        aggregated = (
+            session.query(*cls._aggregated_columns())
+            .filter(pipelines)
+            .group_by(PipelineModel.srpm_build_id)
+            .one()
+        )
+        for column, value in aggregated._asdict().items():
+            setattr(merged_run, column, value)
+        session.add(merged_run)
+
+    @classmethod
+    def backfill(cls, batch_size: int = 1000) -> int:
+        """
+        Create the missing summaries of the existing pipelines.
+
+        The summaries of the runs are created from the pipelines in batches,
+        each batch in its own transaction. The runs that already have
+        a summary are skipped, since it's kept up to date by `refresh`.
+
+        Args:
+            batch_size: Number of SRPM builds (or pipelines without them)
+                to process in one batch.
+
+        Returns:
+            Number of the created summaries.
+        """
+        columns = [column.name for column in cls._aggregated_columns()]
+        created = 0
+        # the runs merged by their SRPM builds, then the pipelines without them
+        for key, condition in (
+            (PipelineModel.srpm_build_id, PipelineModel.srpm_build_id.isnot(None)),
+            (PipelineModel.id, PipelineModel.srpm_build_id.is_(None)),
+        ):
+            last_key = 0
+            while True:
+                with sa_session_transaction() as session:
+                    keys = (
+                        session.execute(
+                            select(key)
+                            .distinct()
+                            .where(condition, key > last_key)
+                            .order_by(key)
+                            .limit(batch_size)
+                        )
+                        .scalars()
+                        .all()
+                    )
+                    if not keys:
+                        break
+                    created += session.execute(
+                        psql_insert(cls)
+                        .from_select(
+                            columns,
+                            select(*cls._aggregated_columns())
+                            .where(condition, key > last_key, key <= keys[-1])
+                            .group_by(key),
+                        )
+                        .on_conflict_do_nothing()
+                    ).rowcount
+                last_key = keys[-1]
+                logger.debug(f"Merged runs backfilled up to {key.name} {last_key}.")
+        return created
+
+    @classmethod
+    def get_range(
+        cls, first: int, last: int, before: Optional[int] = None
+    ) -> Iterable["MergedRunModel"]:
+        query = sa_session().query(MergedRunModel)
+        if before is not None:
+            query = query.filter(MergedRunModel.id < before)
+        return query.order_by(desc(MergedRunModel.id)).slice(first, last)
+
+    @classmethod
+    def get_by_id(cls, id_: int) -> Optional["MergedRunModel"]:
+        return sa_session().query(MergedRunModel).filter_by(id=id_).first()
+
+    def __repr__(self):
+        return (
+            f"MergedRunModel(id={self.id}, srpm_build_id={self.srpm_build_id}, "
+            f"copr_build_ids={self.copr_build_ids})"
+        )
+
+
 class BuildStatus(str, enum.Enum):
     """An enum of all possible build statuses"""
 
@@ -936,30 +1350,36 @@ class CoprBuildTargetModel(ProjectAndTriggersConnector, Base):
 
     runs = relationship("PipelineModel", back_populates="copr_build")
 
+    __table_args__ = (
+        Index(
+            "ix_copr_build_targets_owner_project_name_commit_sha_target",
+            owner,
+            project_name,
+            commit_sha,
+            target,
+        ),
+        # babysitting looks only for the pending builds
+        Index(
+            "ix_copr_build_targets_status_pending",
+            status,
+            postgresql_where=status == BuildStatus.pending,
+        ),
+    )
+
     def set_built_packages(self, built_packages):
-        with sa_session_transaction() as session:
-            self.built_packages = built_packages
-            session.add(self)
+        self.update(built_packages=built_packages)
 
     def set_start_time(self, start_time: datetime):
-        with sa_session_transaction() as session:
-            self.build_start_time = start_time
-            session.add(self)
+        self.update(build_start_time=start_time)
 
     def set_end_time(self, end_time: datetime):
-        with sa_session_transaction() as session:
-            self.build_finished_time = end_time
-            session.add(self)
+        self.update(build_finished_time=end_time)
 
     def set_status(self, status: BuildStatus):
-        with sa_session_transaction() as session:
-            self.status = status
-            session.add(self)
+        self.update(status=status)
 
     def set_build_logs_url(self, build_logs: str):
-        with sa_session_transaction() as session:
-            self.build_logs_url = build_logs
-            session.add(self)
+        self.update(build_logs_url=build_logs)
 
     def get_srpm_build(self) -> Optional["SRPMBuildModel"]:
         # All SRPMBuild models for all the runs have to be same.
@@ -979,12 +1399,41 @@ class CoprBuildTargetModel(ProjectAndTriggersConnector, Base):
 
     @classmethod
     def get_merged_chroots(
-        cls, first: int, last: int
+        cls, first: int, last: int, before: Optional[int] = None
     ) -> Iterable["CoprBuildTargetModel"]:
         """Returns a list of unique build ids with merged status, chroots
         Details:
         https://github.com/packit/packit-service/pull/674#discussion_r439819852
+
+        The builds on the page are picked by their first targets before merging,
+        so that only the targets of those builds are aggregated.
+
+        Args:
+            first: Index of the first merged build to return.
+            last: Index after the last merged build to return.
+            before: Return only the merged builds with `new_id` lower than this
+                (cursor of the keyset pagination), `first` and `last` are then
+                counted from it.
         """
+        earlier_target = aliased(CoprBuildTargetModel)
+        page = (
+            sa_session()
+            .query(CoprBuildTargetModel.id, CoprBuildTargetModel.build_id)
+            .filter(
+                ~exists().where(
+                    and_(
+                        earlier_target.build_id == CoprBuildTargetModel.build_id,
+                        earlier_target.id < CoprBuildTargetModel.id,
+                    )
+                )
+            )
+        )
+        if before is not None:
+            page = page.filter(CoprBuildTargetModel.id < before)
+        page = (
+            page.order_by(desc(CoprBuildTargetModel.id)).slice(first, last).subquery()
+        )
+
         return (
             sa_session()
             .query(
@@ -1004,9 +1453,15 @@ class CoprBuildTargetModel(ProjectAndTriggersConnector, Base):
                     "packit_id_per_chroot"
                 ),
             )
+            .filter(
+                or_(
+                    CoprBuildTargetModel.build_id.in_(select(page.c.build_id)),
+                    # targets without the Copr build ID are not merged
+                    CoprBuildTargetModel.id.in_(select(page.c.id)),
+                )
+            )
             .group_by(CoprBuildTargetModel.build_id)  # Group by identical element(s)
             .order_by(desc("new_id"))
-            .slice(first, last)
         )
 
     # Returns all builds with that build_id, irrespective of target
@@ -1024,6 +1479,33 @@ class CoprBuildTargetModel(ProjectAndTriggersConnector, Base):
         """Returns all builds which currently have the given status."""
         return sa_session().query(CoprBuildTargetModel).filter_by(status=status)
 
+    @classmethod
+    def mark_timed_out_as_error(cls, timeout: timedelta) -> List[int]:
+        """
+        Sets the status of all the builds pending for longer than the timeout
+        to error using a single statement.
+
+        Args:
+            timeout: How long can a build be pending since its submission.
+
+        Returns:
+            IDs of the builds which have timed out.
+        """
+        # build_submitted_time is a naive UTC datetime
+        submitted_before = datetime.utcnow() - timeout
+        with sa_session_transaction() as session:
+            result = session.execute(
+                update(cls)
+                .where(
+                    cls.status == BuildStatus.pending,
+                    cls.build_submitted_time < submitted_before,
+                )
+                .values(status=BuildStatus.error)
+                .returning(cls.id)
+                .execution_options(synchronize_session=False)
+            )
+            return [id_ for (id_,) in result]
+
     # returns the build matching the build_id and the target
     @classmethod
     def get_by_build_id(
@@ -1101,9 +1583,11 @@ class CoprBuildTargetModel(ProjectAndTriggersConnector, Base):
                 new_run_model.srpm_build = run_model.srpm_build
                 new_run_model.copr_build = build
                 session.add(new_run_model)
+                MergedRunModel.refresh(session, new_run_model)
             else:
                 run_model.copr_build = build
                 session.add(run_model)
+                MergedRunModel.refresh(session, run_model)
 
             return build
 
@@ -1152,39 +1636,25 @@ class KojiBuildTargetModel(ProjectAndTriggersConnector, Base):
     runs = relationship("PipelineModel", back_populates="koji_build")
 
     def set_status(self, status: str):
-        with sa_session_transaction() as session:
-            self.status = status
-            session.add(self)
+        self.update(status=status)
 
     def set_build_logs_url(self, build_logs: str):
-        with sa_session_transaction() as session:
-            self.build_logs_url = build_logs
-            session.add(self)
+        self.update(build_logs_url=build_logs)
 
     def set_web_url(self, web_url: str):
-        with sa_session_transaction() as session:
-            self.web_url = web_url
-            session.add(self)
+        self.update(web_url=web_url)
 
     def set_build_start_time(self, build_start_time: Optional[DateTime]):
-        with sa_session_transaction() as session:
-            self.build_start_time = build_start_time
-            session.add(self)
+        self.update(build_start_time=build_start_time)
 
     def set_build_finished_time(self, build_finished_time: Optional[DateTime]):
-        with sa_session_transaction() as session:
-            self.build_finished_time = build_finished_time
-            session.add(self)
+        self.update(build_finished_time=build_finished_time)
 
     def set_build_submitted_time(self, build_submitted_time: Optional[DateTime]):
-        with sa_session_transaction() as session:
-            self.build_submitted_time = build_submitted_time
-            session.add(self)
+        self.update(build_submitted_time=build_submitted_time)
 
     def set_scratch(self, value: bool):
-        with sa_session_transaction() as session:
-            self.scratch = value
-            session.add(self)
+        self.update(scratch=value)
 
     def get_srpm_build(self) -> Optional["SRPMBuildModel"]:
         # All SRPMBuild models for all the runs have to be same.
@@ -1199,14 +1669,63 @@ class KojiBuildTargetModel(ProjectAndTriggersConnector, Base):
         return sa_session().query(KojiBuildTargetModel)
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["KojiBuildTargetModel"]:
+    def get_range(
+        cls, first: int, last: int, before: Optional[int] = None
+    ) -> Iterable["KojiBuildTargetModel"]:
+        query = sa_session().query(KojiBuildTargetModel)
+        if before is not None:
+            query = query.filter(KojiBuildTargetModel.id < before)
+        return query.order_by(desc(KojiBuildTargetModel.id)).slice(first, last)
+
+    @classmethod
+    def get_all_by_status(cls, *status: str) -> Iterable["KojiBuildTargetModel"]:
+        """Returns all builds which currently have their status set to one
+        of the requested statuses."""
         return (
             sa_session()
             .query(KojiBuildTargetModel)
-            .order_by(desc(KojiBuildTargetModel.id))
-            .slice(first, last)
+            .filter(KojiBuildTargetModel.status.in_(status))
         )
 
+    @classmethod
+    def mark_timed_out_as_error(cls, timeout: timedelta, *status: str) -> List[int]:
+        """
+        Sets the status of all the builds in one of the given statuses submitted
+        more than the timeout ago to error using a single statement.
+
+        Args:
+            timeout: How long can a build take since its submission.
+            *status: Statuses of the builds which have not finished yet.
+
+        Returns:
+            IDs of the builds which have timed out.
+        """
+        # build_submitted_time is a naive UTC datetime
+        submitted_before = datetime.utcnow() - timeout
+        with sa_session_transaction() as session:
+            result = session.execute(
+                update(cls)
+                .where(
+                    cls.status.in_(status),
+                    cls.build_submitted_time < submitted_before,
+                )
+                .values(status=BuildStatus.error)
+                .returning(cls.id)
+                .execution_options(synchronize_session=False)
+            )
+            return [id_ for (id_,) in result]
+
+    @classmethod
+    def set_status_of_builds(cls, ids: Iterable[int], status: str) -> None:
+        """Sets the status of the builds with the given IDs using a single statement."""
+        with sa_session_transaction() as session:
+            session.execute(
+                update(cls)
+                .where(cls.id.in_(list(ids)))
+                .values(status=status)
+                .execution_options(synchronize_session=False)
+            )
+
     @classmethod
     def get_all_by_build_id(
         cls, build_id: Union[str, int]
@@ -1248,30 +1767,70 @@ class KojiBuildTargetModel(ProjectAndTriggersConnector, Base):
         scratch: bool,
         run_model: "PipelineModel",
     ) -> "KojiBuildTargetModel":
+        return cls.create_for_targets(
+            builds=[(target, build_id, web_url)],
+            commit_sha=commit_sha,
+            status=status,
+            scratch=scratch,
+            run_model=run_model,
+        )[0]
+
+    @classmethod
+    def create_for_targets(
+        cls,
+        builds: Iterable[Tuple[str, str, Optional[str]]],
+        commit_sha: str,
+        status: str,
+        scratch: bool,
+        run_model: "PipelineModel",
+    ) -> List["KojiBuildTargetModel"]:
+        """
+        Create the builds submitted for multiple targets in one transaction.
+
+        The first build is added to the given pipeline (unless it already has
+        a Koji build), each of the others to a clone of it.
+
+        Args:
+            builds: Target, Koji task ID and web URL of each build.
+            commit_sha: Commit the builds were submitted for.
+            status: Initial status of the builds.
+            scratch: Whether the builds are scratch builds.
+            run_model: Pipeline of the builds.
+
+        Returns:
+            The created builds in the given order.
+        """
         with sa_session_transaction() as session:
-            build = cls()
-            build.build_id = build_id
-            build.status = status
-            build.commit_sha = commit_sha
-            build.web_url = web_url
-            build.target = target
-            build.scratch = scratch
-            session.add(build)
+            created, pipelines = [], []
+            for target, build_id, web_url in builds:
+                build = cls()
+                build.build_id = build_id
+                build.status = status
+                build.commit_sha = commit_sha
+                build.web_url = web_url
+                build.target = target
+                build.scratch = scratch
+                session.add(build)
+                created.append(build)
+
+                if run_model.koji_build:
+                    # Clone run model
+                    pipeline = PipelineModel()
+                    pipeline.job_trigger = run_model.job_trigger
+                    pipeline.srpm_build = run_model.srpm_build
+                else:
+                    pipeline = run_model
+                pipeline.koji_build = build
+                session.add(pipeline)
+                pipelines.append(pipeline)
 
-            if run_model.koji_build:
-                # Clone run model
-                new_run_model = PipelineModel.create(
-                    type=run_model.job_trigger.type,
-                    trigger_id=run_model.job_trigger.trigger_id,
-                )
-                new_run_model.srpm_build = run_model.srpm_build
-                new_run_model.koji_build = build
-                session.add(new_run_model)
-            else:
-                run_model.koji_build = build
-                session.add(run_model)
+            # the pipelines of the same SRPM build share one summary
+            for pipeline in (
+                pipelines if run_model.srpm_build is None else pipelines[-1:]
+            ):
+                MergedRunModel.refresh(session, pipeline)
 
-            return build
+            return created
 
     @classmethod
     def get(
@@ -1292,8 +1851,6 @@ class SRPMBuildModel(ProjectAndTriggersConnector, Base):
     __tablename__ = "srpm_builds"
     id = Column(Integer, primary_key=True)
     status = Column(Enum(BuildStatus))
-    # our logs we want to show to the user
-    logs = Column(Text)
     build_submitted_time = Column(DateTime, default=datetime.utcnow)
     build_start_time = Column(DateTime)
     build_finished_time = Column(DateTime)
@@ -1306,6 +1863,54 @@ class SRPMBuildModel(ProjectAndTriggersConnector, Base):
     copr_web_url = Column(Text)
 
     runs = relationship("PipelineModel", back_populates="srpm_build")
+    # our logs we want to show to the user, stored compressed in a separate
+    # table and loaded only when accessed
+    srpm_build_logs = relationship(
+        "SRPMBuildLogsModel",
+        uselist=False,
+        back_populates="srpm_build",
+        cascade="all, delete-orphan",
+    )
+
+    # old builds whose logs should be discarded
+    __table_args__ = (
+        Index("ix_srpm_builds_build_submitted_time", build_submitted_time),
+    )
+
+    @property
+    def logs(self) -> Optional[str]:
+        return self.srpm_build_logs.decompress() if self.srpm_build_logs else None
+
+    @logs.setter
+    def logs(self, logs: Optional[str]) -> None:
+        if logs is None:
+            self.srpm_build_logs = None
+        elif self.srpm_build_logs:
+            self.srpm_build_logs.compressed_logs = SRPMBuildLogsModel.compress(logs)
+        else:
+            self.srpm_build_logs = SRPMBuildLogsModel(
+                compressed_logs=SRPMBuildLogsModel.compress(logs)
+            )
+
+    def get_logs_chunks(self, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        """
+        Decompresses the logs gradually.
+
+        The compressed logs are loaded right away, the returned iterator
+        doesn't need the model (or its session) anymore, so it can be consumed
+        e.g. while sending the response after the session has ended.
+
+        Args:
+            chunk_size: Number of decompressed bytes decoded at once.
+
+        Returns:
+            Parts of the logs, nothing if there are no logs.
+        """
+        if not self.srpm_build_logs:
+            return iter(())
+        return SRPMBuildLogsModel.iter_decompressed(
+            self.srpm_build_logs.compressed_logs, chunk_size
+        )
 
     @classmethod
     def create_with_new_run(
@@ -1352,6 +1957,7 @@ class SRPMBuildModel(ProjectAndTriggersConnector, Base):
             )
             new_run_model.srpm_build = srpm_build
             session.add(new_run_model)
+            MergedRunModel.refresh(session, new_run_model)
 
             return srpm_build, new_run_model
 
@@ -1363,13 +1969,13 @@ class SRPMBuildModel(ProjectAndTriggersConnector, Base):
         return sa_session().query(SRPMBuildModel).filter_by(id=id_).first()
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["SRPMBuildModel"]:
-        return (
-            sa_session()
-            .query(SRPMBuildModel)
-            .order_by(desc(SRPMBuildModel.id))
-            .slice(first, last)
-        )
+    def get_range(
+        cls, first: int, last: int, before: Optional[int] = None
+    ) -> Iterable["SRPMBuildModel"]:
+        query = sa_session().query(SRPMBuildModel)
+        if before is not None:
+            query = query.filter(SRPMBuildModel.id < before)
+        return query.order_by(desc(SRPMBuildModel.id)).slice(first, last)
 
     @classmethod
     def get_by_copr_build_id(
@@ -1387,50 +1993,118 @@ class SRPMBuildModel(ProjectAndTriggersConnector, Base):
     @classmethod
     def get_older_than(cls, delta: timedelta) -> Iterable["SRPMBuildModel"]:
         """Return builds older than delta, whose logs/artifacts haven't been discarded yet."""
-        delta_ago = datetime.now(timezone.utc) - delta
+        # build_submitted_time is a naive UTC datetime, comparing it with an aware one
+        # would cast the column and prevent using the index
+        delta_ago = datetime.utcnow() - delta
         return (
             sa_session()
             .query(SRPMBuildModel)
-            .filter(
-                SRPMBuildModel.build_submitted_time < delta_ago,
-                SRPMBuildModel.logs.isnot(None),
+            .join(SRPMBuildModel.srpm_build_logs)
+            .filter(SRPMBuildModel.build_submitted_time < delta_ago)
+        )
+
+    @classmethod
+    def discard_logs(
+        cls, submitted_before: datetime, after_id: int, batch_size: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Discards the logs and the SRPM URLs of the next batch of builds
+        submitted before the given time, in a single transaction.
+
+        The logs are not loaded, only their stored size is.
+
+        Args:
+            submitted_before: Naive UTC datetime, the logs of builds submitted
+                before it are discarded.
+            after_id: Only builds with higher ID are discarded (keyset pagination).
+            batch_size: Maximal number of builds to discard the logs for.
+
+        Returns:
+            IDs of the builds with the numbers of bytes the logs occupied.
+        """
+        batch = (
+            select(SRPMBuildLogsModel.srpm_build_id)
+            .join(cls)
+            .where(
+                cls.build_submitted_time < submitted_before,
+                SRPMBuildLogsModel.srpm_build_id > after_id,
             )
+            .order_by(SRPMBuildLogsModel.srpm_build_id)
+            .limit(batch_size)
         )
+        with sa_session_transaction() as session:
+            discarded = [
+                (id_, size)
+                for id_, size in session.execute(
+                    delete(SRPMBuildLogsModel)
+                    .where(SRPMBuildLogsModel.srpm_build_id.in_(batch))
+                    .returning(
+                        SRPMBuildLogsModel.srpm_build_id,
+                        func.pg_column_size(SRPMBuildLogsModel.compressed_logs),
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            ]
+            if discarded:
+                session.execute(
+                    update(cls)
+                    .where(cls.id.in_([id_ for id_, _ in discarded]))
+                    .values(url=null())
+                    .execution_options(synchronize_session=False)
+                )
+            return sorted(discarded)
 
     def set_url(self, url: Optional[str]) -> None:
-        with sa_session_transaction() as session:
-            self.url = null() if url is None else url
-            session.add(self)
+        self.update(url=url)
 
     def set_logs(self, logs: Optional[str]) -> None:
-        with sa_session_transaction() as session:
-            self.logs = null() if logs is None else logs
-            session.add(self)
+        self.update(logs=logs)
 
     def set_start_time(self, start_time: datetime) -> None:
-        with sa_session_transaction() as session:
-            self.build_start_time = start_time
-            session.add(self)
+        self.update(build_start_time=start_time)
 
     def set_end_time(self, end_time: datetime) -> None:
-        with sa_session_transaction() as session:
-            self.build_finished_time = end_time
-            session.add(self)
+        self.update(build_finished_time=end_time)
 
     def set_build_logs_url(self, logs_url: str) -> None:
-        with sa_session_transaction() as session:
-            self.logs_url = logs_url
-            session.add(self)
+        self.update(logs_url=logs_url)
 
     def set_status(self, status: BuildStatus) -> None:
-        with sa_session_transaction() as session:
-            self.status = status
-            session.add(self)
+        self.update(status=status)
 
     def __repr__(self):
         return f"SRPMBuildModel(id={self.id}, build_submitted_time={self.build_submitted_time})"
 
 
+class SRPMBuildLogsModel(Base):
+    """Gzip-compressed logs of an SRPM build."""
+
+    __tablename__ = "srpm_build_logs"
+    srpm_build_id = Column(Integer, ForeignKey("srpm_builds.id"), primary_key=True)
+    compressed_logs = Column(LargeBinary, nullable=False)
+
+    srpm_build = relationship("SRPMBuildModel", back_populates="srpm_build_logs")
+
+    @staticmethod
+    def compress(logs: str) -> bytes:
+        return gzip.compress(logs.encode())
+
+    def decompress(self) -> str:
+        return gzip.decompress(self.compressed_logs).decode(errors="replace")
+
+    @staticmethod
+    def iter_decompressed(compressed_logs: bytes, chunk_size: int) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        with gzip.GzipFile(fileobj=BytesIO(compressed_logs)) as logs:
+            while chunk := logs.read(chunk_size):
+                yield decoder.decode(chunk)
+        if rest := decoder.decode(b"", final=True):
+            yield rest
+
+    def __repr__(self):
+        return f"SRPMBuildLogsModel(srpm_build_id={self.srpm_build_id})"
+
+
 class AllowlistStatus(str, enum.Enum):
     approved_automatically = ALLOWLIST_CONSTANTS["approved_automatically"]
     waiting = ALLOWLIST_CONSTANTS["waiting"]
@@ -1563,20 +2237,33 @@ class TFTTestRunTargetModel(ProjectAndTriggersConnector, Base):
 
     runs = relationship("PipelineModel", back_populates="test_run")
 
+    __table_args__ = (
+        Index("ix_tft_test_run_targets_commit_sha_target", commit_sha, target),
+        # babysitting looks only for the runs that are not completed
+        Index(
+            "ix_tft_test_run_targets_status_not_completed",
+            status,
+            postgresql_where=status.in_(
+                [
+                    TestingFarmResult.new,
+                    TestingFarmResult.queued,
+                    TestingFarmResult.running,
+                ]
+            ),
+        ),
+    )
+
     def set_status(self, status: TestingFarmResult, created: Optional[DateTime] = None):
         """
         set status of the TF run and optionally set the created datetime as well
         """
-        with sa_session_transaction() as session:
-            self.status = status
-            if created and not self.submitted_time:
-                self.submitted_time = created
-            session.add(self)
+        fields = {"status": status}
+        if created and not self.submitted_time:
+            fields["submitted_time"] = created
+        self.update(**fields)
 
     def set_web_url(self, web_url: str):
-        with sa_session_transaction() as session:
-            self.web_url = web_url
-            session.add(self)
+        self.update(web_url=web_url)
 
     @classmethod
     def create(
@@ -1612,9 +2299,11 @@ class TFTTestRunTargetModel(ProjectAndTriggersConnector, Base):
                     new_run_model.copr_build = run_model.copr_build
                     new_run_model.test_run = test_run
                     session.add(new_run_model)
+                    MergedRunModel.refresh(session, new_run_model)
                 else:
                     run_model.test_run = test_run
                     session.add(run_model)
+                    MergedRunModel.refresh(session, run_model)
 
             return test_run
 
@@ -1639,6 +2328,39 @@ class TFTTestRunTargetModel(ProjectAndTriggersConnector, Base):
             .filter(TFTTestRunTargetModel.status.in_(status))
         )
 
+    @classmethod
+    def mark_timed_out_as_error(cls, timeout: timedelta) -> List[int]:
+        """
+        Sets the status of all the not completed runs submitted more than
+        the timeout ago to error using a single statement.
+
+        Args:
+            timeout: How long can a run take since its submission.
+
+        Returns:
+            IDs of the runs which have timed out.
+        """
+        # submitted_time is a naive UTC datetime
+        submitted_before = datetime.utcnow() - timeout
+        with sa_session_transaction() as session:
+            result = session.execute(
+                update(cls)
+                .where(
+                    cls.status.in_(
+                        [
+                            TestingFarmResult.new,
+                            TestingFarmResult.queued,
+                            TestingFarmResult.running,
+                        ]
+                    ),
+                    cls.submitted_time < submitted_before,
+                )
+                .values(status=TestingFarmResult.error)
+                .returning(cls.id)
+                .execution_options(synchronize_session=False)
+            )
+            return [id_ for (id_,) in result]
+
     @classmethod
     def get_by_id(cls, id: int) -> Optional["TFTTestRunTargetModel"]:
         return sa_session().query(TFTTestRunTargetModel).filter_by(id=id).first()
@@ -1658,13 +2380,13 @@ class TFTTestRunTargetModel(ProjectAndTriggersConnector, Base):
         return sa_session().query(TFTTestRunTargetModel).filter_by(**non_none_args)
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["TFTTestRunTargetModel"]:
-        return (
-            sa_session()
-            .query(TFTTestRunTargetModel)
-            .order_by(desc(TFTTestRunTargetModel.id))
-            .slice(first, last)
-        )
+    def get_range(
+        cls, first: int, last: int, before: Optional[int] = None
+    ) -> Iterable["TFTTestRunTargetModel"]:
+        query = sa_session().query(TFTTestRunTargetModel)
+        if before is not None:
+            query = query.filter(TFTTestRunTargetModel.id < before)
+        return query.order_by(desc(TFTTestRunTargetModel.id)).slice(first, last)
 
     def __repr__(self):
         return f"TFTTestRunTargetModel(id={self.id}, pipeline_id={self.pipeline_id})"
@@ -1709,29 +2431,19 @@ class ProposeDownstreamTargetModel(ProjectAndTriggersConnector, Base):
             return propose_downstream_target
 
     def set_status(self, status: ProposeDownstreamTargetStatus) -> None:
-        with sa_session_transaction() as session:
-            self.status = status
-            session.add(self)
+        self.update(status=status)
 
     def set_downstream_pr_url(self, downstream_pr_url: str) -> None:
-        with sa_session_transaction() as session:
-            self.downstream_pr_url = downstream_pr_url
-            session.add(self)
+        self.update(downstream_pr_url=downstream_pr_url)
 
     def set_start_time(self, start_time: DateTime) -> None:
-        with sa_session_transaction() as session:
-            self.start_time = start_time
-            session.add(self)
+        self.update(start_time=start_time)
 
     def set_finished_time(self, finished_time: DateTime) -> None:
-        with sa_session_transaction() as session:
-            self.finished_time = finished_time
-            session.add(self)
+        self.update(finished_time=finished_time)
 
     def set_logs(self, logs: str) -> None:
-        with sa_session_transaction() as session:
-            self.logs = logs
-            session.add(self)
+        self.update(logs=logs)
 
     @classmethod
     def get_by_id(cls, id_: int) -> Optional["ProposeDownstreamTargetModel"]:
@@ -1795,30 +2507,37 @@ class ProposeDownstreamModel(ProjectAndTriggersConnector, Base):
             )
             pipeline.propose_downstream_run = propose_downstream
             session.add(pipeline)
+            MergedRunModel.refresh(session, pipeline)
 
             return propose_downstream, pipeline
 
     def set_status(self, status: ProposeDownstreamStatus) -> None:
-        with sa_session_transaction() as session:
-            self.status = status
-            session.add(self)
+        self.update(status=status)
 
     @classmethod
     def get_by_id(cls, id_: int) -> Optional["ProposeDownstreamModel"]:
         return sa_session().query(ProposeDownstreamModel).filter_by(id=id_).first()
 
+    @classmethod
+    def get_by_ids(cls, ids: Iterable[int]) -> Iterable["ProposeDownstreamModel"]:
+        return (
+            super()
+            .get_by_ids(ids)
+            .options(selectinload(ProposeDownstreamModel.propose_downstream_targets))
+        )
+
     @classmethod
     def get_all_by_status(cls, status: str) -> Iterable["ProposeDownstreamModel"]:
         return sa_session().query(ProposeDownstreamModel).filter_by(status=status)
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["ProposeDownstreamModel"]:
-        return (
-            sa_session()
-            .query(ProposeDownstreamModel)
-            .order_by(desc(ProposeDownstreamModel.id))
-            .slice(first, last)
-        )
+    def get_range(
+        cls, first: int, last: int, before: Optional[int] = None
+    ) -> Iterable["ProposeDownstreamModel"]:
+        query = sa_session().query(ProposeDownstreamModel)
+        if before is not None:
+            query = query.filter(ProposeDownstreamModel.id < before)
+        return query.order_by(desc(ProposeDownstreamModel.id)).slice(first, last)
 
 
 AbstractBuildTestDbType = Union[
@@ -1958,6 +2677,95 @@ class GithubInstallationModel(Base):
         return f"GithubInstallationModel(id={self.id}, account={self.account_login})"
 
 
+class PostedCommentModel(Base):
+    """
+    Hashes of the comments posted by Packit to a PR or a commit,
+    so we can check for duplicate comments without listing all of them.
+
+    The comments of a PR/commit are recorded only once we have listed
+    the existing comments from the forge (see `add_body_hashes`).
+    """
+
+    __tablename__ = "posted_comments"
+    id = Column(Integer, primary_key=True)
+    project_url = Column(String)
+    pr_id = Column(Integer)
+    commit_sha = Column(String)
+    body_hash = Column(String)
+    posted_time = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_posted_comments_target", project_url, pr_id, commit_sha),
+    )
+
+    @staticmethod
+    def hash_body(body: str) -> str:
+        return hashlib.sha256(body.encode()).hexdigest()
+
+    @classmethod
+    def get_body_hashes(
+        cls,
+        project_url: str,
+        pr_id: Optional[int] = None,
+        commit_sha: Optional[str] = None,
+    ) -> Optional[List[str]]:
+        """
+        Get hashes of the comments posted to the PR or commit.
+
+        Args:
+            project_url: URL of the project.
+            pr_id: ID of the PR, `None` for commit comments.
+            commit_sha: SHA of the commit, `None` for PR comments.
+
+        Returns:
+            Hashes from the oldest to the newest comment or `None`
+            if the comments of the PR/commit are not recorded.
+        """
+        rows = (
+            sa_session()
+            .query(cls.body_hash)
+            .filter_by(project_url=project_url, pr_id=pr_id, commit_sha=commit_sha)
+            .order_by(cls.id)
+            .all()
+        )
+        return [row.body_hash for row in rows] or None
+
+    @classmethod
+    def add_body_hashes(
+        cls,
+        project_url: str,
+        body_hashes: List[str],
+        pr_id: Optional[int] = None,
+        commit_sha: Optional[str] = None,
+        only_if_recorded: bool = False,
+    ) -> None:
+        """
+        Record hashes of the comments posted to the PR or commit.
+
+        Args:
+            project_url: URL of the project.
+            body_hashes: Hashes of the comments from the oldest to the newest.
+            pr_id: ID of the PR, `None` for commit comments.
+            commit_sha: SHA of the commit, `None` for PR comments.
+            only_if_recorded: Add the hashes only if the comments of the PR/commit
+                are already recorded, otherwise the record would be incomplete.
+        """
+        with sa_session_transaction() as session:
+            target = dict(project_url=project_url, pr_id=pr_id, commit_sha=commit_sha)
+            if (
+                only_if_recorded
+                and not session.query(cls.id).filter_by(**target).first()
+            ):
+                return
+            session.add_all([cls(body_hash=hash_, **target) for hash_ in body_hashes])
+
+    def __repr__(self):
+        return (
+            f"PostedCommentModel(id={self.id}, project_url={self.project_url}, "
+            f"pr_id={self.pr_id}, commit_sha={self.commit_sha})"
+        )
+
+
 class SourceGitPRDistGitPRModel(Base):
     __tablename__ = "source_git_pr_dist_git_pr"
     id = Column(Integer, primary_key=True)  # our database PK
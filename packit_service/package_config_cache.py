@@ -0,0 +1,200 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Cache of package configs for the commits of the projects.
+"""
+
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from os import getenv
+from typing import Optional, Tuple
+
+from packit.config import PackageConfig
+from packit_service.constants import (
+    PACKAGE_CONFIG_CACHE_SIZE,
+    PACKAGE_CONFIG_CACHE_TTL,
+)
+from packit_service.utils import dump_package_config, load_package_config
+from packit_service.worker.monitoring import pushgateway
+
+logger = logging.getLogger(__name__)
+
+COMMIT_SHA_REGEX = re.compile(r"[0-9a-f]{40}")
+
+
+class PackageConfigCache:
+    """
+    Cache of the package configs keyed by the project URL and commit SHA.
+
+    The content of the config file for a commit never changes so the entries
+    don't need to be invalidated. Only full commit SHAs are cached,
+    branches and tags can move.
+
+    There are two layers:
+    * in-process LRU cache,
+    * optional redis layer shared by all the workers (enabled by setting
+      the `PACKAGE_CONFIG_CACHE_REDIS` environment variable).
+
+    The package configs are stored serialized, so every caller gets
+    its own copy which it can modify.
+
+    The hits and misses are counted by the instance and in the metrics
+    of the worker.
+    """
+
+    def __init__(
+        self,
+        size: int = PACKAGE_CONFIG_CACHE_SIZE,
+        ttl: int = PACKAGE_CONFIG_CACHE_TTL,
+        use_redis: Optional[bool] = None,
+    ):
+        self.size = size
+        self.ttl = ttl
+        self.use_redis = (
+            bool(getenv("PACKAGE_CONFIG_CACHE_REDIS"))
+            if use_redis is None
+            else use_redis
+        )
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+
+    @staticmethod
+    def is_cacheable(project_url: Optional[str], commit_sha: Optional[str]) -> bool:
+        return bool(
+            project_url and commit_sha and COMMIT_SHA_REGEX.fullmatch(commit_sha)
+        )
+
+    @staticmethod
+    def _redis_key(project_url: str, commit_sha: str) -> str:
+        return f"package-config:{project_url}:{commit_sha}"
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            # import here so that the cache can be used without redis installed
+            from redis import Redis
+
+            from packit_service.celerizer import get_redis_url
+
+            self._redis = Redis.from_url(get_redis_url())
+        return self._redis
+
+    def get(
+        self, project_url: Optional[str], commit_sha: Optional[str]
+    ) -> Optional[PackageConfig]:
+        """
+        Get the package config from the cache.
+
+        Args:
+            project_url: URL of the project.
+            commit_sha: Commit SHA the config was obtained for.
+
+        Returns:
+            Copy of the cached package config or `None` if not cached.
+        """
+        if not self.is_cacheable(project_url, commit_sha):
+            return None
+
+        key = (project_url, commit_sha)
+        with self._lock:
+            raw_package_config = self._entries.get(key)
+            if raw_package_config is not None:
+                self._entries.move_to_end(key)
+
+        if raw_package_config is None and self.use_redis:
+            raw_package_config = self._get_from_redis(project_url, commit_sha)
+            if raw_package_config is not None:
+                self._store_locally(key, raw_package_config)
+
+        if raw_package_config is None:
+            self._count(hit=False)
+            logger.debug(f"Package config for {project_url}@{commit_sha} not cached.")
+            return None
+
+        self._count(hit=True)
+        logger.debug(f"Package config for {project_url}@{commit_sha} found in cache.")
+        return load_package_config(raw_package_config)
+
+    def set(
+        self,
+        project_url: Optional[str],
+        commit_sha: Optional[str],
+        package_config: PackageConfig,
+    ) -> None:
+        """
+        Store the package config in the cache.
+
+        Args:
+            project_url: URL of the project.
+            commit_sha: Commit SHA the config was obtained for.
+            package_config: Package config to store.
+        """
+        if not package_config or not self.is_cacheable(project_url, commit_sha):
+            return
+
+        try:
+            raw_package_config = dump_package_config(package_config)
+        except Exception as ex:
+            # caching is only an optimization, don't fail because of it
+            logger.debug(f"Package config can't be cached: {ex!r}")
+            return
+
+        self._store_locally((project_url, commit_sha), raw_package_config)
+        if self.use_redis:
+            self._store_to_redis(project_url, commit_sha, raw_package_config)
+
+    def clear(self) -> None:
+        """Clear the in-process layer and the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if hit:
+            pushgateway.package_config_cache_hits.inc()
+        else:
+            pushgateway.package_config_cache_misses.inc()
+
+    def _store_locally(self, key: Tuple[str, str], raw_package_config: dict) -> None:
+        with self._lock:
+            self._entries[key] = raw_package_config
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def _get_from_redis(self, project_url: str, commit_sha: str) -> Optional[dict]:
+        try:
+            value = self.redis.get(self._redis_key(project_url, commit_sha))
+        except Exception as ex:
+            logger.warning(f"Failed to get package config from redis: {ex!r}")
+            return None
+        return json.loads(value) if value else None
+
+    def _store_to_redis(
+        self, project_url: str, commit_sha: str, raw_package_config: dict
+    ) -> None:
+        try:
+            self.redis.setex(
+                self._redis_key(project_url, commit_sha),
+                self.ttl,
+                json.dumps(raw_package_config),
+            )
+        except Exception as ex:
+            logger.warning(f"Failed to store package config to redis: {ex!r}")
+
+
+package_config_cache = PackageConfigCache()
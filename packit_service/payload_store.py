@@ -0,0 +1,171 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Content-addressed store of the payloads shared by multiple Celery tasks.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from os import getenv
+from typing import Any, Optional, Tuple
+
+from packit.exceptions import PackitException
+from packit_service.constants import PAYLOAD_STORE_CACHE_SIZE, PAYLOAD_STORE_TTL
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_KEY = "payload_ref"
+
+
+class PayloadNotFoundException(PackitException):
+    """The referenced payload is not in the store (anymore)."""
+
+
+class PayloadStoreUnavailableException(PackitException):
+    """The store can't be reached (temporarily), the payload may still be there."""
+
+
+class PayloadStore:
+    """
+    Store of the payloads (events, package configs) of the Celery tasks.
+
+    One event usually results in multiple tasks (one per job) with the same event
+    and package config. Instead of putting a copy of them into every task
+    message, they are stored to redis once (keyed by the hash of their content)
+    and the messages carry only references to them.
+
+    Enabled by setting the `PAYLOAD_STORE_REDIS` environment variable,
+    otherwise the payloads are passed in the messages as they are.
+    The references are resolved transparently in the handler tasks
+    (see HandlerTaskWithRetry), the resolved payloads are cached in-process.
+    """
+
+    def __init__(
+        self,
+        size: int = PAYLOAD_STORE_CACHE_SIZE,
+        ttl: int = PAYLOAD_STORE_TTL,
+        use_redis: Optional[bool] = None,
+    ):
+        self.size = size
+        self.ttl = ttl
+        self.use_redis = (
+            bool(getenv("PAYLOAD_STORE_REDIS")) if use_redis is None else use_redis
+        )
+
+        # key -> (serialized payload, when it was stored to redis by this process)
+        self._entries: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            # import here so that the store can be used without redis installed
+            from redis import Redis
+
+            from packit_service.celerizer import get_redis_url
+
+            self._redis = Redis.from_url(get_redis_url())
+        return self._redis
+
+    @staticmethod
+    def is_reference(value: Any) -> bool:
+        return isinstance(value, dict) and value.keys() == {REFERENCE_KEY}
+
+    def reference(self, payload: Optional[dict]) -> Optional[dict]:
+        """
+        Store the payload and get a reference to it.
+
+        Args:
+            payload: JSON serializable payload of a task.
+
+        Returns:
+            Reference to be put into the task message instead of the payload,
+            the payload itself if the store is disabled or fails.
+        """
+        if not (payload and self.use_redis):
+            return payload
+
+        serialized = json.dumps(payload, sort_keys=True)
+        key = f"payload:{hashlib.sha256(serialized.encode()).hexdigest()}"
+
+        with self._lock:
+            _, stored_at = self._entries.get(key, (None, None))
+        # the same payload is referenced by all the tasks of an event,
+        # store it again only if it could have expired in the meantime
+        if stored_at is None or time.monotonic() - stored_at > self.ttl / 2:
+            try:
+                self.redis.setex(key, self.ttl, serialized)
+            except Exception as ex:
+                logger.warning(f"Failed to store payload to redis: {ex!r}")
+                return payload
+            stored_at = time.monotonic()
+
+        self._store_locally(key, serialized, stored_at)
+        return {REFERENCE_KEY: key}
+
+    def resolve(self, value: Any) -> Any:
+        """
+        Get the payload if the value is a reference to it.
+
+        Args:
+            value: Argument of a task.
+
+        Returns:
+            The referenced payload (every caller gets its own copy)
+            or the value itself if it is not a reference.
+
+        Raises:
+            PayloadNotFoundException: If the payload is not stored anymore.
+            PayloadStoreUnavailableException: If redis can't be reached.
+        """
+        if not self.is_reference(value):
+            return value
+
+        key = value[REFERENCE_KEY]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            serialized, _ = entry
+        else:
+            # import here so that the store can be used without redis installed
+            from redis.exceptions import ConnectionError, TimeoutError
+
+            try:
+                serialized = self.redis.get(key)
+            except (ConnectionError, TimeoutError) as ex:
+                raise PayloadStoreUnavailableException(
+                    f"Failed to get payload {key} from redis: {ex!r}"
+                ) from ex
+            if serialized is None:
+                raise PayloadNotFoundException(
+                    f"Payload {key} not found, it has probably expired."
+                )
+            self._store_locally(key, serialized, None)
+
+        return json.loads(serialized)
+
+    def clear(self) -> None:
+        """Clear the in-process cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def _store_locally(
+        self, key: str, serialized: str, stored_at: Optional[float]
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (serialized, stored_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+payload_store = PayloadStore()
@@ -78,11 +78,13 @@ class ServiceConfigSchema(UserConfigSchema):
     dashboard_url = fields.String()
     koji_logs_url = fields.String()
     koji_web_url = fields.String()
+    koji_hub_url = fields.String()
     enabled_projects_for_srpm_in_copr = fields.List(fields.String())
     comment_command_prefix = fields.String()
     allowed_forge_projects_for_copr_project = fields.Dict(
         keys=fields.String(), values=fields.List(fields.String())
     )
+    propose_downstream_concurrency = fields.Integer()
 
     @post_load
     def make_instance(self, data, **kwargs):
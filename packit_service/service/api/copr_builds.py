@@ -7,8 +7,12 @@ from logging import getLogger
 from flask_restx import Namespace, Resource
 
 from packit_service.models import CoprBuildTargetModel, optional_timestamp, BuildStatus
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import cursor, indices, pagination_arguments
+from packit_service.service.api.utils import (
+    add_pagination_headers,
+    get_project_info_from_build,
+    response_maker,
+)
 
 logger = getLogger("packit_service")
 
@@ -28,7 +32,10 @@ class CoprBuildsList(Resource):
         result = []
 
         first, last = indices()
-        for build in CoprBuildTargetModel.get_merged_chroots(first, last):
+        builds = list(
+            CoprBuildTargetModel.get_merged_chroots(first, last, before=cursor())
+        )
+        for build in builds:
             build_info = CoprBuildTargetModel.get_by_build_id(build.build_id, None)
             if build_info.status == BuildStatus.waiting_for_srpm:
                 continue
@@ -64,8 +71,10 @@ class CoprBuildsList(Resource):
             result,
             status=HTTPStatus.PARTIAL_CONTENT,
         )
-        resp.headers["Content-Range"] = f"copr-builds {first + 1}-{last}/*"
-        return resp
+        # the builds waiting for SRPM are skipped, but they count for the cursor
+        return add_pagination_headers(
+            resp, "copr-builds", first, last, [[build.new_id] for build in builds]
+        )
 
 
 @ns.route("/<int:id>")
@@ -7,8 +7,12 @@ from logging import getLogger
 from flask_restx import Namespace, Resource
 
 from packit_service.models import KojiBuildTargetModel, optional_timestamp
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import cursor, indices, pagination_arguments
+from packit_service.service.api.utils import (
+    add_pagination_headers,
+    get_project_info_from_build,
+    response_maker,
+)
 
 logger = getLogger("packit_service")
 
@@ -25,7 +29,8 @@ class KojiBuildsList(Resource):
         first, last = indices()
         result = []
 
-        for build in KojiBuildTargetModel.get_range(first, last):
+        builds = list(KojiBuildTargetModel.get_range(first, last, before=cursor()))
+        for build in builds:
             build_dict = {
                 "packit_id": build.id,
                 "build_id": build.build_id,
@@ -51,8 +56,9 @@ class KojiBuildsList(Resource):
             result,
             status=HTTPStatus.PARTIAL_CONTENT,
         )
-        resp.headers["Content-Range"] = f"koji-builds {first + 1}-{last}/*"
-        return resp
+        return add_pagination_headers(
+            resp, "koji-builds", first, last, [[build.id] for build in builds]
+        )
 
 
 @koji_builds_ns.route("/<int:id>")
@@ -1,13 +1,38 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, List, Optional, Tuple, Union
+
 from flask import request
 
-from flask_restx import reqparse
+from flask_restx import abort, reqparse
 
 DEFAULT_PAGE = 1
 DEFAULT_PER_PAGE = 10
 
+
+def encode_cursor(keys: List[Any]) -> str:
+    """Encode the pagination keys of the last entry on a page into an opaque cursor"""
+    return urlsafe_b64encode(json.dumps(keys).encode()).decode()
+
+
+def decode_cursor(value: str) -> List[Any]:
+    """Decode the cursor created by encode_cursor, raise ValueError if it is invalid"""
+    try:
+        keys = json.loads(urlsafe_b64decode(value.encode()))
+    except (ValueError, TypeError) as ex:
+        raise ValueError("Invalid cursor") from ex
+    if not (
+        isinstance(keys, list)
+        and keys
+        and all(isinstance(key, (int, str)) for key in keys)
+    ):
+        raise ValueError("Invalid cursor")
+    return keys
+
+
 pagination_arguments = reqparse.RequestParser()
 pagination_arguments.add_argument(
     "page", type=int, required=False, default=1, help="Page number"
@@ -20,15 +45,53 @@ pagination_arguments.add_argument(
     default=DEFAULT_PER_PAGE,
     help="Results per page",
 )
+pagination_arguments.add_argument(
+    "cursor",
+    type=decode_cursor,
+    required=False,
+    help="Cursor from the X-Next-Cursor header of the previous page, "
+    "the page number is ignored if given",
+)
 
 
 def indices():
-    """Return indices of first and last entry based on request arguments"""
+    """Return indices of first and last entry based on request arguments
+
+    In the cursor mode, the indices are relative to the cursor.
+    """
     args = pagination_arguments.parse_args(request)
+    per_page = args.get("per_page", DEFAULT_PER_PAGE)
+    if args.get("cursor") is not None:
+        return 0, per_page
     page = args.get("page", DEFAULT_PAGE)
     if page < DEFAULT_PAGE:
         page = DEFAULT_PAGE
-    per_page = args.get("per_page", DEFAULT_PER_PAGE)
     first = (page - 1) * per_page
     last = page * per_page
     return first, last
+
+
+def cursor(*types: type) -> Optional[Union[Any, Tuple[Any, ...]]]:
+    """Return the pagination key(s) from the cursor request argument
+
+    Aborts with 400 if the cursor doesn't hold keys of the expected types.
+
+    Args:
+        types: Types of the keys the list is paginated by, defaults to
+            a single integer key.
+
+    Returns:
+        The key if the list is paginated by a single key, tuple of the keys
+        otherwise, None if no cursor was given.
+    """
+    types = types or (int,)
+    keys = pagination_arguments.parse_args(request).get("cursor")
+    if keys is None:
+        return None
+    if len(keys) != len(types) or not all(
+        # bool is a subclass of int, but it's not a valid key
+        isinstance(key, type_) and not isinstance(key, bool)
+        for key, type_ in zip(keys, types)
+    ):
+        abort(400, "Invalid cursor")
+    return keys[0] if len(types) == 1 else tuple(keys)
@@ -3,12 +3,13 @@
 
 from http import HTTPStatus
 from logging import getLogger
+from typing import List
 
 from flask_restx import Namespace, Resource
 
-from packit_service.models import GitProjectModel
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import response_maker
+from packit_service.models import GitProjectModel, GitProjectSummary
+from packit_service.service.api.parsers import cursor, indices, pagination_arguments
+from packit_service.service.api.utils import add_pagination_headers, response_maker
 from packit_service.service.urls import get_srpm_build_info_url
 
 logger = getLogger("packit_service")
@@ -18,6 +19,23 @@ ns = Namespace(
 )
 
 
+def get_project_info(summary: GitProjectSummary) -> dict:
+    return {
+        "namespace": summary.project.namespace,
+        "repo_name": summary.project.repo_name,
+        "project_url": summary.project.project_url,
+        "prs_handled": summary.prs_handled,
+        "branches_handled": summary.branches_handled,
+        "releases_handled": summary.releases_handled,
+        "issues_handled": summary.issues_handled,
+    }
+
+
+def get_pagination_keys(summaries: List[GitProjectSummary]) -> List[list]:
+    # the projects are ordered by the namespace, the ID makes the order unique
+    return [[summary.project.namespace, summary.project.id] for summary in summaries]
+
+
 @ns.route("")
 class ProjectsList(Resource):
     @ns.expect(pagination_arguments)
@@ -26,27 +44,17 @@ class ProjectsList(Resource):
     def get(self):
         """List all GitProjects"""
 
-        result = []
         first, last = indices()
-
-        for project in GitProjectModel.get_range(first, last):
-            project_info = {
-                "namespace": project.namespace,
-                "repo_name": project.repo_name,
-                "project_url": project.project_url,
-                "prs_handled": len(project.pull_requests),
-                "branches_handled": len(project.branches),
-                "releases_handled": len(project.releases),
-                "issues_handled": len(project.issues),
-            }
-            result.append(project_info)
+        summaries = GitProjectModel.get_summaries(first, last, after=cursor(str, int))
+        result = [get_project_info(summary) for summary in summaries]
 
         resp = response_maker(
             result,
             status=HTTPStatus.PARTIAL_CONTENT if result else HTTPStatus.OK,
         )
-        resp.headers["Content-Range"] = f"git-projects {first + 1}-{last}/*"
-        return resp
+        return add_pagination_headers(
+            resp, "git-projects", first, last, get_pagination_keys(summaries)
+        )
 
 
 @ns.route("/<forge>/<namespace>/<repo_name>")
@@ -57,22 +65,15 @@ class ProjectInfo(Resource):
     @ns.response(HTTPStatus.OK.value, "Project details follow")
     def get(self, forge, namespace, repo_name):
         """Project Details"""
-        project = GitProjectModel.get_project(forge, namespace, repo_name)
-        if not project:
+        summaries = GitProjectModel.get_summaries(
+            forge=forge, namespace=namespace, repo_name=repo_name
+        )
+        if not summaries:
             return response_maker(
                 {"error": "No info about project stored in DB"},
                 status=HTTPStatus.NOT_FOUND,
             )
-        project_info = {
-            "namespace": project.namespace,
-            "repo_name": project.repo_name,
-            "project_url": project.project_url,
-            "prs_handled": len(project.pull_requests),
-            "branches_handled": len(project.branches),
-            "releases_handled": len(project.releases),
-            "issues_handled": len(project.issues),
-        }
-        return response_maker(project_info)
+        return response_maker(get_project_info(summaries[0]))
 
 
 @ns.route("/<forge>")
@@ -84,27 +85,19 @@ class ProjectsForge(Resource):
     def get(self, forge):
         """List of projects of given forge (e.g. github.com, gitlab.com)"""
 
-        result = []
         first, last = indices()
-
-        for project in GitProjectModel.get_by_forge(first, last, forge):
-            project_info = {
-                "namespace": project.namespace,
-                "repo_name": project.repo_name,
-                "project_url": project.project_url,
-                "prs_handled": len(project.pull_requests),
-                "branches_handled": len(project.branches),
-                "releases_handled": len(project.releases),
-                "issues_handled": len(project.issues),
-            }
-            result.append(project_info)
+        summaries = GitProjectModel.get_summaries(
+            first, last, forge=forge, after=cursor(str, int)
+        )
+        result = [get_project_info(summary) for summary in summaries]
 
         resp = response_maker(
             result,
             status=HTTPStatus.PARTIAL_CONTENT if result else HTTPStatus.OK,
         )
-        resp.headers["Content-Range"] = f"git-projects {first + 1}-{last}/*"
-        return resp
+        return add_pagination_headers(
+            resp, "git-projects", first, last, get_pagination_keys(summaries)
+        )
 
 
 @ns.route("/<forge>/<namespace>")
@@ -114,18 +107,12 @@ class ProjectsNamespace(Resource):
     @ns.response(HTTPStatus.OK.value, "Projects details follow")
     def get(self, forge, namespace):
         """List of projects of given forge and namespace"""
-        result = []
-        for project in GitProjectModel.get_by_forge_namespace(forge, namespace):
-            project_info = {
-                "namespace": project.namespace,
-                "repo_name": project.repo_name,
-                "project_url": project.project_url,
-                "prs_handled": len(project.pull_requests),
-                "branches_handled": len(project.branches),
-                "releases_handled": len(project.releases),
-                "issues_handled": len(project.issues),
-            }
-            result.append(project_info)
+        result = [
+            get_project_info(summary)
+            for summary in GitProjectModel.get_summaries(
+                forge=forge, namespace=namespace
+            )
+        ]
         return response_maker(result)
 
 
@@ -145,9 +132,12 @@ class ProjectsPRs(Resource):
         result = []
         first, last = indices()
 
-        for pr in GitProjectModel.get_project_prs(
-            first, last, forge, namespace, repo_name
-        ):
+        prs = list(
+            GitProjectModel.get_project_prs(
+                first, last, forge, namespace, repo_name, before=cursor()
+            )
+        )
+        for pr in prs:
             pr_info = {
                 "pr_id": pr.pr_id,
                 "builds": [],
@@ -197,9 +187,9 @@ class ProjectsPRs(Resource):
             result,
             status=HTTPStatus.PARTIAL_CONTENT if result else HTTPStatus.OK,
         )
-
-        resp.headers["Content-Range"] = f"git-project-prs {first + 1}-{last}/*"
-        return resp
+        return add_pagination_headers(
+            resp, "git-project-prs", first, last, [[pr.pr_id] for pr in prs]
+        )
 
 
 @ns.route("/<forge>/<namespace>/<repo_name>/issues")
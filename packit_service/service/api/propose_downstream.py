@@ -11,8 +11,12 @@ from packit_service.models import (
     ProposeDownstreamModel,
     optional_timestamp,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import cursor, indices, pagination_arguments
+from packit_service.service.api.utils import (
+    add_pagination_headers,
+    get_project_info_from_build,
+    response_maker,
+)
 
 logger = getLogger("packit_service")
 
@@ -28,7 +32,8 @@ class ProposeDownstreamList(Resource):
 
         result = []
         first, last = indices()
-        for propose_downstream_results in ProposeDownstreamModel.get_range(first, last):
+        runs = list(ProposeDownstreamModel.get_range(first, last, before=cursor()))
+        for propose_downstream_results in runs:
             result_dict = {
                 "packit_id": propose_downstream_results.id,
                 "status": propose_downstream_results.status,
@@ -56,8 +61,9 @@ class ProposeDownstreamList(Resource):
             result.append(result_dict)
 
         resp = response_maker(result, status=HTTPStatus.PARTIAL_CONTENT)
-        resp.headers["Content-Range"] = f"propose-downstreams {first + 1}-{last}/*"
-        return resp
+        return add_pagination_headers(
+            resp, "propose-downstreams", first, last, [[run.id] for run in runs]
+        )
 
 
 @ns.route("/<int:id>")
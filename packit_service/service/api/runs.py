@@ -3,13 +3,17 @@
 
 from http import HTTPStatus
 from logging import getLogger
-from typing import Dict
+from typing import Any, Dict, List, Set, Tuple, Type
 
 from flask_restx import Namespace, Resource
 
 from packit_service.models import (
+    AbstractBuildTestDbType,
+    AbstractTriggerDbType,
     CoprBuildTargetModel,
+    JobTriggerModel,
     KojiBuildTargetModel,
+    MergedRunModel,
     PipelineModel,
     ProposeDownstreamModel,
     SRPMBuildModel,
@@ -17,9 +21,11 @@ from packit_service.models import (
     optional_timestamp,
     BuildStatus,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
+from packit_service.service.api.parsers import cursor, indices, pagination_arguments
 from packit_service.service.api.utils import (
+    add_pagination_headers,
     get_project_info_from_build,
+    get_project_info_from_trigger,
     response_maker,
 )
 
@@ -28,7 +34,11 @@ logger = getLogger("packit_service")
 ns = Namespace("runs", description="Pipelines")
 
 
-def _add_propose_downstream(run: ProposeDownstreamModel, response_dict: Dict):
+def _add_propose_downstream(
+    run: ProposeDownstreamModel,
+    response_dict: Dict,
+    trigger_objects: Dict[int, AbstractTriggerDbType],
+):
     targets = response_dict["propose_downstream"]
 
     for target in run.propose_downstream_targets:
@@ -42,29 +52,87 @@ def _add_propose_downstream(run: ProposeDownstreamModel, response_dict: Dict):
 
     if "trigger" not in response_dict:
         response_dict["time_submitted"] = optional_timestamp(run.submitted_time)
-        response_dict["trigger"] = get_project_info_from_build(run)
+        response_dict["trigger"] = _get_trigger_info(run, trigger_objects)
 
 
-def flatten_and_remove_none(ids):
-    return filter(None, map(lambda arr: arr[0], ids))
+def _get_trigger_info(
+    model: AbstractBuildTestDbType, trigger_objects: Dict[int, AbstractTriggerDbType]
+) -> Dict[str, Any]:
+    job_trigger = model.get_job_trigger_model()
+    return get_project_info_from_trigger(
+        trigger_objects.get(job_trigger.id) if job_trigger else None
+    )
+
+
+def _load_models(
+    runs: List[MergedRunModel],
+) -> Tuple[
+    Dict[Type[AbstractBuildTestDbType], Dict[int, AbstractBuildTestDbType]],
+    Dict[int, AbstractTriggerDbType],
+]:
+    """
+    Loads all the build/test models referenced by the merged runs with one query
+    per model type and all their trigger objects with one query per trigger type.
+
+    Args:
+        runs: Summaries of the merged runs.
+
+    Returns:
+        Tuple of dictionaries: models by their type and ID, and trigger objects
+        by the ID of the `JobTriggerModel`.
+    """
+    ids_per_model: Dict[Type[AbstractBuildTestDbType], Set[int]] = {
+        SRPMBuildModel: {run.srpm_build_id for run in runs if run.srpm_build_id},
+        CoprBuildTargetModel: set(),
+        KojiBuildTargetModel: set(),
+        TFTTestRunTargetModel: set(),
+        ProposeDownstreamModel: set(),
+    }
+    for run in runs:
+        for Model, packit_ids in (
+            (CoprBuildTargetModel, run.copr_build_ids),
+            (KojiBuildTargetModel, run.koji_build_ids),
+            (TFTTestRunTargetModel, run.test_run_ids),
+            (ProposeDownstreamModel, run.propose_downstream_run_ids),
+        ):
+            ids_per_model[Model].update(packit_ids)
+
+    models: Dict[Type[AbstractBuildTestDbType], Dict[int, AbstractBuildTestDbType]] = {}
+    job_triggers = {}
+    for Model, ids in ids_per_model.items():
+        models[Model] = {}
+        if not ids:
+            continue
+        for model in Model.get_by_ids(ids):
+            models[Model][model.id] = model
+            if job_trigger := model.get_job_trigger_model():
+                job_triggers[job_trigger.id] = job_trigger
+
+    return models, JobTriggerModel.get_trigger_objects(job_triggers.values())
 
 
 def process_runs(runs):
     """
-    Process `PipelineModel`s and construct a JSON that is returned from the endpoints
+    Process `MergedRunModel`s and construct a JSON that is returned from the endpoints
     that return merged chroots.
 
+    All the referenced models are loaded in bulk beforehand, so the number of
+    queries does not depend on the number of runs or chroots.
+
     Args:
-        runs: Iterator over merged `PipelineModel`s.
+        runs: Iterator over `MergedRunModel`s.
 
     Returns:
         List of JSON objects where each represents pipelines run on single SRPM.
     """
     result = []
 
+    runs = list(runs)
+    models, trigger_objects = _load_models(runs)
+
     for pipeline in runs:
         response_dict = {
-            "merged_run_id": pipeline.merged_id,
+            "merged_run_id": pipeline.id,
             "srpm": None,
             "copr": [],
             "koji": [],
@@ -72,7 +140,7 @@ def process_runs(runs):
             "propose_downstream": [],
         }
 
-        if srpm_build := SRPMBuildModel.get_by_id(pipeline.srpm_build_id):
+        if srpm_build := models[SRPMBuildModel].get(pipeline.srpm_build_id):
             response_dict["srpm"] = {
                 "packit_id": srpm_build.id,
                 "status": srpm_build.status,
@@ -80,16 +148,16 @@ def process_runs(runs):
             response_dict["time_submitted"] = optional_timestamp(
                 srpm_build.build_submitted_time
             )
-            response_dict["trigger"] = get_project_info_from_build(srpm_build)
+            response_dict["trigger"] = _get_trigger_info(srpm_build, trigger_objects)
 
         for model_type, Model, packit_ids in (
-            ("copr", CoprBuildTargetModel, pipeline.copr_build_id),
-            ("koji", KojiBuildTargetModel, pipeline.koji_build_id),
-            ("test_run", TFTTestRunTargetModel, pipeline.test_run_id),
+            ("copr", CoprBuildTargetModel, pipeline.copr_build_ids),
+            ("koji", KojiBuildTargetModel, pipeline.koji_build_ids),
+            ("test_run", TFTTestRunTargetModel, pipeline.test_run_ids),
         ):
-            for packit_id in set(flatten_and_remove_none(packit_ids)):
-                row = Model.get_by_id(packit_id)
-                if row.status == BuildStatus.waiting_for_srpm:
+            for packit_id in packit_ids:
+                row = models[Model].get(packit_id)
+                if not row or row.status == BuildStatus.waiting_for_srpm:
                     continue
                 response_dict[model_type].append(
                     {
@@ -105,15 +173,16 @@ def process_runs(runs):
                         else row.build_submitted_time
                     )
                     response_dict["time_submitted"] = optional_timestamp(submitted_time)
-                    response_dict["trigger"] = get_project_info_from_build(row)
+                    response_dict["trigger"] = _get_trigger_info(row, trigger_objects)
 
         # handle propose-downstream
-        if propose_downstream := list(
-            flatten_and_remove_none(pipeline.propose_downstream_run_id)
+        if (propose_downstream := pipeline.propose_downstream_run_ids) and (
+            propose_downstream_run := models[ProposeDownstreamModel].get(
+                propose_downstream[0]
+            )
         ):
             _add_propose_downstream(
-                ProposeDownstreamModel.get_by_id(propose_downstream[0]),
-                response_dict,
+                propose_downstream_run, response_dict, trigger_objects
             )
 
         result.append(response_dict)
@@ -128,13 +197,15 @@ class RunsList(Resource):
     def get(self):
         """List all runs."""
         first, last = indices()
-        result = process_runs(PipelineModel.get_merged_chroots(first, last))
+        runs = list(MergedRunModel.get_range(first, last, before=cursor()))
+        result = process_runs(runs)
         resp = response_maker(
             result,
             status=HTTPStatus.PARTIAL_CONTENT,
         )
-        resp.headers["Content-Range"] = f"runs {first + 1}-{last}/*"
-        return resp
+        return add_pagination_headers(
+            resp, "runs", first, last, [[run.id] for run in runs]
+        )
 
 
 @ns.route("/merged/<int:id>")
@@ -144,7 +215,7 @@ class MergedRun(Resource):
     @ns.response(HTTPStatus.NOT_FOUND.value, "Run ID not found in DB")
     def get(self, id):
         """Return details for merged run."""
-        if result := process_runs(filter(None, [PipelineModel.get_merged_run(id)])):
+        if result := process_runs(filter(None, [MergedRunModel.get_by_id(id)])):
             return response_maker(result[0])
 
         return response_maker(
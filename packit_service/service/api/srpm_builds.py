@@ -5,11 +5,16 @@ from http import HTTPStatus
 from logging import getLogger
 
 from packit_service.service.urls import get_srpm_build_info_url
+from flask import Response
 from flask_restx import Namespace, Resource
 
 from packit_service.models import SRPMBuildModel, optional_timestamp
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import cursor, indices, pagination_arguments
+from packit_service.service.api.utils import (
+    add_pagination_headers,
+    get_project_info_from_build,
+    response_maker,
+)
 
 logger = getLogger("packit_service")
 
@@ -26,7 +31,8 @@ class SRPMBuildsList(Resource):
         result = []
 
         first, last = indices()
-        for build in SRPMBuildModel.get_range(first, last):
+        builds = list(SRPMBuildModel.get_range(first, last, before=cursor()))
+        for build in builds:
 
             build_dict = {
                 "srpm_build_id": build.id,
@@ -49,8 +55,9 @@ class SRPMBuildsList(Resource):
             result,
             status=HTTPStatus.PARTIAL_CONTENT,
         )
-        resp.headers["Content-Range"] = f"srpm-builds {first + 1}-{last}/*"
-        return resp
+        return add_pagination_headers(
+            resp, "srpm-builds", first, last, [[build.id] for build in builds]
+        )
 
 
 @ns.route("/<int:id>")
@@ -82,3 +89,22 @@ class SRPMBuildItem(Resource):
 
         build_dict.update(get_project_info_from_build(build))
         return response_maker(build_dict)
+
+
+@ns.route("/<int:id>/logs")
+@ns.param("id", "Packit id of the SRPM build")
+class SRPMBuildLogs(Resource):
+    @ns.response(HTTPStatus.OK.value, "OK, SRPM build logs follow")
+    @ns.response(HTTPStatus.NOT_FOUND.value, "No logs of the SRPM build in db")
+    def get(self, id):
+        """Logs of a specific SRPM build as plain text."""
+        build = SRPMBuildModel.get_by_id(int(id))
+        if not build or not build.srpm_build_logs:
+            return response_maker(
+                {"error": "No logs of the build stored in DB"},
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+        # the compressed logs are loaded now, they are decompressed while sending
+        # which happens after the DB session of the request has ended
+        return Response(build.get_logs_chunks(), mimetype="text/plain")
@@ -13,8 +13,12 @@ from packit_service.config import ServiceConfig
 from packit_service.constants import CELERY_DEFAULT_MAIN_TASK_NAME
 from packit_service.models import TFTTestRunTargetModel, optional_timestamp
 from packit_service.service.api.errors import ValidationFailed
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import cursor, indices, pagination_arguments
+from packit_service.service.api.utils import (
+    add_pagination_headers,
+    get_project_info_from_build,
+    response_maker,
+)
 
 logger = logging.getLogger("packit_service")
 
@@ -108,7 +112,8 @@ class TestingFarmResults(Resource):
         first, last = indices()
         # results have nothing other than ref in common, so it doesn't make sense to
         # merge them like copr builds
-        for tf_result in TFTTestRunTargetModel.get_range(first, last):
+        tf_results = list(TFTTestRunTargetModel.get_range(first, last, before=cursor()))
+        for tf_result in tf_results:
             result_dict = {
                 "packit_id": tf_result.id,
                 "pipeline_id": tf_result.pipeline_id,
@@ -131,8 +136,13 @@ class TestingFarmResults(Resource):
             result,
             status=HTTPStatus.PARTIAL_CONTENT,
         )
-        resp.headers["Content-Range"] = f"test-results {first + 1}-{last}/*"
-        return resp
+        return add_pagination_headers(
+            resp,
+            "test-results",
+            first,
+            last,
+            [[tf_result.id] for tf_result in tf_results],
+        )
 
 
 @ns.route("/<int:id>")
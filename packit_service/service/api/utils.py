@@ -3,17 +3,23 @@
 
 from http import HTTPStatus
 from json import dumps
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
-from flask import make_response
+from flask import Response, make_response
 
 from packit_service.models import (
+    AbstractTriggerDbType,
     CoprBuildTargetModel,
+    GitBranchModel,
+    IssueModel,
     KojiBuildTargetModel,
+    ProjectReleaseModel,
+    PullRequestModel,
     SRPMBuildModel,
     TFTTestRunTargetModel,
     ProposeDownstreamModel,
 )
+from packit_service.service.api.parsers import encode_cursor
 
 
 def response_maker(result: Any, status: HTTPStatus = HTTPStatus.OK):
@@ -24,6 +30,32 @@ def response_maker(result: Any, status: HTTPStatus = HTTPStatus.OK):
     return resp
 
 
+def add_pagination_headers(
+    resp: Response,
+    resource: str,
+    first: int,
+    last: int,
+    keys: Sequence[List[Any]],
+) -> Response:
+    """
+    Add the Content-Range header and, unless the page is the last one,
+    the X-Next-Cursor header with the cursor of the next page.
+
+    Args:
+        resp: Response with the page.
+        resource: Name of the listed resource.
+        first: Index of the first entry on the page.
+        last: Index after the last entry on the page.
+        keys: Pagination keys of the entries fetched for the page
+            (before any filtering of the entries).
+    """
+    resp.headers["Content-Range"] = f"{resource} {first + 1}-{last}/*"
+    if keys and len(keys) == last - first:
+        resp.headers["X-Next-Cursor"] = encode_cursor(keys[-1])
+        resp.headers["Access-Control-Expose-Headers"] = "Content-Range, X-Next-Cursor"
+    return resp
+
+
 def get_project_info_from_build(
     build: Union[
         SRPMBuildModel,
@@ -33,15 +65,23 @@ def get_project_info_from_build(
         ProposeDownstreamModel,
     ]
 ) -> Dict[str, Any]:
-    if not (project := build.get_project()):
+    return get_project_info_from_trigger(build.get_trigger_object())
+
+
+def get_project_info_from_trigger(
+    trigger: Optional[AbstractTriggerDbType],
+) -> Dict[str, Any]:
+    if not trigger or not (project := trigger.project):
         return {}
 
     return {
         "repo_namespace": project.namespace,
         "repo_name": project.repo_name,
         "git_repo": project.project_url,
-        "pr_id": build.get_pr_id(),
-        "issue_id": build.get_issue_id(),
-        "branch_name": build.get_branch_name(),
-        "release": build.get_release_tag(),
+        "pr_id": trigger.pr_id if isinstance(trigger, PullRequestModel) else None,
+        "issue_id": trigger.issue_id if isinstance(trigger, IssueModel) else None,
+        "branch_name": trigger.name if isinstance(trigger, GitBranchModel) else None,
+        "release": trigger.tag_name
+        if isinstance(trigger, ProjectReleaseModel)
+        else None,
     }
@@ -94,7 +94,11 @@ class GithubWebhook(Resource):
 
         celery_app.send_task(
             name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
-            kwargs={"event": msg},
+            kwargs={
+                "event": msg,
+                "source": "github",
+                "event_type": request.headers.get("X-GitHub-Event"),
+            },
         )
         github_webhook_calls.labels(result="accepted", process_id=os.getpid()).inc()
 
@@ -193,7 +197,11 @@ class GitlabWebhook(Resource):
 
         celery_app.send_task(
             name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
-            kwargs={"event": msg},
+            kwargs={
+                "event": msg,
+                "source": "gitlab",
+                "event_type": request.headers.get("X-Gitlab-Event"),
+            },
         )
 
         return "Webhook accepted. We thank you, Gitlab.", HTTPStatus.ACCEPTED
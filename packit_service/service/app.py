@@ -12,6 +12,7 @@ from werkzeug.middleware.dispatcher import DispatcherMiddleware
 from packit.utils import set_logging
 from packit_service.config import ServiceConfig
 from packit_service.log_versions import log_service_versions
+from packit_service.models import end_session
 from packit_service.sentry_integration import configure_sentry
 from packit_service.service.api import blueprint
 
@@ -27,6 +28,8 @@ def get_flask_application():
     )
     app = Flask(__name__)
     app.register_blueprint(blueprint)
+    # every request works with its own database session
+    app.teardown_appcontext(lambda exception: end_session(commit=exception is None))
     service_config = ServiceConfig.get_service_config()
     # https://flask.palletsprojects.com/en/1.1.x/config/#SERVER_NAME
     # also needs to contain port if it's not 443
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+import threading
 from datetime import datetime, timezone
 from io import StringIO
 from logging import StreamHandler
@@ -77,6 +78,7 @@ def get_package_nvrs(built_packages: List[dict]) -> List[str]:
 # https://stackoverflow.com/a/41215655/14294700
 def gather_packit_logs_to_buffer(
     logging_level: LoggingLevel,
+    current_thread_only: bool = False,
 ) -> Tuple[StringIO, StreamHandler]:
     """
     Redirect packit logs into buffer with a given logging level to collect them later.
@@ -85,6 +87,8 @@ def gather_packit_logs_to_buffer(
 
     Args:
         logging_level: Logs with this logging level will be collected.
+        current_thread_only: Collect only the logs of the current thread,
+            e.g. when more jobs are run concurrently in threads.
 
     Returns:
         A tuple of values which you have to pass them to `collect_packit_logs()` function later.
@@ -99,6 +103,9 @@ def gather_packit_logs_to_buffer(
     packit_logger.setLevel(logging_level)
     packit_logger.addHandler(handler)
     handler.setFormatter(PackitFormatter())
+    if current_thread_only:
+        thread_id = threading.get_ident()
+        handler.addFilter(lambda record: record.thread == thread_id)
     return buffer, handler
 
 
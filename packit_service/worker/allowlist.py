@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+import threading
+import time
 from typing import Any, Iterable, Optional, Union, Callable, List, Tuple, Dict, Type
 
 from fasjson_client import Client
@@ -13,6 +15,7 @@ from packit.config.job_config import JobConfig, JobType
 from packit.exceptions import PackitException, PackitCommandFailedError
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
+    ALLOWLIST_CACHE_TTL,
     FASJSON_URL,
     NAMESPACE_NOT_ALLOWED_MARKDOWN_DESCRIPTION,
     NAMESPACE_NOT_ALLOWED_MARKDOWN_ISSUE_INSTRUCTIONS,
@@ -60,6 +63,67 @@ UncheckedEvent = Union[
 ]
 
 
+class AllowlistCache:
+    """
+    Prefix trie of the allowlist entries (namespaces split by `/`),
+    loaded from the database at once.
+
+    The allowlist can be changed by other processes too (e.g. by the allowlist
+    script), therefore the trie is reloaded after `ttl` seconds.
+    """
+
+    # key of the status of the namespace ending in the trie node
+    _STATUS = None
+
+    def __init__(self, ttl: float = ALLOWLIST_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._trie: Optional[dict] = None
+        self._loaded_at = 0.0
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._trie = None
+
+    def _get_trie(self) -> dict:
+        with self._lock:
+            if self._trie is None or time.monotonic() - self._loaded_at > self.ttl:
+                trie: dict = {}
+                for entry in AllowlistModel.get_all():
+                    node = trie
+                    for part in entry.namespace.split("/"):
+                        node = node.setdefault(part, {})
+                    node[self._STATUS] = AllowlistStatus(entry.status)
+
+                self._trie = trie
+                self._loaded_at = time.monotonic()
+            return self._trie
+
+    def get_statuses(self, namespace: str) -> List[Tuple[str, AllowlistStatus]]:
+        """
+        Get the entries matching the namespace or its parent namespaces.
+
+        Args:
+            namespace: Namespace in format `example.com/namespace/repository.git`.
+
+        Returns:
+            Namespaces with their statuses from the longest to the shortest.
+        """
+        statuses = []
+        node = self._get_trie()
+        parts = namespace.split("/")
+        for depth, part in enumerate(parts, start=1):
+            if (node := node.get(part)) is None:
+                break
+            if self._STATUS in node:
+                statuses.append(("/".join(parts[:depth]), node[self._STATUS]))
+
+        return statuses[::-1]
+
+
+allowlist_cache = AllowlistCache()
+
+
 class Allowlist:
     def __init__(self, service_config: ServiceConfig):
         self.service_config = service_config
@@ -162,6 +226,7 @@ class Allowlist:
             return True
 
         AllowlistModel.add_namespace(namespace, AllowlistStatus.waiting.value)
+        allowlist_cache.invalidate()
 
         return self.verify_fas(
             namespace=namespace, sender_login=sender_login, fas_account=sender_login
@@ -187,6 +252,7 @@ class Allowlist:
             AllowlistModel.add_namespace(
                 namespace, AllowlistStatus.approved_automatically.value, fas_account
             )
+            allowlist_cache.invalidate()
             return True
 
         return False
@@ -203,6 +269,7 @@ class Allowlist:
         AllowlistModel.add_namespace(
             namespace=namespace, status=AllowlistStatus.approved_manually.value
         )
+        allowlist_cache.invalidate()
 
         logger.info(f"Account {namespace!r} approved successfully.")
 
@@ -221,17 +288,13 @@ class Allowlist:
         if not namespace:
             return False
 
-        separated_path = [namespace, None]
-        while len(separated_path) > 1:
-            if matching_namespace := AllowlistModel.get_namespace(separated_path[0]):
-                status = AllowlistStatus(matching_namespace.status)
-                if status != AllowlistStatus.waiting:
-                    return status in (
-                        AllowlistStatus.approved_automatically,
-                        AllowlistStatus.approved_manually,
-                    )
-
-            separated_path = separated_path[0].rsplit("/", 1)
+        # the closest entry which is not waiting for the approval decides
+        for _, status in allowlist_cache.get_statuses(namespace):
+            if status != AllowlistStatus.waiting:
+                return status in (
+                    AllowlistStatus.approved_automatically,
+                    AllowlistStatus.approved_manually,
+                )
 
         logger.info(f"Could not find entry for: {namespace}")
         return False
@@ -253,6 +316,7 @@ class Allowlist:
             return False
 
         AllowlistModel.remove_namespace(namespace)
+        allowlist_cache.invalidate()
         logger.info(f"Namespace {namespace!r} removed from allowlist!")
 
         return True
@@ -348,7 +412,7 @@ class Allowlist:
                     service_config=self.service_config,
                     package_config=event.get_package_config(),
                     project=project,
-                    metadata=EventData.from_event_dict(event.get_dict()),
+                    metadata=EventData.from_event_dict(event.get_cached_dict()),
                     db_trigger=event.db_trigger,
                     job_config=job_config,
                     build_targets_override=event.build_targets_override,
@@ -1,18 +1,26 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from datetime import timedelta
-from gzip import open as gzip_open
-from logging import getLogger, DEBUG, INFO
+import zlib
+from datetime import datetime, timedelta
+from logging import getLogger
 from os import getenv
-from pathlib import Path
-from shutil import copyfileobj
+from resource import getrusage, RUSAGE_SELF
+from subprocess import Popen, PIPE
+from time import monotonic
+from typing import BinaryIO, Tuple
 
 from boto3 import client as boto3_client
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
-from packit.utils.commands import run_command
-from packit_service.constants import SRPMBUILDS_OUTDATED_AFTER_DAYS
+from packit.exceptions import PackitCommandFailedError
+from packit_service.constants import (
+    DB_BACKUP_PART_SIZE,
+    DB_BACKUP_UPLOAD_CONCURRENCY,
+    SRPMBUILDS_DISCARD_BATCH_SIZE,
+    SRPMBUILDS_OUTDATED_AFTER_DAYS,
+)
 from packit_service.models import get_pg_url, SRPMBuildModel
 
 logger = getLogger(__name__)
@@ -20,58 +28,120 @@ logger = getLogger(__name__)
 DB_NAME = getenv("POSTGRESQL_DATABASE")
 
 
-def discard_old_srpm_build_logs():
-    """Called periodically (see celery_config.py) to discard logs of old SRPM builds."""
+def discard_old_srpm_build_logs() -> Tuple[int, int]:
+    """
+    Called periodically (see celery_config.py) to discard logs of old SRPM builds.
+
+    The builds are processed in batches ordered by their IDs, each batch is
+    updated by a single statement without loading the logs.
+
+    Returns:
+        Number of builds whose logs were discarded and the number of bytes
+        the logs occupied.
+    """
     logger.info("About to discard old SRPM build logs & artifact urls.")
     outdated_after_days = getenv(
         "SRPMBUILDS_OUTDATED_AFTER_DAYS", SRPMBUILDS_OUTDATED_AFTER_DAYS
     )
     ago = timedelta(days=int(outdated_after_days))
-    for build in SRPMBuildModel.get_older_than(ago):
+    # build_submitted_time is a naive UTC datetime
+    submitted_before = datetime.utcnow() - ago
+
+    rows, reclaimed_bytes, last_id = 0, 0, 0
+    while discarded := SRPMBuildModel.discard_logs(
+        submitted_before=submitted_before,
+        after_id=last_id,
+        batch_size=SRPMBUILDS_DISCARD_BATCH_SIZE,
+    ):
+        rows += len(discarded)
+        reclaimed_bytes += sum(size for _, size in discarded)
+        last_id = max(id_ for id_, _ in discarded)
         logger.debug(
-            f"SRPM build {build.id} is older than '{ago}'. "
-            "Discarding log and artifact url."
+            f"Discarded logs & artifact urls of {len(discarded)} SRPM builds "
+            f"older than '{ago}' (up to ID {last_id})."
         )
-        build.set_logs(None)
-        build.set_url(None)
 
+    logger.info(
+        f"Discarded logs & artifact urls of {rows} SRPM builds, "
+        f"{reclaimed_bytes} bytes reclaimed."
+    )
+    return rows, reclaimed_bytes
 
-def gzip_file(file: Path) -> Path:
-    """Gzip compress given file into {file}.gz
 
-    Args:
-        file: File to be compressed.
-    Returns:
-        Compressed file.
-    Raises:
-        OSError: If the 'file' can't be opened.
+class CompressedDumpStream:
     """
-    compressed_file = Path(f"{file}.gz")
-    try:
-        with file.open(mode="rb") as f_in:
-            with gzip_open(compressed_file, mode="wb") as f_out:
-                logger.info(f"Compressing {file} into {compressed_file}")
-                copyfileobj(f_in, f_out)
-    except OSError as e:
-        logger.error(e)
-        raise
-    return compressed_file
+    File-like object reading the output of pg_dump and compressing it
+    on the fly (gzip format).
+
+    Reads return exactly the requested number of bytes unless the dump ended,
+    so that all the parts of a multipart upload except the last one have
+    the same size.
+    """
+
+    def __init__(self, process: Popen, chunk_size: int = 1024 * 1024):
+        self._process = process
+        self._chunk_size = chunk_size
+        # wbits=31 -> gzip header and trailer
+        self._compressor = zlib.compressobj(wbits=31)
+        self._buffer = bytearray()
+        self._eof = False
+        self.dumped_bytes = 0
+        self.compressed_bytes = 0
+
+    def _fill(self):
+        chunk = self._process.stdout.read(self._chunk_size)
+        if chunk:
+            self.dumped_bytes += len(chunk)
+            self._buffer += self._compressor.compress(chunk)
+            return
+
+        self._buffer += self._compressor.flush()
+        self._eof = True
+        if (returncode := self._process.wait()) != 0:
+            # raising here makes the transfer abort the multipart upload
+            raise PackitCommandFailedError(
+                f"pg_dump failed with exit code {returncode}"
+            )
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            self._fill()
+
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self.compressed_bytes += len(data)
+        return data
 
 
 def upload_to_s3(
-    file: Path, bucket: str = f"arr-packit-{getenv('DEPLOYMENT', 'dev')}"
+    fileobj: BinaryIO,
+    key: str,
+    bucket: str = f"arr-packit-{getenv('DEPLOYMENT', 'dev')}",
 ) -> None:
-    """Upload a file to an S3 bucket.
+    """Upload a stream to an S3 bucket using a multipart upload.
+
+    The parts are read from the stream and uploaded concurrently,
+    only a few of them are kept in memory at once.
+
+    S3_ENDPOINT_URL env. variable can point the client to an S3 compatible
+    storage (e.g. a local MinIO instance).
 
     Args:
-        file: File to upload.
+        fileobj: Stream to upload.
+        key: Name of the object to create.
         bucket: Bucket to upload to.
     """
-
-    s3_client = boto3_client("s3")
+    s3_client = boto3_client("s3", endpoint_url=getenv("S3_ENDPOINT_URL"))
+    config = TransferConfig(
+        multipart_threshold=DB_BACKUP_PART_SIZE,
+        multipart_chunksize=DB_BACKUP_PART_SIZE,
+        max_concurrency=DB_BACKUP_UPLOAD_CONCURRENCY,
+    )
     try:
-        logger.info(f"Uploading {file} to S3 ({bucket})")
-        s3_client.upload_file(str(file), bucket, file.name)
+        logger.info(f"Uploading {key} to S3 ({bucket})")
+        s3_client.upload_fileobj(fileobj, bucket, key, Config=config)
     except ClientError as e:
         logger.error(e)
         raise
@@ -82,52 +152,62 @@ def is_aws_configured() -> bool:
     return bool(getenv("AWS_ACCESS_KEY_ID") and getenv("AWS_SECRET_ACCESS_KEY"))
 
 
-def dump_to(file: Path):
-    """Dump 'packit' database into a file.
+def start_dump() -> Popen:
+    """Start dumping the 'packit' database to the stdout of the returned process.
 
-    To restore db from this file, run:
-    psql -d packit < database_packit.sql
+    The dump is in the custom format, uncompressed (it is compressed
+    by CompressedDumpStream). To restore db from the uploaded object, run:
+    gunzip database_packit.dump.gz
+    pg_restore --jobs=4 -d packit database_packit.dump
 
-    Args:
-        file: File where to put the dump.
-    Raises:
-        PackitCommandFailedError: When pg_dump fails.
+    (the directory format needed by pg_dump --jobs can't be written to a pipe,
+    restoring the custom format can be parallelized though)
+
+    Returns:
+        The running pg_dump process.
     """
     # We have to specify libpq connection string to be able to pass the
     # password to the pg_dump. Luckily get_pg_url() does almost what we need.
     pg_connection = get_pg_url().replace("+psycopg2", "")
-    cmd = ["pg_dump", f"--file={file}", f"--dbname={pg_connection}"]
-    packit_logger = getLogger("packit")
-    was_debug = packit_logger.level == DEBUG
+    cmd = ["pg_dump", "--format=custom", "--compress=0", f"--dbname={pg_connection}"]
 
     logger.info(f"Running pg_dump to create '{DB_NAME}' database backup")
-    try:
-        if was_debug:
-            # Temporarily increase log level to avoid password leaking into logs
-            packit_logger.setLevel(INFO)
-        run_command(cmd=cmd)
-    finally:
-        if was_debug:
-            packit_logger.setLevel(DEBUG)
+    # the command is not logged, it contains the password
+    return Popen(cmd, stdout=PIPE)
 
 
 def backup():
-    """Dump the 'packit' database into a file, compress and upload to S3."""
+    """Dump the 'packit' database, compress and upload to S3.
+
+    The stages run concurrently, the dump is streamed through the compression
+    to the upload without being stored anywhere.
+    """
     if not is_aws_configured():
         logger.info("Not backing up database since AWS is not configured.")
         # probably dev/test deployment
         return
 
     project = getenv("PROJECT", "packit")
-    file = Path(f"/tmp/{project}_database_{DB_NAME}.sql")
-    compressed_file = None
+    key = f"{project}_database_{DB_NAME}.dump.gz"
+
+    logger.info("About to backup database")
+    start = monotonic()
+    process = start_dump()
     try:
-        logger.info("About to backup database")
-        dump_to(file)
-        compressed_file = gzip_file(file)
-        upload_to_s3(compressed_file)
-        logger.info("Backup complete")
+        stream = CompressedDumpStream(process)
+        upload_to_s3(stream, key)
     finally:
-        file.unlink(missing_ok=True)
-        if compressed_file:
-            compressed_file.unlink()
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+        process.stdout.close()
+
+    elapsed = monotonic() - start
+    # ru_maxrss is in KiB on Linux
+    peak_memory = getrusage(RUSAGE_SELF).ru_maxrss / 1024
+    logger.info(
+        f"Backup complete: dumped {stream.dumped_bytes} bytes, "
+        f"uploaded {stream.compressed_bytes} bytes in {elapsed:.1f}s "
+        f"({stream.dumped_bytes / max(elapsed, 1e-6) / 2**20:.1f} MiB/s), "
+        f"peak memory of the worker {peak_memory:.1f} MiB."
+    )
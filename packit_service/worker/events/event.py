@@ -23,12 +23,26 @@ from packit_service.models import (
     TFTTestRunTargetModel,
     filter_most_recent_target_names_by_status,
 )
+from packit_service.package_config_cache import package_config_cache
 
 logger = getLogger(__name__)
 
 
 MAP_EVENT_TO_JOB_CONFIG_TRIGGER_TYPE: Dict[Type["Event"], JobConfigTriggerType] = {}
 
+# attributes identifying the event in its string representation
+SUMMARY_ATTRIBUTES = (
+    "project_url",
+    "pr_id",
+    "issue_id",
+    "git_ref",
+    "tag_name",
+    "commit_sha",
+    "build_id",
+    "task_id",
+    "pipeline_id",
+)
+
 
 def use_for_job_config_trigger(trigger_type: JobConfigTriggerType):
     """
@@ -208,8 +222,13 @@ class EventData:
         return self._db_trigger
 
     def get_dict(self) -> dict:
-        d = self.__dict__
-        d = copy.deepcopy(d)
+        # the lazy attributes are not serializable, don't waste time copying them,
+        # values replaced below are replaced in the copy only
+        d = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("_project", "_db_trigger")
+        }
         task_accepted_time = d.get("task_accepted_time")
         d["task_accepted_time"] = (
             int(task_accepted_time.timestamp()) if task_accepted_time else None
@@ -220,8 +239,6 @@ class EventData:
             d["tests_targets_override"] = list(self.tests_targets_override)
         if self.branches_override:
             d["branches_override"] = list(self.branches_override)
-        d.pop("_project", None)
-        d.pop("_db_trigger", None)
         return d
 
     def get_project(self) -> Optional[GitProject]:
@@ -251,9 +268,36 @@ class Event:
         # lazy properties:
         self._db_trigger: Optional[AbstractTriggerDbType] = None
 
+    def __setattr__(self, name, value):
+        # any change of the event invalidates its cached dict
+        self.__dict__.pop("_cached_dict", None)
+        super().__setattr__(name, value)
+
+    def get_cached_dict(self) -> dict:
+        """
+        Get the dict of the event (see get_dict), it is built only once and kept
+        until an attribute of the event changes.
+
+        The returned dict is shared, don't modify it, use get_dict to get a copy
+        which can be modified.
+        """
+        if (cached_dict := self.__dict__.get("_cached_dict")) is None:
+            cached_dict = self.get_dict()
+            # bypass __setattr__, setting the cache doesn't change the event
+            self.__dict__["_cached_dict"] = cached_dict
+        return cached_dict
+
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         d = default_dict or self.__dict__
-        d = copy.deepcopy(d)
+        # Only the top-level values are replaced or popped (also by the subclasses),
+        # a shallow copy is enough. Copying the containers separately keeps
+        # the event untouched if they are modified by the caller.
+        # (deepcopy would also copy the lazy objects like projects and DB models)
+        d = {
+            key: copy.copy(value) if isinstance(value, (dict, list, set)) else value
+            for key, value in d.items()
+            if key != "_cached_dict"
+        }
         # whole dict has to be JSON serializable because of redis
         d["event_type"] = self.__class__.__name__
 
@@ -361,10 +405,17 @@ class Event:
         return True
 
     def __str__(self):
-        return str(self.get_dict())
+        return repr(self)
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.get_dict()})"
+        # cheap summary for the logs, without touching the lazy properties
+        attributes = ", ".join(
+            f"{name}={value!r}"
+            for name in SUMMARY_ATTRIBUTES
+            if (value := self.__dict__.get(name, self.__dict__.get(f"_{name}")))
+            is not None
+        )
+        return f"{self.__class__.__name__}({attributes})"
 
 
 class AbstractForgeIndependentEvent(Event):
@@ -409,6 +460,12 @@ class AbstractForgeIndependentEvent(Event):
             self._package_config_searched = True
         return self._package_config
 
+    @package_config.setter
+    def package_config(self, package_config: Optional[PackageConfig]):
+        """Set the package config obtained elsewhere (e.g. shared by more events)."""
+        self._package_config = package_config
+        self._package_config_searched = True
+
     def get_db_trigger(self) -> Optional[AbstractTriggerDbType]:
         raise NotImplementedError()
 
@@ -429,21 +486,24 @@ class AbstractForgeIndependentEvent(Event):
         return None
 
     def get_package_config(self) -> Optional[PackageConfig]:
-        logger.debug(
-            f"Getting package_config:\n"
-            f"\tproject: {self.project}\n"
-            f"\tbase_project: {self.base_project}\n"
-            f"\treference: {self.commit_sha}\n"
-            f"\tpr_id: {self.pr_id}"
-        )
+        package_config = package_config_cache.get(self.project_url, self.commit_sha)
+        if not package_config:
+            logger.debug(
+                f"Getting package_config:\n"
+                f"\tproject: {self.project}\n"
+                f"\tbase_project: {self.base_project}\n"
+                f"\treference: {self.commit_sha}\n"
+                f"\tpr_id: {self.pr_id}"
+            )
 
-        package_config = PackageConfigGetter.get_package_config_from_repo(
-            base_project=self.base_project,
-            project=self.project,
-            reference=self.commit_sha,
-            pr_id=self.pr_id,
-            fail_when_missing=self.fail_when_config_file_missing,
-        )
+            package_config = PackageConfigGetter.get_package_config_from_repo(
+                base_project=self.base_project,
+                project=self.project,
+                reference=self.commit_sha,
+                pr_id=self.pr_id,
+                fail_when_missing=self.fail_when_config_file_missing,
+            )
+            package_config_cache.set(self.project_url, self.commit_sha, package_config)
 
         # job config change note:
         #   this is used in sync-from-downstream which is buggy - we don't need to change this
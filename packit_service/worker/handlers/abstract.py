@@ -23,11 +23,12 @@ from packit.constants import DATETIME_FORMAT
 from packit_service.models import (
     AbstractTriggerDbType,
 )
+from packit_service.payload_store import payload_store
 from packit_service.sentry_integration import push_scope_to_sentry
 from packit_service.utils import dump_job_config, dump_package_config
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.events import Event, EventData
-from packit_service.worker.monitoring import Pushgateway
+from packit_service.worker.monitoring import pushgateway
 from packit_service.worker.result import TaskResults
 from packit_service.worker.checker.abstract import Checker
 
@@ -314,7 +315,7 @@ class JobHandler(Handler):
         # always use job_config to pick up values, use package_config only for package_config.jobs
         self.job_config = job_config
         self.data = EventData.from_event_dict(event)
-        self.pushgateway = Pushgateway()
+        self.pushgateway = pushgateway
 
         self._db_trigger: Optional[AbstractTriggerDbType] = None
         self._project: Optional[GitProject] = None
@@ -346,7 +347,7 @@ class JobHandler(Handler):
                 if msg := result["details"].get("msg"):
                     logger.error(msg)
 
-        # push the metrics from job
+        # push the metrics from job (in the background)
         self.pushgateway.push()
 
         return job_results
@@ -360,12 +361,16 @@ class JobHandler(Handler):
         :param job: job to process
         """
         logger.debug(f"Getting signature of a Celery task {cls.task_name}.")
+        # the event and package config are the same for all the tasks of the event,
+        # the messages carry only references to them (if the store is enabled)
         return signature(
             cls.task_name.value,
             kwargs={
-                "package_config": dump_package_config(event.package_config),
+                "package_config": payload_store.reference(
+                    dump_package_config(event.package_config)
+                ),
                 "job_config": dump_job_config(job),
-                "event": event.get_dict(),
+                "event": payload_store.reference(event.get_cached_dict()),
             },
         )
 
@@ -24,6 +24,7 @@ from packit_service.models import (
     CoprBuildTargetModel,
     GithubInstallationModel,
     BuildStatus,
+    SRPMBuildModel,
 )
 from packit_service.worker.checker.abstract import Checker
 from packit_service.worker.checker.copr import (
@@ -151,17 +152,12 @@ class CoprBuildStartHandler(AbstractCoprBuildReportHandler):
             BuildNotAlreadyStarted,
         )
 
-    def set_start_time(self):
-        start_time = (
+    def get_start_time(self) -> Optional[datetime]:
+        return (
             datetime.utcfromtimestamp(self.copr_event.timestamp)
             if self.copr_event.timestamp
             else None
         )
-        self.build.set_start_time(start_time)
-
-    def set_logs_url(self):
-        copr_build_logs = self.copr_event.get_copr_build_logs_url()
-        self.build.set_build_logs_url(copr_build_logs)
 
     def run(self):
         if not self.build:
@@ -174,10 +170,12 @@ class CoprBuildStartHandler(AbstractCoprBuildReportHandler):
             logger.warning(msg)
             return TaskResults(success=False, details={"msg": msg})
 
-        self.set_start_time()
-        self.set_logs_url()
+        start_time = self.get_start_time()
+        logs_url = self.copr_event.get_copr_build_logs_url()
 
         if self.copr_event.chroot == COPR_SRPM_CHROOT:
+            self.build.update(build_start_time=start_time, logs_url=logs_url)
+
             url = get_srpm_build_info_url(self.build.id)
             self.copr_build_helper.report_status_to_all(
                 description="SRPM build is in progress...",
@@ -189,7 +187,11 @@ class CoprBuildStartHandler(AbstractCoprBuildReportHandler):
 
         self.pushgateway.copr_builds_started.inc()
         url = get_copr_build_info_url(self.build.id)
-        self.build.set_status(BuildStatus.pending)
+        self.build.update(
+            status=BuildStatus.pending,
+            build_start_time=start_time,
+            build_logs_url=logs_url,
+        )
 
         self.copr_build_helper.report_status_to_all_for_chroot(
             description="RPM build is in progress...",
@@ -209,32 +211,30 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
     topic = "org.fedoraproject.prod.copr.build.end"
     task_name = TaskName.copr_build_end
 
-    def set_srpm_url(self) -> None:
-        # TODO how to do better
-        srpm_build = (
-            self.build
-            if self.copr_event.chroot == COPR_SRPM_CHROOT
-            else self.build.get_srpm_build()
-        )
-
+    def get_srpm_url(self, srpm_build: SRPMBuildModel) -> Optional[str]:
+        """
+        Returns:
+            URL of the SRPM if it is not set in the given model yet.
+        """
         if srpm_build.url is not None:
             # URL has been already set
-            return
+            return None
 
-        srpm_url = self.copr_build_helper.get_build(
+        return self.copr_build_helper.get_build(
             self.copr_event.build_id
         ).source_package.get("url")
 
-        if srpm_url is not None:
-            srpm_build.set_url(srpm_url)
+    def set_srpm_url(self) -> None:
+        srpm_build = self.build.get_srpm_build()
+        if srpm_url := self.get_srpm_url(srpm_build):
+            srpm_build.update(url=srpm_url)
 
-    def set_end_time(self):
-        end_time = (
+    def get_end_time(self) -> Optional[datetime]:
+        return (
             datetime.utcfromtimestamp(self.copr_event.timestamp)
             if self.copr_event.timestamp
             else None
         )
-        self.build.set_end_time(end_time)
 
     def run(self):
         if not self.build:
@@ -259,11 +259,13 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
             logger.info(msg)
             return TaskResults(success=True, details={"msg": msg})
 
-        self.set_end_time()
-        self.set_srpm_url()
+        # all the changes of the build are committed at once
+        end_time = self.get_end_time()
 
         if self.copr_event.chroot == COPR_SRPM_CHROOT:
-            return self.handle_srpm_end()
+            return self.handle_srpm_end(end_time)
+
+        self.set_srpm_url()
 
         self.pushgateway.copr_builds_finished.inc()
 
@@ -283,16 +285,19 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
                 url=get_copr_build_info_url(self.build.id),
                 chroot=self.copr_event.chroot,
             )
-            self.build.set_status(BuildStatus.failure)
+            self.build.update(status=BuildStatus.failure, build_finished_time=end_time)
             return TaskResults(success=False, details={"msg": failed_msg})
 
         self.report_successful_build()
-        self.build.set_status(BuildStatus.success)
 
         built_packages = self.copr_build_helper.get_built_packages(
             int(self.build.build_id), self.build.target
         )
-        self.build.set_built_packages(built_packages)
+        self.build.update(
+            status=BuildStatus.success,
+            build_finished_time=end_time,
+            built_packages=built_packages,
+        )
         self.handle_testing_farm()
 
         return TaskResults(success=True, details={})
@@ -334,8 +339,11 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
             chroot=self.copr_event.chroot,
         )
 
-    def handle_srpm_end(self):
+    def handle_srpm_end(self, end_time: Optional[datetime]):
         url = get_srpm_build_info_url(self.build.id)
+        fields = {"build_finished_time": end_time}
+        if srpm_url := self.get_srpm_url(self.build):
+            fields["url"] = srpm_url
 
         if self.copr_event.status != COPR_API_SUCC_STATE:
             failed_msg = "SRPM build failed, check the logs for details."
@@ -344,7 +352,7 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
                 description=failed_msg,
                 url=url,
             )
-            self.build.set_status(BuildStatus.failure)
+            self.build.update(status=BuildStatus.failure, **fields)
             self.copr_build_helper.monitor_not_submitted_copr_builds(
                 len(self.copr_build_helper.build_targets), "srpm_failure"
             )
@@ -354,9 +362,9 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
             str(self.copr_event.build_id)
         ):
             # from waiting_for_srpm to pending
-            build.set_status(BuildStatus.pending)
+            build.update(status=BuildStatus.pending)
 
-        self.build.set_status(BuildStatus.success)
+        self.build.update(status=BuildStatus.success, **fields)
         self.copr_build_helper.report_status_to_all(
             state=BaseCommitStatus.running,
             description="SRPM build succeeded. Waiting for RPM build to start...",
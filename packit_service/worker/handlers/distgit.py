@@ -7,14 +7,20 @@ This file defines classes for job handlers specific for distgit
 import logging
 import shutil
 from celery import Task
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, Dict, Tuple, Type
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Dict, List, Tuple, Type
 
+from git import Repo
 from ogr.abstract import PullRequest
 
+from packit.api import PackitAPI
 from packit.config import JobConfig, JobType
 from packit.config.package_config import PackageConfig
 from packit.exceptions import PackitException, PackitDownloadFailedException
+from packit.local_project import LocalProject
 from packit_service import sentry_integration
 from packit_service.config import PackageConfigGetter
 from packit_service.constants import (
@@ -26,6 +32,7 @@ from packit_service.models import (
     ProposeDownstreamTargetModel,
     ProposeDownstreamModel,
     ProposeDownstreamStatus,
+    end_session,
 )
 from packit_service.service.urls import get_propose_downstream_info_url
 from packit_service.utils import gather_packit_logs_to_buffer, collect_packit_logs
@@ -108,6 +115,11 @@ class AbortProposeDownstream(Exception):
     """Abort propose-downstream process"""
 
 
+# directory in the upstream clone where the worktrees for the dist-git branches
+# synced concurrently are created
+PROPOSE_DOWNSTREAM_WORKTREES_DIR = ".packit-worktrees"
+
+
 @configured_as(job_type=JobType.propose_downstream)
 @run_for_comment(command="propose-downstream")
 @run_for_comment(command="propose-update")  # deprecated
@@ -137,6 +149,12 @@ class ProposeDownstreamHandler(
         )
         self._propose_downstream_run_id = propose_downstream_run_id
         self._propose_downstream_helper: Optional[ProposeDownstreamJobHelper] = None
+        # the branches may be synced concurrently in threads, which can't access
+        # the (thread-local) request of the Celery task, so they only record
+        # the need to retry and the task is retried once from run()
+        self._retry_lock = Lock()
+        self._retry_exception: Optional[Exception] = None
+        self._is_last_try = False
 
     @property
     def propose_downstream_helper(self) -> ProposeDownstreamJobHelper:
@@ -153,10 +171,10 @@ class ProposeDownstreamHandler(
         return self._propose_downstream_helper
 
     def sync_branch(
-        self, branch: str, model: ProposeDownstreamModel
+        self, branch: str, model: ProposeDownstreamModel, packit_api: PackitAPI
     ) -> Optional[PullRequest]:
         try:
-            downstream_pr = self.packit_api.sync_release(
+            downstream_pr = packit_api.sync_release(
                 dist_git_branch=branch, tag=self.data.tag_name, create_pr=True
             )
         except PackitDownloadFailedException as ex:
@@ -165,31 +183,35 @@ class ProposeDownstreamHandler(
             logger.info(f"We were not able to download the archive: {ex}")
             # when the task hits max_retries, it raises MaxRetriesExceededError
             # and the error handling code would be never executed
-            retries = self.celery_task.retries
-            if not self.celery_task.is_last_try():
-                # will retry in: 1m and then again in another 2m
-                delay = 60 * 2**retries
-                logger.info(
-                    f"Will retry for the {retries + 1}. time in {delay}s \
-                        with propose_downstream_run_id {model.id}."
-                )
-                # throw=False so that exception is not raised and task
-                # is not retried also automatically
-                kargs = self.celery_task.task.request.kwargs.copy()
-                kargs["propose_downstream_run_id"] = model.id
-                # https://docs.celeryq.dev/en/stable/userguide/tasks.html#retrying
-                self.celery_task.task.retry(
-                    exc=ex, countdown=delay, throw=False, args=(), kwargs=kargs
-                )
+            if not self._is_last_try:
+                with self._retry_lock:
+                    self._retry_exception = self._retry_exception or ex
                 raise AbortProposeDownstream()
             raise ex
         finally:
-            self.packit_api.up.local_project.git_repo.head.reset(
+            packit_api.up.local_project.git_repo.head.reset(
                 "HEAD", index=True, working_tree=True
             )
 
         return downstream_pr
 
+    def _schedule_retry(self, ex: Exception, propose_downstream_run_id: int) -> None:
+        # will retry in: 1m and then again in another 2m
+        retries = self.celery_task.retries
+        delay = 60 * 2**retries
+        logger.info(
+            f"Will retry for the {retries + 1}. time in {delay}s \
+                with propose_downstream_run_id {propose_downstream_run_id}."
+        )
+        # throw=False so that exception is not raised and task
+        # is not retried also automatically
+        kargs = self.celery_task.task.request.kwargs.copy()
+        kargs["propose_downstream_run_id"] = propose_downstream_run_id
+        # https://docs.celeryq.dev/en/stable/userguide/tasks.html#retrying
+        self.celery_task.task.retry(
+            exc=ex, countdown=delay, throw=False, args=(), kwargs=kargs
+        )
+
     def _report_errors_for_each_branch(self, errors: Dict[str, str]) -> None:
         branch_errors = ""
         for branch, err in sorted(
@@ -238,11 +260,223 @@ class ProposeDownstreamHandler(
 
         return propose_downstream_model
 
+    def _propose_downstream_for_branch(
+        self,
+        model: ProposeDownstreamTargetModel,
+        propose_downstream_model: ProposeDownstreamModel,
+        packit_api: PackitAPI,
+    ) -> Optional[str]:
+        """
+        Sync the release to the dist-git branch of the target and report the result.
+
+        Args:
+            model: Target of the propose downstream run for the branch.
+            propose_downstream_model: The propose downstream run.
+            packit_api: API with the upstream repository to sync the release from.
+
+        Returns:
+            Error which occurred, `None` if the sync was successful.
+
+        Raises:
+            AbortProposeDownstream: If the archive couldn't be downloaded yet
+                and the task will be retried.
+        """
+        branch = model.branch
+        logger.debug(f"Running propose downstream for {branch}")
+        model.set_status(status=ProposeDownstreamTargetStatus.running)
+        url = get_propose_downstream_info_url(model.id)
+        buffer, handler = gather_packit_logs_to_buffer(
+            logging_level=logging.DEBUG, current_thread_only=True
+        )
+
+        try:
+            model.set_start_time(start_time=datetime.utcnow())
+            self.propose_downstream_helper.report_status_to_branch(
+                branch=branch,
+                description="Starting propose downstream...",
+                state=BaseCommitStatus.running,
+                url=url,
+            )
+            downstream_pr = self.sync_branch(
+                branch=branch,
+                model=propose_downstream_model,
+                packit_api=packit_api,
+            )
+            logger.debug("Downstream PR created successfully.")
+            model.set_downstream_pr_url(downstream_pr_url=downstream_pr.url)
+            model.set_status(status=ProposeDownstreamTargetStatus.submitted)
+            self.propose_downstream_helper.report_status_to_branch(
+                branch=branch,
+                description="Propose downstream finished successfully.",
+                state=BaseCommitStatus.success,
+                url=url,
+            )
+        except AbortProposeDownstream:
+            logger.debug(
+                "Propose downstream is being retried because "
+                "we were not able yet to download the archive. "
+            )
+            model.set_status(status=ProposeDownstreamTargetStatus.retry)
+            self.propose_downstream_helper.report_status_to_branch(
+                branch=branch,
+                description="Propose downstream is being retried because "
+                "we were not able yet to download the archive. ",
+                state=BaseCommitStatus.pending,
+                url=url,
+            )
+            raise
+        except Exception as ex:
+            logger.debug(f"Propose downstream failed: {ex}")
+            # eat the exception and continue with the execution
+            model.set_status(status=ProposeDownstreamTargetStatus.error)
+            self.propose_downstream_helper.report_status_to_branch(
+                branch=branch,
+                description=f"Propose downstream failed: {ex}",
+                state=BaseCommitStatus.failure,
+                url=url,
+            )
+            sentry_integration.send_to_sentry(ex)
+            return str(ex)
+        finally:
+            model.set_finished_time(finished_time=datetime.utcnow())
+            model.set_logs(collect_packit_logs(buffer=buffer, handler=handler))
+
+        return None
+
+    def _propose_downstream_sequentially(
+        self,
+        models: List[ProposeDownstreamTargetModel],
+        propose_downstream_model: ProposeDownstreamModel,
+    ) -> Dict[str, str]:
+        """
+        Sync the branches one after another using the upstream clone of the handler.
+
+        Returns:
+            Errors which occurred for the branches.
+        """
+        errors = {}
+        try:
+            for model in models:
+                if error := self._propose_downstream_for_branch(
+                    model, propose_downstream_model, self.packit_api
+                ):
+                    errors[model.branch] = error
+        finally:
+            # remove temporary dist-git clone after we're done here - context:
+            # 1. the dist-git repo is cloned on worker, not sandbox
+            # 2. it's stored in /tmp, not in the mirrored sandbox PV
+            # 3. it's not being cleaned up and it wastes pod's filesystem space
+            shutil.rmtree(self.packit_api.dg.local_project.working_dir)
+
+        return errors
+
+    def _create_worktree(self, branch: str) -> LocalProject:
+        """
+        Create a worktree of the upstream clone checked out at the released tag,
+        so that the release can be synced to the dist-git branch independently
+        of the other branches.
+        """
+        path = (
+            Path(self.local_project.working_dir)
+            / PROPOSE_DOWNSTREAM_WORKTREES_DIR
+            / branch
+        )
+        self.local_project.git_repo.git.worktree(
+            "add", "--detach", str(path), self.data.tag_name
+        )
+        return LocalProject(
+            git_repo=Repo(path), working_dir=str(path), git_project=self.project
+        )
+
+    def _remove_worktree(self, worktree: LocalProject) -> None:
+        self.local_project.git_repo.git.worktree(
+            "remove", "--force", worktree.working_dir
+        )
+
+    def _propose_downstream_in_worktree(
+        self, target_id: int, propose_downstream_run_id: int, worktree: LocalProject
+    ) -> Optional[str]:
+        """
+        Sync the branch in its own worktree of the upstream clone and its own
+        dist-git clone. Runs in a thread, so it works with its own DB session.
+
+        Returns:
+            Error which occurred, `None` if the sync was successful or skipped.
+        """
+        if self._retry_exception:
+            # the whole task will be retried, the branch stays queued till then
+            return None
+
+        packit_api = PackitAPI(
+            self.service_config, self.job_config, upstream_local_project=worktree
+        )
+        try:
+            return self._propose_downstream_for_branch(
+                ProposeDownstreamTargetModel.get_by_id(target_id),
+                ProposeDownstreamModel.get_by_id(propose_downstream_run_id),
+                packit_api,
+            )
+        finally:
+            shutil.rmtree(packit_api.dg.local_project.working_dir)
+            packit_api.clean()
+            end_session()
+
+    def _propose_downstream_concurrently(
+        self,
+        models: List[ProposeDownstreamTargetModel],
+        propose_downstream_model: ProposeDownstreamModel,
+    ) -> Dict[str, str]:
+        """
+        Sync the branches concurrently, at most `propose_downstream_concurrency`
+        of them at once.
+
+        The upstream repository is cloned once (and its actions run in it)
+        and every branch is synced in its own worktree of the clone.
+
+        Returns:
+            Errors which occurred for the branches.
+
+        Raises:
+            AbortProposeDownstream: If the archive couldn't be downloaded yet
+                for any of the branches and the task will be retried.
+        """
+        errors = {}
+        aborted = False
+        worktrees: Dict[str, LocalProject] = {}
+        try:
+            for model in models:
+                worktrees[model.branch] = self._create_worktree(model.branch)
+
+            with ThreadPoolExecutor(
+                max_workers=self.service_config.propose_downstream_concurrency
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self._propose_downstream_in_worktree,
+                        model.id,
+                        propose_downstream_model.id,
+                        worktrees[model.branch],
+                    ): model.branch
+                    for model in models
+                }
+                for future in as_completed(futures):
+                    try:
+                        if error := future.result():
+                            errors[futures[future]] = error
+                    except AbortProposeDownstream:
+                        aborted = True
+        finally:
+            for worktree in worktrees.values():
+                self._remove_worktree(worktree)
+
+        if aborted:
+            raise AbortProposeDownstream()
+        return errors
+
     def run(self) -> TaskResults:
         """
         Sync the upstream release to dist-git as a pull request.
         """
-        errors = {}
         propose_downstream_model = self._get_or_create_propose_downstream_run()
         branches_to_run = [
             target.branch
@@ -250,88 +484,41 @@ class ProposeDownstreamHandler(
         ]
         logger.debug(f"Branches to run propose downstream: {branches_to_run}")
 
-        try:
-            for model in propose_downstream_model.propose_downstream_targets:
-                branch = model.branch
-                # skip submitting a branch if we already did that (even if it failed)
-                if model.status not in [
-                    ProposeDownstreamTargetStatus.running,
-                    ProposeDownstreamTargetStatus.retry,
-                    ProposeDownstreamTargetStatus.queued,
-                ]:
-                    logger.debug(
-                        f"Skipping propose downstream for branch {branch} "
-                        f"that was already processed."
-                    )
-                    continue
-                logger.debug(f"Running propose downstream for {branch}")
-                model.set_status(status=ProposeDownstreamTargetStatus.running)
-                url = get_propose_downstream_info_url(model.id)
-                buffer, handler = gather_packit_logs_to_buffer(
-                    logging_level=logging.DEBUG
+        models = []
+        for model in propose_downstream_model.propose_downstream_targets:
+            # skip submitting a branch if we already did that (even if it failed)
+            if model.status not in [
+                ProposeDownstreamTargetStatus.running,
+                ProposeDownstreamTargetStatus.retry,
+                ProposeDownstreamTargetStatus.queued,
+            ]:
+                logger.debug(
+                    f"Skipping propose downstream for branch {model.branch} "
+                    f"that was already processed."
                 )
+                continue
+            models.append(model)
 
-                try:
-                    model.set_start_time(start_time=datetime.utcnow())
-                    self.propose_downstream_helper.report_status_to_branch(
-                        branch=branch,
-                        description="Starting propose downstream...",
-                        state=BaseCommitStatus.running,
-                        url=url,
-                    )
-                    downstream_pr = self.sync_branch(
-                        branch=branch, model=propose_downstream_model
-                    )
-                    logger.debug("Downstream PR created successfully.")
-                    model.set_downstream_pr_url(downstream_pr_url=downstream_pr.url)
-                    model.set_status(status=ProposeDownstreamTargetStatus.submitted)
-                    self.propose_downstream_helper.report_status_to_branch(
-                        branch=branch,
-                        description="Propose downstream finished successfully.",
-                        state=BaseCommitStatus.success,
-                        url=url,
-                    )
-                except AbortProposeDownstream:
-                    logger.debug(
-                        "Propose downstream is being retried because "
-                        "we were not able yet to download the archive. "
-                    )
-                    model.set_status(status=ProposeDownstreamTargetStatus.retry)
-                    self.propose_downstream_helper.report_status_to_branch(
-                        branch=branch,
-                        description="Propose downstream is being retried because "
-                        "we were not able yet to download the archive. ",
-                        state=BaseCommitStatus.pending,
-                        url=url,
-                    )
-                    return TaskResults(
-                        success=True,  # do not create a Sentry issue
-                        details={
-                            "msg": "Not able to download archive. Task will be retried."
-                        },
-                    )
-                except Exception as ex:
-                    logger.debug(f"Propose downstream failed: {ex}")
-                    # eat the exception and continue with the execution
-                    model.set_status(status=ProposeDownstreamTargetStatus.error)
-                    self.propose_downstream_helper.report_status_to_branch(
-                        branch=branch,
-                        description=f"Propose downstream failed: {ex}",
-                        state=BaseCommitStatus.failure,
-                        url=url,
-                    )
-                    errors[branch] = str(ex)
-                    sentry_integration.send_to_sentry(ex)
-                finally:
-                    model.set_finished_time(finished_time=datetime.utcnow())
-                    model.set_logs(collect_packit_logs(buffer=buffer, handler=handler))
-
-        finally:
-            # remove temporary dist-git clone after we're done here - context:
-            # 1. the dist-git repo is cloned on worker, not sandbox
-            # 2. it's stored in /tmp, not in the mirrored sandbox PV
-            # 3. it's not being cleaned up and it wastes pod's filesystem space
-            shutil.rmtree(self.packit_api.dg.local_project.working_dir)
+        # read in this thread, the request of the Celery task is thread-local
+        self._is_last_try = self.celery_task.is_last_try()
+        try:
+            if (
+                self.service_config.propose_downstream_concurrency > 1
+                and len(models) > 1
+            ):
+                errors = self._propose_downstream_concurrently(
+                    models, propose_downstream_model
+                )
+            else:
+                errors = self._propose_downstream_sequentially(
+                    models, propose_downstream_model
+                )
+        except AbortProposeDownstream:
+            self._schedule_retry(self._retry_exception, propose_downstream_model.id)
+            return TaskResults(
+                success=True,  # do not create a Sentry issue
+                details={"msg": "Not able to download archive. Task will be retried."},
+            )
 
         if errors:
             self._report_errors_for_each_branch(errors)
@@ -53,6 +53,17 @@ from packit_service.worker.handlers.mixin import GetKojiBuildJobHelperMixin
 
 logger = logging.getLogger(__name__)
 
+# commit statuses (and statuses of the builds) for the states of the Koji tasks,
+# there is no change for the states mapped to None
+KOJI_TASK_STATE_TO_COMMIT_STATUS = {
+    KojiTaskState.free: BaseCommitStatus.pending,
+    KojiTaskState.open: BaseCommitStatus.running,
+    KojiTaskState.closed: BaseCommitStatus.success,
+    KojiTaskState.canceled: BaseCommitStatus.error,
+    KojiTaskState.assigned: None,
+    KojiTaskState.failed: BaseCommitStatus.failure,
+}
+
 
 @configured_as(job_type=JobType.production_build)
 @configured_as(job_type=JobType.upstream_koji_build)
@@ -145,17 +156,27 @@ class KojiTaskReportHandler(JobHandler):
             f"from {self.koji_task_event.old_state} to {self.koji_task_event.state}."
         )
 
-        build.set_build_start_time(
-            datetime.utcfromtimestamp(self.koji_task_event.start_time)
-            if self.koji_task_event.start_time
-            else None
-        )
-
-        build.set_build_finished_time(
-            datetime.utcfromtimestamp(self.koji_task_event.completion_time)
-            if self.koji_task_event.completion_time
-            else None
-        )
+        # all the changes of the build are committed at once
+        fields = {
+            "build_start_time": (
+                datetime.utcfromtimestamp(self.koji_task_event.start_time)
+                if self.koji_task_event.start_time
+                else None
+            ),
+            "build_finished_time": (
+                datetime.utcfromtimestamp(self.koji_task_event.completion_time)
+                if self.koji_task_event.completion_time
+                else None
+            ),
+            "build_logs_url": KojiTaskEvent.get_koji_build_logs_url(
+                rpm_build_task_id=int(build.build_id),
+                koji_logs_url=self.service_config.koji_logs_url,
+            ),
+            "web_url": KojiTaskEvent.get_koji_rpm_build_web_url(
+                rpm_build_task_id=int(build.build_id),
+                koji_web_url=self.service_config.koji_web_url,
+            ),
+        }
 
         url = get_koji_build_info_url(build.id)
         build_job_helper = KojiBuildJobHelper(
@@ -167,14 +188,9 @@ class KojiTaskReportHandler(JobHandler):
             job_config=self.job_config,
         )
 
-        new_commit_status = {
-            KojiTaskState.free: BaseCommitStatus.pending,
-            KojiTaskState.open: BaseCommitStatus.running,
-            KojiTaskState.closed: BaseCommitStatus.success,
-            KojiTaskState.canceled: BaseCommitStatus.error,
-            KojiTaskState.assigned: None,
-            KojiTaskState.failed: BaseCommitStatus.failure,
-        }.get(self.koji_task_event.state)
+        new_commit_status = KOJI_TASK_STATE_TO_COMMIT_STATUS.get(
+            self.koji_task_event.state
+        )
 
         description = {
             KojiTaskState.free: "RPM build has been submitted...",
@@ -189,8 +205,9 @@ class KojiTaskReportHandler(JobHandler):
             logger.debug(
                 f"We don't react to this koji build state change: {self.koji_task_event.state}"
             )
+            build.update(**fields)
         else:
-            build.set_status(new_commit_status.value)
+            build.update(status=new_commit_status.value, **fields)
             build_job_helper.report_status_to_all_for_chroot(
                 description=description,
                 state=new_commit_status,
@@ -198,17 +215,6 @@ class KojiTaskReportHandler(JobHandler):
                 chroot=build.target,
             )
 
-        koji_build_logs = KojiTaskEvent.get_koji_build_logs_url(
-            rpm_build_task_id=int(build.build_id),
-            koji_logs_url=self.service_config.koji_logs_url,
-        )
-        build.set_build_logs_url(koji_build_logs)
-        koji_rpm_task_web_url = KojiTaskEvent.get_koji_rpm_build_web_url(
-            rpm_build_task_id=int(build.build_id),
-            koji_web_url=self.service_config.koji_web_url,
-        )
-        build.set_web_url(koji_rpm_task_web_url)
-
         msg = (
             f"Build on {build.target} in koji changed state "
             f"from {self.koji_task_event.old_state} to {self.koji_task_event.state}."
@@ -268,6 +274,7 @@ class KojiBuildReportHandler(JobHandler):
             KojiBuildState.canceled: BaseCommitStatus.error,
         }.get(self.koji_build_event.state)
 
+        fields = {}
         if (
             new_commit_status
             and self.build.status
@@ -279,19 +286,20 @@ class KojiBuildReportHandler(JobHandler):
                 f"Not updating the status."
             )
         elif new_commit_status:
-            self.build.set_status(new_commit_status.value)
+            fields["status"] = new_commit_status.value
         else:
             logger.debug(
                 f"We don't react to this koji build state change: {self.koji_task_event.state}"
             )
 
         if not self.build.web_url:
-            self.build.set_web_url(
-                KojiBuildEvent.get_koji_rpm_build_web_url(
-                    rpm_build_task_id=self.koji_build_event.rpm_build_task_id,
-                    koji_web_url=self.service_config.koji_web_url,
-                )
+            fields["web_url"] = KojiBuildEvent.get_koji_rpm_build_web_url(
+                rpm_build_task_id=self.koji_build_event.rpm_build_task_id,
+                koji_web_url=self.service_config.koji_web_url,
             )
+
+        if fields:
+            self.build.update(**fields)
         # TODO: update logs URL (the access via task number does not work for non-scratch builds)
 
         return TaskResults(success=True, details={"msg": msg})
@@ -309,7 +309,10 @@ class TestingFarmResultsHandler(JobHandler):
             logger.warning(msg)
             return TaskResults(success=False, details={"msg": msg})
 
-        test_run_model.set_status(self.result, created=self.created)
+        fields = {"status": self.result, "web_url": self.log_url}
+        if self.created and not test_run_model.submitted_time:
+            fields["submitted_time"] = self.created
+        test_run_model.update(**fields)
 
         if self.result == TestingFarmResult.running:
             status = BaseCommitStatus.running
@@ -333,8 +336,6 @@ class TestingFarmResultsHandler(JobHandler):
             )
             self.pushgateway.test_run_finished_time.observe(test_run_time)
 
-        test_run_model.set_web_url(self.log_url)
-
         trigger = JobTriggerModel.get_or_create(
             type=self.db_trigger.job_trigger_model_type,
             trigger_id=self.db_trigger.id,
@@ -345,6 +346,7 @@ class TestingFarmResultsHandler(JobHandler):
             packit_user=self.service_config.get_github_account_name(),
             trigger_id=trigger.id if trigger else None,
             pr_id=self.data.pr_id,
+            project_url=self.data.project_url,
         )
         status_reporter.report(
             state=status,
@@ -3,14 +3,33 @@
 
 import collections
 import logging
-from datetime import datetime, timezone
-from typing import Iterable, Type, Any
+import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from http.client import HTTPConnection
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+from urllib.parse import urlsplit
 
 import copr.v3
 import requests
 from copr.v3 import Client as CoprClient
 
 from packit_service.constants import (
+    BABYSIT_CONCURRENCY,
+    KOJI_HUB_TIMEOUT,
+    KOJI_MULTICALL_BATCH_SIZE,
+    KojiTaskState,
     COPR_API_FAIL_STATE,
     COPR_API_SUCC_STATE,
     COPR_SUCC_STATE,
@@ -19,101 +38,213 @@ from packit_service.constants import (
 )
 from packit_service.models import (
     CoprBuildTargetModel,
+    KojiBuildTargetModel,
     TFTTestRunTargetModel,
     TestingFarmResult,
     BuildStatus,
 )
+from packit_service.config import ServiceConfig
 from packit_service.utils import elapsed_seconds
 from packit_service.worker.events import (
     AbstractCoprBuildEvent,
     CoprBuildStartEvent,
     CoprBuildEndEvent,
+    KojiTaskEvent,
     TestingFarmResultsEvent,
 )
 from packit_service.worker.events.enums import FedmsgTopic
 from packit_service.worker.handlers import (
     CoprBuildEndHandler,
     CoprBuildStartHandler,
+    KojiTaskReportHandler,
     TestingFarmResultsHandler,
 )
 from packit_service.worker.handlers.copr import AbstractCoprBuildReportHandler
+from packit_service.worker.handlers.koji import KOJI_TASK_STATE_TO_COMMIT_STATUS
 from packit_service.worker.jobs import SteveJobs
 from packit_service.worker.parser import Parser
+from packit_service.worker.reporting import BaseCommitStatus
 
 logger = logging.getLogger(__name__)
 
+# states of the Koji tasks as returned by the Koji hub
+KOJI_TASK_STATES = {
+    0: KojiTaskState.free,
+    1: KojiTaskState.open,
+    2: KojiTaskState.closed,
+    3: KojiTaskState.canceled,
+    4: KojiTaskState.assigned,
+    5: KojiTaskState.failed,
+}
+# statuses of the Koji builds which have not finished yet
+# and the corresponding states of their Koji tasks
+KOJI_PENDING_STATUSES = {
+    BaseCommitStatus.pending.value: KojiTaskState.free,
+    BaseCommitStatus.running.value: KojiTaskState.open,
+}
+
+# XML-RPC client of the Koji hub shared by the babysit runs of the worker process
+_koji_hub: Optional[xmlrpc.client.ServerProxy] = None
+
 
 def check_pending_testing_farm_runs() -> None:
-    """Checks the status of pending TFT runs and updates it if needed."""
+    """
+    Checks the status of pending TFT runs and updates it if needed.
+
+    The runs which have timed out are set to error at once beforehand,
+    so that only the live ones are checked.
+
+    The requests are fetched from Testing Farm concurrently over a shared session,
+    the completed runs are then grouped by project and commit so that the package
+    config is obtained only once for each group.
+    """
+    if timed_out := TFTTestRunTargetModel.mark_timed_out_as_error(
+        timedelta(seconds=DEFAULT_JOB_TIMEOUT)
+    ):
+        logger.info(
+            f"TFT runs {timed_out} have been running for more than "
+            f"{DEFAULT_JOB_TIMEOUT}s, probably an internal error occurred. "
+            "Not checking them anymore."
+        )
+
     logger.info("Getting pending TFT runs from DB")
-    current_time = datetime.now(timezone.utc)
     not_completed = (
         TestingFarmResult.new,
         TestingFarmResult.queued,
         TestingFarmResult.running,
     )
-    pending_test_runs = TFTTestRunTargetModel.get_all_by_status(*not_completed)
-    for run in pending_test_runs:
-        logger.debug(f"Checking status of TF pipeline {run.pipeline_id}")
-        # .submitted_time can be None, we'll set it later
-        if run.submitted_time:
-            elapsed = elapsed_seconds(begin=run.submitted_time, end=current_time)
-            if elapsed > DEFAULT_JOB_TIMEOUT:
+    # .submitted_time can be None, we'll set it later
+    pending_test_runs = list(TFTTestRunTargetModel.get_all_by_status(*not_completed))
+
+    if not pending_test_runs:
+        return
+
+    events_per_commit: Dict[
+        Tuple[str, str], List[TestingFarmResultsEvent]
+    ] = collections.defaultdict(list)
+    start = datetime.now(timezone.utc)
+    with get_testing_farm_session() as session, ThreadPoolExecutor(
+        max_workers=BABYSIT_CONCURRENCY
+    ) as executor:
+        futures = {
+            executor.submit(
+                session.get, f"{TESTING_FARM_API_URL}requests/{run.pipeline_id}"
+            ): run
+            for run in pending_test_runs
+        }
+        for future in as_completed(futures):
+            run = futures[future]
+            logger.debug(f"Checking status of TF pipeline {run.pipeline_id}")
+            try:
+                response = future.result()
+            except requests.RequestException as ex:
+                logger.warning(
+                    f"Failed to obtain state of TF pipeline {run.pipeline_id}: {ex}"
+                )
+                continue
+            if not response.ok:
                 logger.info(
-                    f"TF pipeline {run.pipeline_id} has been running for "
-                    f"{elapsed}s, probably an internal error occurred. "
-                    "Not checking it anymore."
+                    f"Failed to obtain state of TF pipeline {run.pipeline_id}. "
+                    f"Status code {response.status_code}. Reason: {response.reason}."
                 )
-                run.set_status(TestingFarmResult.error)
+                run.update(status=TestingFarmResult.error)
                 continue
-        run_url = f"{TESTING_FARM_API_URL}requests/{run.pipeline_id}"
-        response = requests.get(run_url)
-        if not response.ok:
-            logger.info(
-                f"Failed to obtain state of TF pipeline {run.pipeline_id}. "
-                f"Status code {response.status_code}. Reason: {response.reason}."
-            )
-            run.set_status(TestingFarmResult.error)
-            continue
 
-        details = response.json()
-        (
-            project_url,
-            ref,
-            result,
-            summary,
-            copr_build_id,
-            copr_chroot,
-            compose,
-            log_url,
-            created,
-            identifier,
-        ) = Parser.parse_data_from_testing_farm(run, details)
-
-        logger.debug(f"Result for the TF pipeline {run.pipeline_id} is {result}.")
-        if result in not_completed:
-            logger.debug("Skip updating a pipeline which is not yet completed.")
-            continue
+            if event := get_testing_farm_results_event(run, response.json()):
+                events_per_commit[(event.project_url, event.commit_sha)].append(event)
 
-        event = TestingFarmResultsEvent(
-            pipeline_id=details["id"],
-            result=result,
-            compose=compose,
-            summary=summary,
-            log_url=log_url,
-            copr_build_id=copr_build_id,
-            copr_chroot=copr_chroot,
-            commit_sha=ref,
-            project_url=project_url,
-            created=created,
-            identifier=identifier,
-        )
+    elapsed = elapsed_seconds(begin=start, end=datetime.now(timezone.utc))
+    logger.info(
+        f"Checked {len(pending_test_runs)} TF runs in {elapsed:.2f}s "
+        f"({len(pending_test_runs) / max(elapsed, 0.001):.2f} runs/s)."
+    )
+
+    for events in events_per_commit.values():
+        update_testing_farm_runs(events)
 
-        package_config = event.get_package_config()
-        if not package_config:
-            logger.info(f"No config found for {run.pipeline_id}. Skipping.")
-            continue
 
+def get_testing_farm_session() -> requests.Session:
+    """
+    Returns a session with a connection pool big enough
+    to be shared by all the threads polling Testing Farm.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(pool_maxsize=BABYSIT_CONCURRENCY),
+    )
+    return session
+
+
+def get_testing_farm_results_event(
+    run: TFTTestRunTargetModel, details: dict
+) -> Optional[TestingFarmResultsEvent]:
+    """
+    Creates an event from the Testing Farm request details.
+
+    Args:
+        run: Model of the test run.
+        details: Details of the request obtained from the Testing Farm API.
+
+    Returns:
+        Event for the completed run, `None` if the run is not completed yet.
+    """
+    (
+        project_url,
+        ref,
+        result,
+        summary,
+        copr_build_id,
+        copr_chroot,
+        compose,
+        log_url,
+        created,
+        identifier,
+    ) = Parser.parse_data_from_testing_farm(run, details)
+
+    logger.debug(f"Result for the TF pipeline {run.pipeline_id} is {result}.")
+    if result in (
+        TestingFarmResult.new,
+        TestingFarmResult.queued,
+        TestingFarmResult.running,
+    ):
+        logger.debug("Skip updating a pipeline which is not yet completed.")
+        return None
+
+    return TestingFarmResultsEvent(
+        pipeline_id=details["id"],
+        result=result,
+        compose=compose,
+        summary=summary,
+        log_url=log_url,
+        copr_build_id=copr_build_id,
+        copr_chroot=copr_chroot,
+        commit_sha=ref,
+        project_url=project_url,
+        created=created,
+        identifier=identifier,
+    )
+
+
+def update_testing_farm_runs(events: List[TestingFarmResultsEvent]) -> None:
+    """
+    Runs the results handler for the completed runs of the same project and commit.
+
+    The package config is the same for all the runs
+    so it is obtained only once for all of them.
+
+    Args:
+        events: Events for the completed runs of one project and commit.
+    """
+    package_config = events[0].get_package_config()
+    if not package_config:
+        logger.info(
+            f"No config found for {[event.pipeline_id for event in events]}. Skipping."
+        )
+        return
+
+    for event in events:
+        event.package_config = package_config
         job_configs = SteveJobs(event).get_config_for_handler_kls(
             handler_kls=TestingFarmResultsHandler,
         )
@@ -121,7 +252,7 @@ def check_pending_testing_farm_runs() -> None:
         event_dict = event.get_dict()
         for job_config in job_configs:
             handler = TestingFarmResultsHandler(
-                package_config=event.package_config,
+                package_config=package_config,
                 job_config=job_config,
                 event=event_dict,
             )
@@ -131,14 +262,60 @@ def check_pending_testing_farm_runs() -> None:
 
 
 def check_pending_copr_builds() -> None:
-    """Checks the status of pending copr builds and updates it if needed."""
+    """
+    Checks the status of pending copr builds and updates it if needed.
+
+    The builds which have timed out are set to error at once beforehand,
+    so that only the live ones are checked.
+
+    The data are fetched from Copr concurrently (using one shared client),
+    the builds are then updated one by one as their data arrive.
+    """
+    if timed_out := CoprBuildTargetModel.mark_timed_out_as_error(
+        timedelta(seconds=DEFAULT_JOB_TIMEOUT)
+    ):
+        logger.info(
+            f"Copr builds {timed_out} have been pending for more than "
+            f"{DEFAULT_JOB_TIMEOUT}s, probably an internal error occurred. "
+            "Not checking them anymore."
+        )
+
     pending_copr_builds = CoprBuildTargetModel.get_all_by_status(BuildStatus.pending)
     builds_grouped_by_id = collections.defaultdict(list)
     for build in pending_copr_builds:
         builds_grouped_by_id[build.build_id].append(build)
 
-    for build_id, builds in builds_grouped_by_id.items():
-        update_copr_builds(build_id, builds)
+    if not builds_grouped_by_id:
+        return
+
+    copr_client = CoprClient.create_from_config_file()
+    start = datetime.now(timezone.utc)
+    with ThreadPoolExecutor(max_workers=BABYSIT_CONCURRENCY) as executor:
+        futures = {
+            executor.submit(
+                get_copr_build_data,
+                copr_client,
+                build_id,
+                get_targets_to_check(builds),
+            ): build_id
+            for build_id, builds in builds_grouped_by_id.items()
+        }
+        for future in as_completed(futures):
+            build_id = futures[future]
+            try:
+                build_data = future.result()
+            except Exception as ex:
+                logger.warning(f"Failed to obtain state of copr build {build_id}: {ex}")
+                continue
+            update_copr_builds_from_data(
+                build_id, builds_grouped_by_id[build_id], build_data
+            )
+
+    elapsed = elapsed_seconds(begin=start, end=datetime.now(timezone.utc))
+    logger.info(
+        f"Checked {len(builds_grouped_by_id)} copr builds in {elapsed:.2f}s "
+        f"({len(builds_grouped_by_id) / max(elapsed, 0.001):.2f} builds/s)."
+    )
 
 
 def check_copr_build(build_id: int) -> bool:
@@ -161,7 +338,103 @@ def check_copr_build(build_id: int) -> bool:
     return update_copr_builds(build_id, builds)
 
 
-def update_copr_builds(build_id: int, builds: Iterable["CoprBuildTargetModel"]) -> bool:
+class CoprBuildData(NamedTuple):
+    """Data of a copr build (and its chroots) fetched from the Copr API."""
+
+    # `None` if the build doesn't exist (anymore)
+    build: Optional[Any]
+    # chroot name -> data of the build chroot
+    chroots: Dict[str, Any]
+
+
+def get_targets_to_check(builds: Iterable["CoprBuildTargetModel"]) -> Set[str]:
+    """
+    Returns the targets of the builds that are still worth checking, i.e. those
+    that haven't finished and haven't timed out.
+    """
+    current_time = datetime.now(timezone.utc)
+    return {
+        build.target
+        for build in builds
+        if build.status in (BuildStatus.pending, BuildStatus.waiting_for_srpm)
+        and elapsed_seconds(begin=build.build_submitted_time, end=current_time)
+        <= DEFAULT_JOB_TIMEOUT
+    }
+
+
+def get_copr_build_data(
+    copr_client: CoprClient, build_id: int, targets: Set[str]
+) -> CoprBuildData:
+    """
+    Fetches the data of the copr build and of the given chroots of that build.
+
+    When more chroots are needed, all of them are fetched at once
+    instead of requesting them one by one.
+
+    This does not touch the database, therefore it's safe to be run
+    in multiple threads.
+
+    Args:
+        copr_client: Copr client to use.
+        build_id: ID of the copr build.
+        targets: Chroots of the build we are interested in.
+
+    Returns:
+        Data of the build and its chroots.
+    """
+    try:
+        build_copr = copr_client.build_proxy.get(build_id)
+    except copr.v3.CoprNoResultException:
+        return CoprBuildData(build=None, chroots={})
+
+    if not targets or (not build_copr.ended_on and not build_copr.started_on):
+        return CoprBuildData(build=build_copr, chroots={})
+
+    if len(targets) == 1:
+        target = next(iter(targets))
+        return CoprBuildData(
+            build=build_copr,
+            chroots={target: copr_client.build_chroot_proxy.get(build_id, target)},
+        )
+
+    return CoprBuildData(
+        build=build_copr,
+        chroots={
+            chroot.name: chroot
+            for chroot in copr_client.build_chroot_proxy.get_list(build_id)
+            if chroot.name in targets
+        },
+    )
+
+
+def update_copr_builds(
+    build_id: int,
+    builds: Iterable["CoprBuildTargetModel"],
+    copr_client: Optional[CoprClient] = None,
+) -> bool:
+    """
+    Fetches the state of the copr build and updates the state of copr builds.
+
+    Args:
+        build_id: ID of the copr build to update.
+        builds: List of builds corresponding to the given ``build_id``.
+        copr_client: Copr client to reuse, a new one is created if not given.
+
+    Returns:
+        Whether the run was successful and the build has ended,
+        False signals the need to retry again.
+    """
+    copr_client = copr_client or CoprClient.create_from_config_file()
+    builds = list(builds)
+    build_data = get_copr_build_data(
+        copr_client, build_id, get_targets_to_check(builds)
+    )
+    return update_copr_builds_from_data(build_id, builds, build_data)
+
+
+def update_copr_builds_from_data(
+    build_id: int, builds: Iterable["CoprBuildTargetModel"], build_data: CoprBuildData
+) -> bool:
     """
     Updates the state of copr builds.
 
@@ -174,21 +447,20 @@ def update_copr_builds(build_id: int, builds: Iterable["CoprBuildTargetModel"])
     Args:
         build_id: ID of the copr build to update.
         builds: List of builds corresponding to the given ``build_id``.
+        build_data: Data of the build fetched from Copr.
 
     Returns:
         Whether the run was successful and the build has ended,
         False signals the need to retry again.
     """
-    copr_client = CoprClient.create_from_config_file()
-    try:
-        build_copr = copr_client.build_proxy.get(build_id)
-    except copr.v3.CoprNoResultException:
+    build_copr = build_data.build
+    if not build_copr:
         logger.info(
             f"Copr build {build_id} no longer available. Setting it to error status and "
             f"not checking it anymore."
         )
         for build in builds:
-            build.set_status(BuildStatus.error)
+            build.update(status=BuildStatus.error)
         return True
 
     if not build_copr.ended_on and not build_copr.started_on:
@@ -206,7 +478,7 @@ def update_copr_builds(build_id: int, builds: Iterable["CoprBuildTargetModel"])
                 f"{elapsed}s, probably an internal error"
                 f"occurred. Not checking it anymore."
             )
-            build.set_status(BuildStatus.error)
+            build.update(status=BuildStatus.error)
             continue
         if build.status not in (BuildStatus.pending, BuildStatus.waiting_for_srpm):
             logger.info(
@@ -214,7 +486,9 @@ def update_copr_builds(build_id: int, builds: Iterable["CoprBuildTargetModel"])
                 "things were taken care of already, skipping."
             )
             continue
-        chroot_build = copr_client.build_chroot_proxy.get(build_id, build.target)
+        if not (chroot_build := build_data.chroots.get(build.target)):
+            logger.info(f"No data for chroot {build.target} of build {build_id}.")
+            continue
         update_copr_build_state(build, build_copr, chroot_build)
     # Builds which we ran CoprBuildStartHandler for still need to be monitored.
     return bool(build_copr.ended_on)
@@ -285,3 +559,197 @@ def update_copr_build_state(
         )
         if handler.pre_check(package_config, job_config, event_dict):
             handler.run()
+
+
+class KojiHubTransport(xmlrpc.client.Transport):
+    """
+    Transport of the Koji hub client with a timeout of the connection,
+    so that an unresponsive hub doesn't block the babysit task forever.
+    """
+
+    def __init__(self, timeout: float, **kwargs):
+        super().__init__(**kwargs)
+        self.timeout = timeout
+
+    def make_connection(self, host) -> HTTPConnection:
+        connection = super().make_connection(host)
+        # applies to connecting and to every read from the socket
+        connection.timeout = self.timeout
+        return connection
+
+
+class KojiHubSafeTransport(KojiHubTransport, xmlrpc.client.SafeTransport):
+    """HTTPS variant of `KojiHubTransport`."""
+
+
+def get_koji_hub() -> xmlrpc.client.ServerProxy:
+    """
+    Returns the XML-RPC client of the Koji hub.
+
+    The client is created once per process and reused, so that its connection
+    is kept alive between the calls. The requests time out after
+    `KOJI_HUB_TIMEOUT` seconds.
+    """
+    global _koji_hub
+    if _koji_hub is None:
+        url = ServiceConfig.get_service_config().koji_hub_url
+        transport_kls = (
+            KojiHubSafeTransport
+            if urlsplit(url).scheme == "https"
+            else KojiHubTransport
+        )
+        _koji_hub = xmlrpc.client.ServerProxy(
+            url,
+            transport=transport_kls(KOJI_HUB_TIMEOUT, use_builtin_types=True),
+            allow_none=True,
+        )
+    return _koji_hub
+
+
+def get_koji_task_infos(task_ids: Iterable[int]) -> Dict[int, Optional[dict]]:
+    """
+    Fetches the info about the Koji tasks using the multicall of the Koji hub,
+    i.e. in one request per `KOJI_MULTICALL_BATCH_SIZE` tasks.
+
+    Args:
+        task_ids: IDs of the Koji tasks.
+
+    Returns:
+        Info about each task (with its `state`, `start_ts` and `completion_ts`),
+        `None` if the task doesn't exist or its info couldn't be obtained.
+    """
+    hub = get_koji_hub()
+    task_ids = iter(task_ids)
+    infos: Dict[int, Optional[dict]] = {}
+    while batch := list(islice(task_ids, KOJI_MULTICALL_BATCH_SIZE)):
+        results = hub.multiCall(
+            [{"methodName": "getTaskInfo", "params": [task_id]} for task_id in batch]
+        )
+        for task_id, result in zip(batch, results):
+            # successful calls return a list with the result, failed ones a fault
+            if isinstance(result, dict):
+                logger.warning(
+                    f"Failed to obtain info about Koji task {task_id}: "
+                    f"{result.get('faultString')}"
+                )
+                infos[task_id] = None
+            else:
+                infos[task_id] = result[0]
+    return infos
+
+
+def check_pending_koji_builds() -> None:
+    """
+    Checks the state of the pending Koji builds and updates it if needed.
+
+    The builds which have timed out are set to error at once beforehand,
+    so that only the live ones are checked.
+
+    The info about all the Koji tasks is fetched in a batched multicall.
+    The builds without a valid task ID and those whose tasks no longer exist
+    are set to error at once, `KojiTaskReportHandler` is run only for the builds
+    whose state has changed.
+    """
+    if timed_out := KojiBuildTargetModel.mark_timed_out_as_error(
+        timedelta(seconds=DEFAULT_JOB_TIMEOUT), *KOJI_PENDING_STATUSES
+    ):
+        logger.info(
+            f"Koji builds {timed_out} have been pending for more than "
+            f"{DEFAULT_JOB_TIMEOUT}s, probably an internal error occurred. "
+            "Not checking them anymore."
+        )
+
+    builds_grouped_by_task_id = collections.defaultdict(list)
+    invalid = []
+    for build in KojiBuildTargetModel.get_all_by_status(*KOJI_PENDING_STATUSES):
+        if build.build_id and build.build_id.isdigit():
+            builds_grouped_by_task_id[int(build.build_id)].append(build)
+        else:
+            invalid.append(build.id)
+
+    if invalid:
+        logger.warning(
+            f"Koji builds {invalid} have no valid task ID. "
+            "Setting them to error status and not checking them anymore."
+        )
+        KojiBuildTargetModel.set_status_of_builds(invalid, BuildStatus.error)
+
+    if not builds_grouped_by_task_id:
+        return
+
+    start = datetime.now(timezone.utc)
+    try:
+        task_infos = get_koji_task_infos(builds_grouped_by_task_id)
+    except (OSError, xmlrpc.client.Error) as ex:
+        logger.warning(f"Failed to obtain state of Koji builds: {ex!r}")
+        return
+
+    if missing := [
+        build.id
+        for task_id, info in task_infos.items()
+        if info is None
+        for build in builds_grouped_by_task_id[task_id]
+    ]:
+        logger.info(
+            f"Koji tasks of builds {missing} no longer available. "
+            "Setting them to error status and not checking them anymore."
+        )
+        KojiBuildTargetModel.set_status_of_builds(missing, BuildStatus.error)
+
+    changed = 0
+    for task_id, info in task_infos.items():
+        if info is None:
+            continue
+        builds = builds_grouped_by_task_id[task_id]
+        state = KOJI_TASK_STATES.get(info["state"])
+        if state is None:
+            logger.warning(
+                f"Unknown state {info['state']!r} of Koji task {task_id}, skipping it."
+            )
+            continue
+        new_status = KOJI_TASK_STATE_TO_COMMIT_STATUS[state]
+        if not new_status or all(build.status == new_status.value for build in builds):
+            continue
+        changed += 1
+        update_koji_build_state(
+            KojiTaskEvent(
+                build_id=task_id,
+                state=state,
+                old_state=KOJI_PENDING_STATUSES[builds[0].status],
+                start_time=info.get("start_ts"),
+                completion_time=info.get("completion_ts"),
+            )
+        )
+
+    elapsed = elapsed_seconds(begin=start, end=datetime.now(timezone.utc))
+    logger.info(
+        f"Checked {len(task_infos)} Koji tasks in {elapsed:.2f}s, "
+        f"{changed} of them changed their state."
+    )
+
+
+def update_koji_build_state(event: KojiTaskEvent) -> None:
+    """
+    Updates the state of the Koji build using `KojiTaskReportHandler`.
+
+    Args:
+        event: Event for the new state of the Koji task of the build.
+    """
+    package_config = event.get_package_config()
+    if not package_config:
+        logger.info(f"No config found for Koji task {event.build_id}. Skipping.")
+        return
+
+    job_configs = SteveJobs(event).get_config_for_handler_kls(
+        handler_kls=KojiTaskReportHandler,
+    )
+
+    event_dict = event.get_dict()
+    for job_config in job_configs:
+        handler = KojiTaskReportHandler(
+            package_config=package_config,
+            job_config=job_config,
+            event=event_dict,
+        )
+        if handler.pre_check(package_config, job_config, event_dict):
+            handler.run()
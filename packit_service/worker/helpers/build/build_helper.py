@@ -2,9 +2,10 @@
 # SPDX-License-Identifier: MIT
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 
 from kubernetes.client.rest import ApiException
 from ogr.abstract import GitProject
@@ -17,7 +18,13 @@ from packit.exceptions import PackitMergeException
 from packit.utils import PackitFormatter
 from packit_service import sentry_integration
 from packit_service.config import ServiceConfig
-from packit_service.models import PipelineModel, SRPMBuildModel, BuildStatus
+from packit_service.constants import REPORTING_CONCURRENCY
+from packit_service.models import (
+    PipelineModel,
+    SRPMBuildModel,
+    BuildStatus,
+    end_session,
+)
 from packit_service.service.urls import get_srpm_build_info_url
 from packit_service.trigger_mapping import are_job_types_same
 from packit_service.worker.events import EventData
@@ -29,6 +36,14 @@ from packit_service.worker.result import TaskResults
 logger = logging.getLogger(__name__)
 
 
+class ChrootStatus(NamedTuple):
+    """Status to be reported for the build (and the tests) of a chroot."""
+
+    state: BaseCommitStatus
+    description: str
+    url: str = ""
+
+
 class BaseBuildJobHelper(BaseJobHelper):
     job_type_build: Optional[JobType] = None
     job_type_test: Optional[JobType] = None
@@ -615,6 +630,64 @@ class BaseBuildJobHelper(BaseJobHelper):
             markdown_content=markdown_content,
         )
 
+    def report_status_to_all_for_chroots(
+        self, statuses: Dict[str, ChrootStatus]
+    ) -> None:
+        """
+        Report the statuses for multiple chroots concurrently.
+
+        All the statuses are attempted, the first error is raised afterwards.
+
+        Args:
+            statuses: Status to be reported for each chroot.
+        """
+        if len(statuses) <= 1:
+            for chroot, status in statuses.items():
+                self.report_status_to_all_for_chroot(
+                    state=status.state,
+                    description=status.description,
+                    url=status.url,
+                    chroot=chroot,
+                )
+            return
+
+        # resolve the (lazy) status reporter before the threads need it
+        _ = self.status_reporter
+
+        error = None
+        with ThreadPoolExecutor(
+            max_workers=min(REPORTING_CONCURRENCY, len(statuses))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._report_status_to_all_for_chroot_in_thread,
+                    state=status.state,
+                    description=status.description,
+                    url=status.url,
+                    chroot=chroot,
+                )
+                for chroot, status in statuses.items()
+            ]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as ex:
+                    logger.debug(f"Failed to report status: {ex!r}")
+                    error = error or ex
+
+        if error:
+            raise error
+
+    def _report_status_to_all_for_chroot_in_thread(self, **kwargs) -> None:
+        """
+        Report the status for the chroot in a thread of
+        `report_status_to_all_for_chroots`, which ends its own DB session.
+        """
+        try:
+            self.report_status_to_all_for_chroot(**kwargs)
+        finally:
+            end_session()
+
     def run_build(
         self, target: Optional[str] = None
     ) -> Tuple[Optional[int], Optional[str]]:
@@ -2,8 +2,9 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from re import search
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from ogr.abstract import GitProject
 from packit.config import JobConfig, JobType
@@ -12,14 +13,17 @@ from packit.config.package_config import PackageConfig
 from packit.exceptions import PackitCommandFailedError
 from packit_service import sentry_integration
 from packit_service.config import ServiceConfig
-from packit_service.constants import MSG_RETRIGGER
-from packit_service.models import KojiBuildTargetModel, BuildStatus
+from packit_service.constants import KOJI_BUILD_SUBMIT_CONCURRENCY, MSG_RETRIGGER
+from packit_service.models import KojiBuildTargetModel, BuildStatus, end_session
 from packit_service.worker.events import EventData
 from packit_service.service.urls import (
     get_koji_build_info_url,
     get_srpm_build_info_url,
 )
-from packit_service.worker.helpers.build.build_helper import BaseBuildJobHelper
+from packit_service.worker.helpers.build.build_helper import (
+    BaseBuildJobHelper,
+    ChrootStatus,
+)
 from packit_service.worker.result import TaskResults
 from packit_service.worker.reporting import BaseCommitStatus
 
@@ -114,50 +118,61 @@ class KojiBuildJobHelper(BaseBuildJobHelper):
             return TaskResults(success=False, details={"msg": msg})
 
         errors: Dict[str, str] = {}
+        statuses: Dict[str, ChrootStatus] = {}
+        targets = []
         for target in self.build_targets:
-
             if target not in self.supported_koji_targets:
                 msg = f"Target not supported: {target}"
-                self.report_status_to_all_for_chroot(
+                statuses[target] = ChrootStatus(
                     state=BaseCommitStatus.error,
                     description=msg,
                     url=get_srpm_build_info_url(self.srpm_model.id),
-                    chroot=target,
                 )
                 errors[target] = msg
                 continue
+            targets.append(target)
 
-            try:
-                build_id, web_url = self.run_build(target=target)
-            except Exception as ex:
-                sentry_integration.send_to_sentry(ex)
+        builds = []
+        for target, result in zip(targets, self.submit_builds(targets)):
+            if isinstance(result, Exception):
+                sentry_integration.send_to_sentry(result)
                 # TODO: Where can we show more info about failure?
                 # TODO: Retry
-                self.report_status_to_all_for_chroot(
+                statuses[target] = ChrootStatus(
                     state=BaseCommitStatus.error,
-                    description=f"Submit of the build failed: {ex}",
+                    description=f"Submit of the build failed: {result}",
                     url=get_srpm_build_info_url(self.srpm_model.id),
-                    chroot=target,
                 )
-                errors[target] = str(ex)
+                errors[target] = str(result)
                 continue
+            build_id, web_url = result
+            if build_id is None:
+                msg = "Koji task ID not found in the output of the build submit."
+                statuses[target] = ChrootStatus(
+                    state=BaseCommitStatus.error,
+                    description=msg,
+                    url=get_srpm_build_info_url(self.srpm_model.id),
+                )
+                errors[target] = msg
+                continue
+            builds.append((target, str(build_id), web_url))
 
-            koji_build = KojiBuildTargetModel.create(
-                build_id=str(build_id),
+        if builds:
+            koji_builds = KojiBuildTargetModel.create_for_targets(
+                builds=builds,
                 commit_sha=self.metadata.commit_sha,
-                web_url=web_url,
-                target=target,
                 status="pending",
                 scratch=self.is_scratch,
                 run_model=self.run_model,
             )
-            url = get_koji_build_info_url(id_=koji_build.id)
-            self.report_status_to_all_for_chroot(
-                state=BaseCommitStatus.running,
-                description="Building RPM ...",
-                url=url,
-                chroot=target,
-            )
+            for (target, _, _), koji_build in zip(builds, koji_builds):
+                statuses[target] = ChrootStatus(
+                    state=BaseCommitStatus.running,
+                    description="Building RPM ...",
+                    url=get_koji_build_info_url(id_=koji_build.id),
+                )
+
+        self.report_status_to_all_for_chroots(statuses)
 
         if errors:
             return TaskResults(
@@ -168,16 +183,56 @@ class KojiBuildJobHelper(BaseBuildJobHelper):
                 },
             )
 
-        # TODO: release the hounds!
+        # the builds are checked periodically by babysit_pending_koji_builds
+        # in case the fedmsg about their state change is lost
+        return TaskResults(success=True, details={})
+
+    def submit_builds(
+        self, targets: List[str]
+    ) -> List[Union[Tuple[Optional[int], Optional[str]], Exception]]:
         """
-        celery_app.send_task(
-            "task.babysit_koji_build",
-            args=(build_metadata.build_id,),
-            countdown=120,  # do the first check in 120s
-        )
+        Submit the builds for the targets concurrently,
+        at most `KOJI_BUILD_SUBMIT_CONCURRENCY` of them at once.
+
+        Args:
+            targets: Koji targets to submit the builds for.
+
+        Returns:
+            Koji task ID and web URL of the build for each target (in the same
+            order), or the exception raised when submitting it.
         """
+        if len(targets) <= 1:
+            results = []
+            for target in targets:
+                try:
+                    results.append(self.run_build(target=target))
+                except Exception as ex:
+                    results.append(ex)
+            return results
 
-        return TaskResults(success=True, details={})
+        # resolve the (lazy) upstream and SRPM before the threads need them
+        _ = self.api.up, self.srpm_path
+
+        with ThreadPoolExecutor(
+            max_workers=min(KOJI_BUILD_SUBMIT_CONCURRENCY, len(targets))
+        ) as executor:
+            futures = [
+                executor.submit(self._run_build_in_thread, target=target)
+                for target in targets
+            ]
+        return [future.exception() or future.result() for future in futures]
+
+    def _run_build_in_thread(
+        self, target: Optional[str] = None
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Submit the build in a thread of `submit_builds`,
+        which ends its own DB session.
+        """
+        try:
+            return self.run_build(target=target)
+        finally:
+            end_session()
 
     def run_build(
         self, target: Optional[str] = None
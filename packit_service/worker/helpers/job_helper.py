@@ -147,6 +147,7 @@ class BaseJobHelper:
                 packit_user=self.service_config.get_github_account_name(),
                 trigger_id=trigger.id if trigger else None,
                 pr_id=self.metadata.pr_id,
+                project_url=self.metadata.project_url,
             )
         return self._status_reporter
 
@@ -55,7 +55,7 @@ from packit_service.worker.helpers.build import (
 )
 from packit_service.worker.helpers.propose_downstream import ProposeDownstreamJobHelper
 from packit_service.worker.helpers.testing_farm import TestingFarmJobHelper
-from packit_service.worker.monitoring import Pushgateway
+from packit_service.worker.monitoring import pushgateway
 from packit_service.worker.parser import Parser
 from packit_service.worker.reporting import BaseCommitStatus
 from packit_service.worker.result import TaskResults
@@ -120,17 +120,20 @@ class SteveJobs:
         return self._service_config
 
     @staticmethod
-    def process_message(event: dict) -> List[TaskResults]:
+    def process_message(
+        event: dict, event_type: Optional[str] = None
+    ) -> List[TaskResults]:
         """
         Entrypoint for message processing.
 
         Args:
             event:  dict with webhook/fed-mes payload
+            event_type: type of the event if known upfront (webhook header)
 
         Returns:
             List of results of the processing tasks.
         """
-        event_object: Any = Parser.parse_event(event)
+        event_object: Any = Parser.parse_event(event, event_type=event_type)
 
         if not (event_object and event_object.pre_check()):
             return []
@@ -172,7 +175,7 @@ class SteveJobs:
             self.event, IssueCommentEvent
         ) and self.is_fas_verification_comment(self.event.comment):
             if GithubFasVerificationHandler.pre_check(
-                package_config=None, job_config=None, event=self.event.get_dict()
+                package_config=None, job_config=None, event=self.event.get_cached_dict()
             ):
                 self.event.comment_object.add_reaction(COMMENT_REACTION)
                 GithubFasVerificationHandler.get_signature(
@@ -214,7 +217,7 @@ class SteveJobs:
             "service_config": self.service_config,
             "package_config": self.event.package_config,
             "project": self.event.project,
-            "metadata": EventData.from_event_dict(self.event.get_dict()),
+            "metadata": EventData.from_event_dict(self.event.get_cached_dict()),
             "db_trigger": self.event.db_trigger,
             "job_config": job_config,
         }
@@ -413,7 +416,7 @@ class SteveJobs:
         if not handler_kls.pre_check(
             package_config=self.event.package_config,
             job_config=job_config,
-            event=self.event.get_dict(),
+            event=self.event.get_cached_dict(),
         ):
             return False
 
@@ -663,7 +666,6 @@ class SteveJobs:
             handler_kls: The class for the Handler that will handle the job.
             number_of_build_targets: Number of build targets in case of CoprBuildHandler.
         """
-        pushgateway = Pushgateway()
         response_time = elapsed_seconds(
             begin=self.event.created_at, end=task_accepted_time
         )
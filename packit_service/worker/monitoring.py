@@ -3,13 +3,40 @@
 
 import logging
 import os
+import threading
+import time
+from typing import Optional
 
-from prometheus_client import CollectorRegistry, Counter, push_to_gateway, Histogram
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    push_to_gateway,
+    Histogram,
+    multiprocess,
+    start_http_server,
+)
+
+from packit_service.constants import PUSHGATEWAY_FLUSH_INTERVAL
 
 logger = logging.getLogger(__name__)
 
 
 class Pushgateway:
+    """
+    Metrics of the worker process.
+
+    The metrics are kept in memory for the whole life of the process
+    (use the `pushgateway` instance) and are either pushed to the pushgateway
+    by a background thread or, if METRICS_PORT is set, served on that port
+    for Prometheus to scrape them.
+
+    The metrics are served by the main worker process. With the prefork pool,
+    the tasks run in the child processes, their metrics are served only
+    in the multiprocess mode of prometheus_client (enabled by setting
+    the `PROMETHEUS_MULTIPROC_DIR` environment variable).
+    """
+
     def __init__(self):
         self.pushgateway_address = os.getenv(
             "PUSHGATEWAY_ADDRESS", "http://pushgateway"
@@ -17,8 +44,16 @@ class Pushgateway:
         # so that workers don't overwrite each other's metrics,
         # the job name corresponds to worker name (e.g. packit-worker-0)
         self.worker_name = os.getenv("HOSTNAME")
+        self.metrics_port = os.getenv("METRICS_PORT")
+        self.multiprocess = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
         self.registry = CollectorRegistry()
 
+        self._lock = threading.Lock()
+        # set when there are changes which were not pushed yet
+        self._pending = threading.Event()
+        # threads don't survive forking, remember in which process they run
+        self._flusher_pid: Optional[int] = None
+
         # metrics
         self.copr_builds_queued = Counter(
             "copr_builds_queued",
@@ -116,12 +151,113 @@ class Pushgateway:
             ),
         )
 
+        self.package_config_cache_hits = Counter(
+            "package_config_cache_hits",
+            "Number of package configs found in the cache",
+            registry=self.registry,
+        )
+
+        self.package_config_cache_misses = Counter(
+            "package_config_cache_misses",
+            "Number of package configs not found in the cache",
+            registry=self.registry,
+        )
+
+        self.queue_length = Gauge(
+            "queue_length",
+            "Number of tasks waiting in the queue",
+            ["queue"],
+            registry=self.registry,
+            multiprocess_mode="livemax",
+        )
+
+        self.task_wait_time = Histogram(
+            "task_wait_time",
+            "Time the task waited in the queue before a worker started it",
+            ["queue"],
+            registry=self.registry,
+            buckets=(1, 5, 15, 60, 5 * 60, 15 * 60, 3600, float("inf")),
+        )
+
+    def start(self):
+        """
+        Start serving the metrics on METRICS_PORT if it is set.
+
+        To be called once, in the main worker process.
+        """
+        if not self.metrics_port:
+            return
+
+        registry = self.registry
+        if self.multiprocess:
+            # collects the metrics of all the worker processes
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+
+        logger.info(f"Serving the metrics on port {self.metrics_port}.")
+        try:
+            start_http_server(int(self.metrics_port), registry=registry)
+        except OSError as ex:
+            logger.error(
+                f"Failed to serve the metrics on port {self.metrics_port}: {ex!r}"
+            )
+
+    def mark_process_dead(self, pid: int):
+        """
+        Remove the live metrics (gauges) of the exited worker process
+        in the multiprocess mode.
+        """
+        if self.metrics_port and self.multiprocess:
+            multiprocess.mark_process_dead(pid)
+
     def push(self):
+        """
+        Schedule pushing of the metrics, doesn't wait for the push.
+
+        Pushes scheduled by the tasks finishing within PUSHGATEWAY_FLUSH_INTERVAL
+        are done at once.
+        """
+        if self.metrics_port:
+            # served (see start), Prometheus scrapes them
+            return
+
         if not (self.pushgateway_address and self.worker_name):
             logger.debug("Pushgateway address or worker name not defined.")
             return
 
+        self._pending.set()
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            threading.Thread(
+                target=self._flush_periodically, name="pushgateway", daemon=True
+            ).start()
+            self._flusher_pid = os.getpid()
+
+    def _flush_periodically(self):
+        while True:
+            self._pending.wait()
+            self.flush()
+            time.sleep(PUSHGATEWAY_FLUSH_INTERVAL)
+
+    def flush(self):
+        """
+        Push the metrics right away if there are changes which were not pushed yet.
+        """
+        if not self._pending.is_set():
+            return
+
+        self._pending.clear()
         logger.info("Pushing the metrics to pushgateway.")
-        push_to_gateway(
-            self.pushgateway_address, job=self.worker_name, registry=self.registry
-        )
+        try:
+            push_to_gateway(
+                self.pushgateway_address, job=self.worker_name, registry=self.registry
+            )
+        except Exception as ex:
+            logger.warning(f"Failed to push the metrics to pushgateway: {ex!r}")
+            # try again with the next flush
+            self._pending.set()
+
+
+# metrics of this worker process
+pushgateway = Pushgateway()
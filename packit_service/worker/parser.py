@@ -7,7 +7,7 @@ Parser is transforming github JSONs into `events` objects
 import logging
 from datetime import datetime, timezone
 from os import getenv
-from typing import Optional, Type, Union, Dict, Any, Tuple
+from typing import Optional, Type, Union, Dict, Any, Tuple, Callable
 
 from ogr.parsing import parse_git_repo
 from packit.constants import PROD_DISTGIT_URL
@@ -63,6 +63,8 @@ from packit_service.worker.helpers.testing_farm import TestingFarmJobHelper
 
 logger = logging.getLogger(__name__)
 
+EventParser = Callable[[dict], Optional[Any]]
+
 
 class Parser:
     """
@@ -73,6 +75,7 @@ class Parser:
     @staticmethod
     def parse_event(
         event: dict,
+        event_type: Optional[str] = None,
     ) -> Optional[
         Union[
             PullRequestGithubEvent,
@@ -106,7 +109,12 @@ class Parser:
         See: https://github.com/packit/packit-service-fedmsg/blob/
              e53586bf7ace0c46fd6812fe8dc11491e5e6cf41/packit_service_fedmsg/consumer.py#L137
 
+        The parsers to try are picked by the type of the event
+        (see `Parser.get_parsers`), only unknown events go through all of them.
+
         :param event: JSON from GitHub/GitLab
+        :param event_type: value of the X-GitHub-Event/X-Gitlab-Event header
+            if the event came through our webhook
         :return: event object
         """
 
@@ -114,36 +122,67 @@ class Parser:
             logger.warning("No event to process!")
             return None
 
-        for response in map(
-            lambda parser: parser(event),
-            (
-                Parser.parse_pr_event,
-                Parser.parse_pull_request_comment_event,
-                Parser.parse_issue_comment_event,
-                Parser.parse_release_event,
-                Parser.parse_github_push_event,
-                Parser.parse_check_rerun_event,
-                Parser.parse_installation_event,
-                Parser.parse_push_pagure_event,
-                Parser.parse_testing_farm_results_event,
-                Parser.parse_copr_event,
-                Parser.parse_mr_event,
-                Parser.parse_koji_task_event,
-                Parser.parse_koji_build_event,
-                Parser.parse_merge_request_comment_event,
-                Parser.parse_gitlab_issue_comment_event,
-                Parser.parse_gitlab_push_event,
-                Parser.parse_pipeline_event,
-                Parser.parse_pagure_pr_flag_event,
-                Parser.parse_pagure_pull_request_comment_event,
-            ),
-        ):
-            if response:
+        for parser in Parser.get_parsers(event, event_type):
+            if response := parser(event):
                 return response
 
         logger.debug("We don't process this event.")
         return None
 
+    @staticmethod
+    def get_event_type(event: dict) -> Optional[str]:
+        """
+        Get the type of the event from its payload in case we have not received it
+        alongside the event (e.g. from the webhook headers).
+
+        Args:
+            event: JSON from GitHub/GitLab/fedmsg/Testing Farm.
+
+        Returns:
+            Fedmsg topic, name of the GitLab webhook event, `testing-farm`
+            or `None` if the type cannot be determined from the payload.
+        """
+        if topic := event.get("topic"):
+            return topic
+
+        if event.get("source") == "testing-farm":
+            return "testing-farm"
+
+        if object_kind := event.get("object_kind"):
+            return MAP_GITLAB_OBJECT_KIND_TO_EVENT_TYPE.get(object_kind)
+
+        return None
+
+    @staticmethod
+    def get_parsers(
+        event: dict, event_type: Optional[str] = None
+    ) -> Tuple[EventParser, ...]:
+        """
+        Pick the parsers that can process the given event.
+
+        Args:
+            event: JSON from GitHub/GitLab/fedmsg/Testing Farm.
+            event_type: Value of the X-GitHub-Event/X-Gitlab-Event header.
+
+        Returns:
+            Parsers that should be tried, in this order.
+        """
+        event_type_from_header = event_type
+        event_type = event_type or Parser.get_event_type(event)
+
+        if event_type in MAP_EVENT_TYPE_TO_PARSERS:
+            return MAP_EVENT_TYPE_TO_PARSERS[event_type]
+
+        if event_type_from_header:
+            logger.debug(f"No parser for the {event_type_from_header!r} event.")
+            return ()
+
+        if event.get("topic"):
+            # fedmsg topics we don't know exactly, e.g. other Pagure PR flag actions
+            return FEDMSG_PARSERS
+
+        return PARSERS
+
     @staticmethod
     def parse_mr_event(event) -> Optional[MergeRequestGitlabEvent]:
         """Look into the provided event and see if it's one for a new gitlab MR."""
@@ -1292,3 +1331,90 @@ class Parser:
             comment=comment,
             comment_id=comment_id,
         )
+
+
+# all the parsers in the order they are tried for events of an unknown type
+PARSERS: Tuple[EventParser, ...] = (
+    Parser.parse_pr_event,
+    Parser.parse_pull_request_comment_event,
+    Parser.parse_issue_comment_event,
+    Parser.parse_release_event,
+    Parser.parse_github_push_event,
+    Parser.parse_check_rerun_event,
+    Parser.parse_installation_event,
+    Parser.parse_push_pagure_event,
+    Parser.parse_testing_farm_results_event,
+    Parser.parse_copr_event,
+    Parser.parse_mr_event,
+    Parser.parse_koji_task_event,
+    Parser.parse_koji_build_event,
+    Parser.parse_merge_request_comment_event,
+    Parser.parse_gitlab_issue_comment_event,
+    Parser.parse_gitlab_push_event,
+    Parser.parse_pipeline_event,
+    Parser.parse_pagure_pr_flag_event,
+    Parser.parse_pagure_pull_request_comment_event,
+)
+
+FEDMSG_PARSERS: Tuple[EventParser, ...] = (
+    Parser.parse_push_pagure_event,
+    Parser.parse_copr_event,
+    Parser.parse_koji_task_event,
+    Parser.parse_koji_build_event,
+    Parser.parse_pagure_pr_flag_event,
+    Parser.parse_pagure_pull_request_comment_event,
+)
+
+# X-Gitlab-Event header values for the `object_kind` in the GitLab payload
+MAP_GITLAB_OBJECT_KIND_TO_EVENT_TYPE: Dict[str, str] = {
+    "merge_request": "Merge Request Hook",
+    "note": "Note Hook",
+    "push": "Push Hook",
+    "pipeline": "Pipeline Hook",
+}
+
+# X-GitHub-Event/X-Gitlab-Event header value or fedmsg topic -> parsers
+MAP_EVENT_TYPE_TO_PARSERS: Dict[str, Tuple[EventParser, ...]] = {
+    # GitHub
+    "pull_request": (Parser.parse_pr_event,),
+    "issue_comment": (
+        Parser.parse_pull_request_comment_event,
+        Parser.parse_issue_comment_event,
+    ),
+    "release": (Parser.parse_release_event,),
+    "push": (Parser.parse_github_push_event,),
+    "check_run": (Parser.parse_check_rerun_event,),
+    "installation": (Parser.parse_installation_event,),
+    # GitLab
+    "Merge Request Hook": (Parser.parse_mr_event,),
+    "Note Hook": (
+        Parser.parse_merge_request_comment_event,
+        Parser.parse_gitlab_issue_comment_event,
+    ),
+    "Push Hook": (Parser.parse_gitlab_push_event,),
+    "Pipeline Hook": (Parser.parse_pipeline_event,),
+    # Testing Farm
+    "testing-farm": (Parser.parse_testing_farm_results_event,),
+    # fedmsg
+    "org.fedoraproject.prod.git.receive": (Parser.parse_push_pagure_event,),
+    "org.fedoraproject.prod.copr.build.start": (Parser.parse_copr_event,),
+    "org.fedoraproject.prod.copr.build.end": (Parser.parse_copr_event,),
+    "org.fedoraproject.prod.buildsys.task.state.change": (
+        Parser.parse_koji_task_event,
+    ),
+    "org.fedoraproject.prod.buildsys.build.state.change": (
+        Parser.parse_koji_build_event,
+    ),
+    "org.fedoraproject.prod.pagure.pull-request.flag.added": (
+        Parser.parse_pagure_pr_flag_event,
+    ),
+    "org.fedoraproject.prod.pagure.pull-request.flag.updated": (
+        Parser.parse_pagure_pr_flag_event,
+    ),
+    "org.fedoraproject.prod.pagure.pull-request.comment.added": (
+        Parser.parse_pagure_pull_request_comment_event,
+    ),
+    "org.fedoraproject.prod.pagure.pull-request.comment.edited": (
+        Parser.parse_pagure_pull_request_comment_event,
+    ),
+}
@@ -1,9 +1,13 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
-from typing import Optional, Union, Dict
+from functools import lru_cache
+from os import getenv
+from typing import Any, Iterable, Optional, Union, Dict, List, Tuple
 
 from ogr.abstract import CommitStatus, GitProject
 from ogr.exceptions import GithubAPIException, GitlabAPIException
@@ -19,7 +23,10 @@ from ogr.services.pagure import PagureProject
 from packit_service.constants import (
     DOCS_URL,
     MSG_TABLE_HEADER_WITH_DETAILS,
+    REPORTED_STATUSES_TTL,
+    REPORTING_CONCURRENCY,
 )
+from packit_service.models import PostedCommentModel, end_session
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +72,97 @@ MAP_TO_CHECK_RUN: Dict[
 }
 
 
+class ReportedStatusesCache:
+    """
+    Statuses of the checks we have recently reported, kept in redis
+    shared by all the workers (enabled by setting the `REPORTED_STATUSES_REDIS`
+    environment variable).
+
+    Used to skip reporting a status that is the same as the one reported
+    before. The entries expire shortly so that a status changed in the meantime
+    by someone else (e.g. a retriggered check) is not left stale for long.
+    Only the statuses actually set on the forge are recorded.
+    """
+
+    def __init__(
+        self, ttl: int = REPORTED_STATUSES_TTL, use_redis: Optional[bool] = None
+    ):
+        self.ttl = ttl
+        self.use_redis = (
+            bool(getenv("REPORTED_STATUSES_REDIS")) if use_redis is None else use_redis
+        )
+        self._redis = None
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            # import here so that the cache can be used without redis installed
+            from redis import Redis
+
+            from packit_service.celerizer import get_redis_url
+
+            self._redis = Redis.from_url(get_redis_url())
+        return self._redis
+
+    @staticmethod
+    def _redis_key(project: str, commit_sha: str, check_name: str) -> str:
+        return f"reported-status:{project}:{commit_sha}:{check_name}"
+
+    @staticmethod
+    def _digest(status: Tuple) -> str:
+        return hashlib.sha256(repr(status).encode()).hexdigest()
+
+    def get_unreported(
+        self, project: str, commit_sha: str, check_names: List[str], status: Tuple
+    ) -> List[str]:
+        """
+        Get the checks whose last recorded status differs from the given one.
+
+        Args:
+            project: Project the checks belong to.
+            commit_sha: Commit the checks are reported for.
+            check_names: Names of the checks.
+            status: Status to be reported.
+
+        Returns:
+            Names of the checks the status needs to be reported for, all of them
+            if the cache is disabled or fails.
+        """
+        if not (self.use_redis and check_names):
+            return check_names
+
+        try:
+            digests = self.redis.mget(
+                [self._redis_key(project, commit_sha, check) for check in check_names]
+            )
+        except Exception as ex:
+            logger.warning(f"Failed to get the reported statuses from redis: {ex!r}")
+            return check_names
+
+        digest = self._digest(status).encode()
+        return [
+            check for check, reported in zip(check_names, digests) if reported != digest
+        ]
+
+    def set_reported(
+        self, project: str, commit_sha: str, check_name: str, status: Tuple
+    ) -> None:
+        if not self.use_redis:
+            return
+
+        try:
+            self.redis.setex(
+                self._redis_key(project, commit_sha, check_name),
+                self.ttl,
+                self._digest(status),
+            )
+        except Exception as ex:
+            logger.warning(f"Failed to store the reported status to redis: {ex!r}")
+
+
+reported_statuses = ReportedStatusesCache()
+
+
 class StatusReporter:
     def __init__(
         self,
@@ -73,6 +171,7 @@ class StatusReporter:
         packit_user: str,
         trigger_id: Optional[int] = None,
         pr_id: Optional[int] = None,
+        project_url: Optional[str] = None,
     ):
         logger.debug(
             f"Status reporter will report for {project}, commit={commit_sha}, pr={pr_id}"
@@ -84,6 +183,8 @@ class StatusReporter:
         self.commit_sha: str = commit_sha
         self.trigger_id: int = trigger_id
         self.pr_id: Optional[int] = pr_id
+        # used for the record of the posted comments, not kept if not set
+        self.project_url: Optional[str] = project_url
 
     @classmethod
     def get_instance(
@@ -93,6 +194,7 @@ class StatusReporter:
         packit_user: str,
         trigger_id: Optional[int] = None,
         pr_id: Optional[int] = None,
+        project_url: Optional[str] = None,
     ) -> "StatusReporter":
         """
         Get the StatusReporter instance.
@@ -104,7 +206,9 @@ class StatusReporter:
             reporter = StatusReporterGitlab
         elif isinstance(project, PagureProject):
             reporter = StatusReporterPagure
-        return reporter(project, commit_sha, packit_user, trigger_id, pr_id)
+        return reporter(
+            project, commit_sha, packit_user, trigger_id, pr_id, project_url
+        )
 
     @property
     def project_with_commit(self) -> GitProject:
@@ -136,7 +240,14 @@ class StatusReporter:
         url: str = "",
         links_to_external_services: Optional[Dict[str, str]] = None,
         markdown_content: str = None,
-    ):
+    ) -> bool:
+        """
+        Set the status of the check.
+
+        Returns:
+            Whether the status was set, `False` if it was only commented
+            as a fallback (or not set at all).
+        """
         raise NotImplementedError()
 
     def report(
@@ -180,15 +291,75 @@ class StatusReporter:
         elif isinstance(check_names, str):
             check_names = [check_names]
 
-        for check in check_names:
-            self.set_status(
+        project = str(self.project)
+        status = (
+            state,
+            description,
+            url,
+            tuple(links_to_external_services.items())
+            if links_to_external_services
+            else None,
+            markdown_content,
+        )
+        # the same check can be given multiple times
+        check_names = list(dict.fromkeys(check_names))
+        checks_to_report = reported_statuses.get_unreported(
+            project, self.commit_sha, check_names, status
+        )
+        if len(checks_to_report) < len(check_names):
+            logger.debug(
+                f"Status {state.name!r} already reported for "
+                f"{len(check_names) - len(checks_to_report)} check(s), skipping them."
+            )
+
+        def set_status(check: str):
+            if self.set_status(
                 state=state,
                 description=description,
                 check_name=check,
                 url=url,
                 links_to_external_services=links_to_external_services,
                 markdown_content=markdown_content,
-            )
+            ):
+                reported_statuses.set_reported(project, self.commit_sha, check, status)
+
+        if len(checks_to_report) == 1:
+            set_status(checks_to_report[0])
+        elif checks_to_report:
+            self._report_concurrently(set_status, checks_to_report)
+
+    def _report_concurrently(self, set_status, check_names: List[str]) -> None:
+        """
+        Report the statuses of the checks concurrently, the requests share
+        the connection pool of the forge client.
+
+        All the statuses are attempted, the first error is raised afterwards.
+        """
+        # resolve the (lazy) project before the threads need it
+        _ = self.project_with_commit
+
+        def set_status_in_thread(check: str):
+            try:
+                set_status(check)
+            finally:
+                # the thread has its own DB session (e.g. recording the comments)
+                end_session()
+
+        error = None
+        with ThreadPoolExecutor(
+            max_workers=min(REPORTING_CONCURRENCY, len(check_names))
+        ) as executor:
+            for future in [
+                executor.submit(set_status_in_thread, check) for check in check_names
+            ]:
+                try:
+                    future.result()
+                except Exception as ex:
+                    logger.debug(f"Failed to report status: {ex!r}")
+                    error = error or ex
+
+        if error:
+            raise error
 
     @staticmethod
     def is_final_state(state: BaseCommitStatus) -> bool:
@@ -244,31 +415,73 @@ class StatusReporter:
     def get_statuses(self):
         self.project_with_commit.get_commit_statuses(commit=self.commit_sha)
 
+    def _get_comments_target(self, to_commit: bool) -> Dict[str, Any]:
+        """PR or commit the comments are added to (for the record of comments)."""
+        if to_commit or not self.pr_id:
+            return {"pr_id": None, "commit_sha": self.commit_sha}
+        return {"pr_id": self.pr_id, "commit_sha": None}
+
+    def _get_our_comments(self, check_commit: bool) -> Iterable[str]:
+        """Get bodies of our comments listed from the forge (from the newest)."""
+        comments = (
+            reversed(self.project.get_commit_comments(self.commit_sha))
+            if check_commit or not self.pr_id
+            else self.project.get_pr(pr_id=self.pr_id).get_comments(reverse=True)
+        )
+        return (
+            comment.body
+            for comment in comments
+            if comment.author.startswith(self._packit_user)
+        )
+
+    def _get_posted_comment_hashes(self, check_commit: bool) -> List[str]:
+        """
+        Get hashes of our comments (from the oldest to the newest).
+
+        Taken from the record of the posted comments if we have it,
+        otherwise the comments are listed from the forge and recorded.
+        """
+        target = self._get_comments_target(check_commit)
+        if self.project_url:
+            body_hashes = PostedCommentModel.get_body_hashes(
+                project_url=self.project_url, **target
+            )
+            if body_hashes is not None:
+                return body_hashes
+
+        body_hashes = [
+            PostedCommentModel.hash_body(body)
+            for body in self._get_our_comments(check_commit)
+        ]
+        # listed from the newest
+        body_hashes.reverse()
+
+        if self.project_url and body_hashes:
+            PostedCommentModel.add_body_hashes(
+                project_url=self.project_url, body_hashes=body_hashes, **target
+            )
+        return body_hashes
+
     def _has_identical_comment(
         self, body: str, mode: DuplicateCheckMode, check_commit: bool = False
     ) -> bool:
         """Checks if the body is the same as the last or any (based on mode) comment.
 
         Check either commit comments or PR comments (if specified).
+
+        The last comment is always looked up on the forge, our comments
+        can be posted also outside the reporter (and deleted). Any comment
+        is looked up in the record of the posted comments.
         """
         if mode == DuplicateCheckMode.do_not_check:
             return False
 
-        comments = (
-            reversed(self.project.get_commit_comments(self.commit_sha))
-            if check_commit or not self.pr_id
-            else self.project.get_pr(pr_id=self.pr_id).get_comments(reverse=True)
-        )
-        for comment in comments:
-            if comment.author.startswith(self._packit_user):
-                if mode == DuplicateCheckMode.check_last_comment:
-                    return body == comment.body
-                elif (
-                    mode == DuplicateCheckMode.check_all_comments
-                    and body == comment.body
-                ):
-                    return True
-        return False
+        if mode == DuplicateCheckMode.check_last_comment:
+            last_body = next(iter(self._get_our_comments(check_commit)), None)
+            return body == last_body
+
+        body_hashes = self._get_posted_comment_hashes(check_commit)
+        return PostedCommentModel.hash_body(body) in body_hashes
 
     def comment(
         self,
@@ -295,6 +508,16 @@ class StatusReporter:
         else:
             self.project.get_pr(pr_id=self.pr_id).comment(body=body)
 
+        if self.project_url:
+            # comments have been just listed and recorded if not recorded before
+            listed = duplicate_check == DuplicateCheckMode.check_all_comments
+            PostedCommentModel.add_body_hashes(
+                project_url=self.project_url,
+                body_hashes=[PostedCommentModel.hash_body(body)],
+                only_if_recorded=not listed,
+                **self._get_comments_target(to_commit),
+            )
+
 
 class StatusReporterPagure(StatusReporter):
     @staticmethod
@@ -314,7 +537,7 @@ class StatusReporterPagure(StatusReporter):
         url: str = "",
         links_to_external_services: Optional[Dict[str, str]] = None,
         markdown_content: str = None,
-    ):
+    ) -> bool:
         state_to_set = self.get_commit_status(state)
         logger.debug(
             f"Setting Pagure status '{state_to_set.name}' for check '{check_name}': {description}"
@@ -331,6 +554,7 @@ class StatusReporterPagure(StatusReporter):
         self.project_with_commit.set_commit_status(
             self.commit_sha, state_to_set, url, description, check_name, trim=True
         )
+        return True
 
 
 class StatusReporterGitlab(StatusReporter):
@@ -350,7 +574,7 @@ class StatusReporterGitlab(StatusReporter):
         url: str = "",
         links_to_external_services: Optional[Dict[str, str]] = None,
         markdown_content: str = None,
-    ):
+    ) -> bool:
         state_to_set = self.get_commit_status(state)
         logger.debug(
             f"Setting Gitlab status '{state_to_set.name}' for check '{check_name}': {description}"
@@ -379,6 +603,8 @@ class StatusReporterGitlab(StatusReporter):
                 )
             if e.response_code not in {400, 403, 404}:
                 raise
+            return False
+        return True
 
 
 class StatusReporterGithubStatuses(StatusReporter):
@@ -398,7 +624,7 @@ class StatusReporterGithubStatuses(StatusReporter):
         url: str = "",
         links_to_external_services: Optional[Dict[str, str]] = None,
         markdown_content: str = None,
-    ):
+    ) -> bool:
         state_to_set = self.get_commit_status(state)
         logger.debug(
             f"Setting Github status '{state_to_set.name}' for check '{check_name}': {description}"
@@ -417,6 +643,8 @@ class StatusReporterGithubStatuses(StatusReporter):
                 f" commenting on commit as a fallback: {e}"
             )
             self._add_commit_comment_with_status(state, description, check_name, url)
+            return False
+        return True
 
 
 class StatusReporterGithubChecks(StatusReporterGithubStatuses):
@@ -425,6 +653,19 @@ class StatusReporterGithubChecks(StatusReporterGithubStatuses):
     @staticmethod
     def _create_table(
         url: str, links_to_external_services: Optional[Dict[str, str]]
+    ) -> str:
+        # the same table is created for all the checks reported together
+        return StatusReporterGithubChecks._create_table_cached(
+            url,
+            tuple(links_to_external_services.items())
+            if links_to_external_services is not None
+            else None,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _create_table_cached(
+        url: str, links_to_external_services: Optional[Tuple[Tuple[str, str], ...]]
     ) -> str:
         table_content = []
         if url:
@@ -436,8 +677,7 @@ class StatusReporterGithubChecks(StatusReporterGithubStatuses):
             table_content.append(f"| {type_of_url} | {url} |\n")
         if links_to_external_services is not None:
             table_content += [
-                f"| {name} | {link} |\n"
-                for name, link in links_to_external_services.items()
+                f"| {name} | {link} |\n" for name, link in links_to_external_services
             ]
         if table_content:
             table_content += "\n"
@@ -456,7 +696,7 @@ class StatusReporterGithubChecks(StatusReporterGithubStatuses):
         url: str = "",
         links_to_external_services: Optional[Dict[str, str]] = None,
         markdown_content: str = None,
-    ):
+    ) -> bool:
         markdown_content = markdown_content or ""
         state_to_set = self.get_check_run(state)
         logger.debug(
@@ -492,3 +732,5 @@ class StatusReporterGithubChecks(StatusReporterGithubStatuses):
                 f"Failed to set status check, setting status as a fallback: {str(e)}"
             )
             super().set_status(state, description, check_name, url)
+            return False
+        return True
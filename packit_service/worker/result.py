@@ -34,7 +34,7 @@ class TaskResults(dict):
     ):
         details = {
             "msg": msg,
-            "event": event.get_dict(),
+            "event": event.get_cached_dict(),
             "package_config": dump_package_config(event.package_config),
         }
 
@@ -3,20 +3,37 @@
 
 import logging
 import socket
+import time
 from os import getenv
 from typing import List, Optional
 
-from celery import Task
-from celery.signals import after_setup_logger
+from celery import Task, states
+from celery.signals import (
+    after_setup_logger,
+    task_postrun,
+    task_prerun,
+    worker_process_shutdown,
+    worker_ready,
+    worker_shutdown,
+)
 from syslog_rfc5424_formatter import RFC5424Formatter
 
-from packit_service.celerizer import celery_app
+from packit_service.celerizer import celery_app, get_redis_url
 from packit_service.constants import (
+    CELERY_TASK_DEFAULT_QUEUE,
+    CELERY_TASK_IO_BOUND_QUEUE,
+    CELERY_TASK_LONG_RUNNING_QUEUE,
     DEFAULT_RETRY_LIMIT,
     DEFAULT_RETRY_BACKOFF,
     CELERY_DEFAULT_MAIN_TASK_NAME,
 )
 from packit_service.log_versions import log_worker_versions
+from packit_service.models import end_session
+from packit_service.payload_store import (
+    PayloadNotFoundException,
+    PayloadStoreUnavailableException,
+    payload_store,
+)
 from packit_service.utils import load_job_config, load_package_config
 from packit_service.worker.database import discard_old_srpm_build_logs, backup
 from packit_service.worker.handlers import (
@@ -42,9 +59,11 @@ from packit_service.worker.handlers.koji import KojiBuildReportHandler
 from packit_service.worker.helpers.build.babysit import (
     check_copr_build,
     check_pending_copr_builds,
+    check_pending_koji_builds,
     check_pending_testing_farm_runs,
 )
 from packit_service.worker.jobs import SteveJobs
+from packit_service.worker.monitoring import pushgateway
 from packit_service.worker.result import TaskResults
 from packit.exceptions import PackitException
 
@@ -86,6 +105,43 @@ def setup_loggers(logger, *args, **kwargs):
     log_worker_versions()
 
 
+@worker_ready.connect
+def start_metrics(*args, **kwargs):
+    pushgateway.start()
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def flush_metrics(*args, **kwargs):
+    # the metrics are pushed periodically, don't lose the last changes
+    pushgateway.flush()
+
+
+@worker_process_shutdown.connect
+def mark_metrics_process_dead(pid=None, **kwargs):
+    pushgateway.mark_process_dead(pid)
+
+
+@task_prerun.connect
+def observe_wait_time(task=None, **kwargs):
+    request = task.request
+    # the tasks with countdown/eta are supposed to wait
+    if not (sent_at := getattr(request, "sent_at", None)) or request.eta:
+        return
+    queue = (request.delivery_info or {}).get("routing_key")
+    pushgateway.task_wait_time.labels(queue=queue).observe(
+        max(time.time() - sent_at, 0)
+    )
+    pushgateway.push()
+
+
+@task_postrun.connect
+def end_database_session(state=None, **kwargs):
+    # every task works with its own session, don't leave it (and the connection)
+    # open for the next task run by this thread
+    end_session(commit=state == states.SUCCESS)
+
+
 class HandlerTaskWithRetry(Task):
     autoretry_for = (Exception,)
     retry_kwargs = {
@@ -93,12 +149,37 @@ class HandlerTaskWithRetry(Task):
     }
     retry_backoff = int(getenv("CELERY_RETRY_BACKOFF", DEFAULT_RETRY_BACKOFF))
 
+    def __call__(self, *args, **kwargs):
+        # the event and package config may be passed as references
+        # to the payload store (see JobHandler.get_signature),
+        # they are resolved before `run` so the errors are not retried automatically
+        try:
+            args = [payload_store.resolve(arg) for arg in args]
+            kwargs = {
+                key: payload_store.resolve(value) for key, value in kwargs.items()
+            }
+        except PayloadNotFoundException as ex:
+            logger.error(f"Task {self.name} can't be run, its payload is lost: {ex}")
+            raise
+        except PayloadStoreUnavailableException as ex:
+            logger.warning(f"Task {self.name} will be retried: {ex}")
+            raise self.retry(
+                exc=ex,
+                countdown=self.retry_backoff * 2**self.request.retries,
+                **self.retry_kwargs,
+            )
+        return super().__call__(*args, **kwargs)
+
 
 @celery_app.task(
     name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME, bind=True
 )
 def process_message(
-    self, event: dict, topic: str = None, source: str = None
+    self,
+    event: dict,
+    topic: str = None,
+    source: str = None,
+    event_type: Optional[str] = None,
 ) -> List[TaskResults]:
     """
     Main celery task for processing messages.
@@ -106,9 +187,10 @@ def process_message(
     :param event: event data
     :param topic: event topic
     :param source: event source
+    :param event_type: type of the event (X-GitHub-Event/X-Gitlab-Event header)
     :return: dictionary containing task results
     """
-    return SteveJobs().process_message(event=event)
+    return SteveJobs().process_message(event=event, event_type=event_type)
 
 
 @celery_app.task(
@@ -149,9 +231,7 @@ def run_copr_build_end_handler(event: dict, package_config: dict, job_config: di
     return get_handlers_task_results(handler.run_job(), event)
 
 
-@celery_app.task(
-    bind=True, name=TaskName.copr_build, base=HandlerTaskWithRetry, queue="long-running"
-)
+@celery_app.task(bind=True, name=TaskName.copr_build, base=HandlerTaskWithRetry)
 def run_copr_build_handler(self, event: dict, package_config: dict, job_config: dict):
     handler = CoprBuildHandler(
         package_config=load_package_config(package_config),
@@ -214,7 +294,6 @@ def run_testing_farm_results_handler(
     bind=True,
     name=TaskName.propose_downstream,
     base=HandlerTaskWithRetry,
-    queue="long-running",
 )
 def run_propose_downstream_handler(
     self,
@@ -233,9 +312,7 @@ def run_propose_downstream_handler(
     return get_handlers_task_results(handler.run_job(), event)
 
 
-@celery_app.task(
-    name=TaskName.upstream_koji_build, base=HandlerTaskWithRetry, queue="long-running"
-)
+@celery_app.task(name=TaskName.upstream_koji_build, base=HandlerTaskWithRetry)
 def run_koji_build_handler(event: dict, package_config: dict, job_config: dict):
     handler = KojiBuildHandler(
         package_config=load_package_config(package_config),
@@ -255,9 +332,7 @@ def run_koji_build_report_handler(event: dict, package_config: dict, job_config:
     return get_handlers_task_results(handler.run_job(), event)
 
 
-@celery_app.task(
-    name=TaskName.sync_from_downstream, base=HandlerTaskWithRetry, queue="long-running"
-)
+@celery_app.task(name=TaskName.sync_from_downstream, base=HandlerTaskWithRetry)
 def run_sync_from_downstream_handler(
     event: dict, package_config: dict, job_config: dict
 ):
@@ -273,7 +348,6 @@ def run_sync_from_downstream_handler(
     bind=True,
     name=TaskName.downstream_koji_build,
     base=HandlerTaskWithRetry,
-    queue="long-running",
 )
 def run_downstream_koji_build(
     self, event: dict, package_config: dict, job_config: dict
@@ -303,7 +377,6 @@ def run_downstream_koji_build_report(
     bind=True,
     name=TaskName.bodhi_update,
     base=HandlerTaskWithRetry,
-    queue="long-running",
 )
 def run_bodhi_update(self, event: dict, package_config: dict, job_config: dict):
     handler = CreateBodhiUpdateHandler(
@@ -319,7 +392,6 @@ def run_bodhi_update(self, event: dict, package_config: dict, job_config: dict):
     bind=True,
     name=TaskName.retrigger_bodhi_update,
     base=HandlerTaskWithRetry,
-    queue="long-running",
 )
 def run_retrigger_bodhi_update(
     self, event: dict, package_config: dict, job_config: dict
@@ -351,7 +423,28 @@ def babysit_pending_tft_runs() -> None:
     check_pending_testing_farm_runs()
 
 
+@celery_app.task
+def babysit_pending_koji_builds() -> None:
+    check_pending_koji_builds()
+
+
 @celery_app.task
 def database_maintenance() -> None:
     discard_old_srpm_build_logs()
     backup()
+
+
+@celery_app.task
+def monitor_queues() -> None:
+    # import here so that redis is not needed when the task is not run
+    from redis import Redis
+
+    redis = Redis.from_url(get_redis_url())
+    for queue in (
+        CELERY_TASK_DEFAULT_QUEUE,
+        CELERY_TASK_IO_BOUND_QUEUE,
+        CELERY_TASK_LONG_RUNNING_QUEUE,
+    ):
+        # the messages of a queue are a list with the same name in redis
+        pushgateway.queue_length.labels(queue=queue).set(redis.llen(queue))
+    pushgateway.push()
@@ -13,7 +13,14 @@ from ogr import GithubService, GitlabService, PagureService
 from packit.config import JobConfigTriggerType, JobConfig, PackageConfig
 from packit.config.common_package_config import Deployment
 from packit_service.config import ServiceConfig
-from packit_service.models import JobTriggerModelType, JobTriggerModel, BuildStatus
+from packit_service.models import (
+    JobTriggerModelType,
+    JobTriggerModel,
+    BuildStatus,
+    PostedCommentModel,
+)
+from packit_service.package_config_cache import package_config_cache
+from packit_service.worker.allowlist import allowlist_cache
 from packit_service.worker.events import (
     PullRequestGithubEvent,
     PushGitHubEvent,
@@ -53,6 +60,32 @@ def global_service_config():
     ServiceConfig.service_config = service_config
 
 
+@pytest.fixture(autouse=True)
+def clean_package_config_cache():
+    """Don't share the cached package configs between the tests."""
+    package_config_cache.clear()
+    yield
+    package_config_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clean_allowlist_cache():
+    """Load the allowlist mocked by the test."""
+    allowlist_cache.invalidate()
+    yield
+    allowlist_cache.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def no_posted_comments_record():
+    """
+    There is no database in these tests, the comments are always listed
+    from the forge unless a test mocks the record.
+    """
+    flexmock(PostedCommentModel).should_receive("get_body_hashes").and_return(None)
+    flexmock(PostedCommentModel).should_receive("add_body_hashes").and_return(None)
+
+
 @pytest.fixture()
 def dump_http_com():
     """
@@ -138,8 +171,13 @@ def srpm_build_model(
     def mock_set_url(url):
         srpm_build.url = url
 
+    def mock_update(**fields):
+        for name, value in fields.items():
+            setattr(srpm_build, name, value)
+
     srpm_build.set_status = mock_set_status
     srpm_build.set_url = mock_set_url
+    srpm_build.update = mock_update
     srpm_build.get_trigger_object = lambda: pr_model
 
     run_model = flexmock(id=3, job_trigger=trigger_model, srpm_build=srpm_build)
@@ -214,7 +252,12 @@ def copr_build_model(
     def mock_set_built_packages(built_packages):
         copr_build.built_packages = built_packages
 
+    def mock_update(**fields):
+        for name, value in fields.items():
+            setattr(copr_build, name, value)
+
     copr_build.set_status = mock_set_status
+    copr_build.update = mock_update
     copr_build._srpm_build_for_mocking = srpm_build
     copr_build.get_trigger_object = lambda: pr_model
     copr_build.get_srpm_build = lambda: srpm_build
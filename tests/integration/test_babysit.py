@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: MIT
 
 import datetime
+import threading
+import time
+from xmlrpc.server import SimpleXMLRPCServer
 
 import pytest
 import requests
@@ -17,18 +20,29 @@ from packit.config import (
     PackageConfig,
 )
 from packit.copr_helper import CoprHelper
+from packit_service.config import ServiceConfig
+from packit_service.constants import DEFAULT_JOB_TIMEOUT, KojiTaskState
 from packit_service.models import (
     CoprBuildTargetModel,
     JobTriggerModelType,
+    KojiBuildTargetModel,
     TFTTestRunTargetModel,
     TestingFarmResult,
     BuildStatus,
 )
-from packit_service.worker.events import AbstractCoprBuildEvent, TestingFarmResultsEvent
+from packit_service.worker.events import (
+    AbstractCoprBuildEvent,
+    KojiTaskEvent,
+    TestingFarmResultsEvent,
+)
 from packit_service.worker.helpers.build.babysit import (
+    CoprBuildData,
     check_copr_build,
+    get_copr_build_data,
+    get_koji_task_infos,
     update_copr_builds,
     check_pending_copr_builds,
+    check_pending_koji_builds,
     check_pending_testing_farm_runs,
 )
 from packit_service.worker.handlers import (
@@ -48,7 +62,15 @@ def test_check_copr_build_no_build():
 def test_check_copr_build_not_started():
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_build_id").with_args(
         1
-    ).and_return([flexmock()])
+    ).and_return(
+        [
+            flexmock(
+                status=BuildStatus.pending,
+                target="the-target",
+                build_submitted_time=datetime.datetime.utcnow(),
+            )
+        ]
+    )
     flexmock(Client).should_receive("create_from_config_file").and_return(
         flexmock(
             build_proxy=flexmock()
@@ -340,6 +362,9 @@ def test_check_copr_build_waiting_already_started():
 
 
 def test_check_copr_build_not_exists():
+    flexmock(CoprBuildTargetModel).should_receive("mark_timed_out_as_error").and_return(
+        []
+    )
     flexmock(Client).should_receive("create_from_config_file").and_return(
         flexmock(
             build_proxy=flexmock()
@@ -351,8 +376,15 @@ def test_check_copr_build_not_exists():
     )
     builds = []
     for i in range(2):
-        builds.append(flexmock(status=BuildStatus.pending, build_id=1))
-        builds[i].should_receive("set_status").with_args(BuildStatus.error).once()
+        builds.append(
+            flexmock(
+                status=BuildStatus.pending,
+                build_id=1,
+                target=f"target-{i}",
+                build_submitted_time=datetime.datetime.utcnow(),
+            )
+        )
+        builds[i].should_receive("update").with_args(status=BuildStatus.error).once()
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
         BuildStatus.pending
     ).and_return(builds)
@@ -388,7 +420,7 @@ def test_check_update_copr_builds_timeout():
         build_id=1,
         build_submitted_time=datetime.datetime.utcnow() - datetime.timedelta(weeks=2),
     )
-    build.should_receive("set_status").with_args(BuildStatus.error).once()
+    build.should_receive("update").with_args(status=BuildStatus.error).once()
 
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
         BuildStatus.pending
@@ -396,7 +428,22 @@ def test_check_update_copr_builds_timeout():
     update_copr_builds(1, [build])
 
 
+def test_check_pending_copr_builds_timeout():
+    flexmock(CoprBuildTargetModel).should_receive("mark_timed_out_as_error").with_args(
+        datetime.timedelta(seconds=DEFAULT_JOB_TIMEOUT)
+    ).and_return([1, 2]).once()
+    # the timed out builds are not pending anymore
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
+        BuildStatus.pending
+    ).and_return([]).once()
+    flexmock(Client).should_receive("create_from_config_file").never()
+    check_pending_copr_builds()
+
+
 def test_check_pending_copr_builds_no_builds():
+    flexmock(CoprBuildTargetModel).should_receive("mark_timed_out_as_error").and_return(
+        []
+    )
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
         BuildStatus.pending
     ).and_return([])
@@ -407,27 +454,92 @@ def test_check_pending_copr_builds_no_builds():
 
 
 def test_check_pending_copr_builds():
-    build1 = flexmock(status=BuildStatus.pending, build_id=1)
-    build2 = flexmock(status=BuildStatus.pending, build_id=2)
-    build3 = flexmock(status=BuildStatus.pending, build_id=1)
+    flexmock(CoprBuildTargetModel).should_receive("mark_timed_out_as_error").and_return(
+        []
+    )
+    now = datetime.datetime.utcnow()
+    build1 = flexmock(
+        status=BuildStatus.pending,
+        build_id=1,
+        target="target-1",
+        build_submitted_time=now,
+    )
+    build2 = flexmock(
+        status=BuildStatus.pending,
+        build_id=2,
+        target="target-1",
+        build_submitted_time=now,
+    )
+    build3 = flexmock(
+        status=BuildStatus.pending,
+        build_id=1,
+        target="target-2",
+        build_submitted_time=now,
+    )
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
         BuildStatus.pending
     ).and_return([build1, build2, build3])
+    copr_client = flexmock()
+    flexmock(Client).should_receive("create_from_config_file").and_return(
+        copr_client
+    ).once()
+    build_data_1 = CoprBuildData(build=flexmock(), chroots={})
+    build_data_2 = CoprBuildData(build=flexmock(), chroots={})
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
-        "update_copr_builds"
-    ).with_args(1, [build1, build3]).once()
+        "get_copr_build_data"
+    ).with_args(copr_client, 1, {"target-1", "target-2"}).and_return(
+        build_data_1
+    ).once()
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
-        "update_copr_builds"
-    ).with_args(2, [build2]).once()
+        "get_copr_build_data"
+    ).with_args(copr_client, 2, {"target-1"}).and_return(build_data_2).once()
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_copr_builds_from_data"
+    ).with_args(1, [build1, build3], build_data_1).once()
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_copr_builds_from_data"
+    ).with_args(2, [build2], build_data_2).once()
     check_pending_copr_builds()
 
 
+def test_get_copr_build_data_multiple_chroots():
+    build_copr = flexmock(ended_on="timestamp", started_on="timestamp")
+    copr_client = flexmock(
+        build_proxy=flexmock()
+        .should_receive("get")
+        .with_args(1)
+        .and_return(build_copr)
+        .mock(),
+        build_chroot_proxy=flexmock()
+        .should_receive("get_list")
+        .with_args(1)
+        .and_return(
+            [
+                flexmock(name="target-1", state="succeeded"),
+                flexmock(name="target-2", state="failed"),
+                flexmock(name="target-3", state="succeeded"),
+            ]
+        )
+        .once()
+        .mock(),
+    )
+    copr_client.build_chroot_proxy.should_receive("get").never()
+
+    build_data = get_copr_build_data(copr_client, 1, {"target-1", "target-2"})
+    assert build_data.build == build_copr
+    assert set(build_data.chroots) == {"target-1", "target-2"}
+    assert build_data.chroots["target-2"].state == "failed"
+
+
 def test_check_pending_testing_farm_runs_no_runs():
+    flexmock(TFTTestRunTargetModel).should_receive(
+        "mark_timed_out_as_error"
+    ).and_return([])
     flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
         TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running
     ).and_return([])
     # No request should be performed
-    flexmock(requests).should_receive("get").never()
+    flexmock(requests.Session).should_receive("get").never()
     check_pending_testing_farm_runs()
 
 
@@ -440,6 +552,9 @@ def test_check_pending_testing_farm_runs_no_runs():
     ),
 )
 def test_check_pending_testing_farm_runs(created):
+    flexmock(TFTTestRunTargetModel).should_receive(
+        "mark_timed_out_as_error"
+    ).and_return([])
     pipeline_id = 1
     run = (
         flexmock(
@@ -474,7 +589,7 @@ def test_check_pending_testing_farm_runs(created):
         pipeline_id=pipeline_id
     ).and_return(run)
     url = "https://api.dev.testing-farm.io/v0.1/requests/1"
-    flexmock(requests).should_receive("get").with_args(url).and_return(
+    flexmock(requests.Session).should_receive("get").with_args(url).and_return(
         flexmock(
             json=lambda: {
                 "id": pipeline_id,
@@ -500,20 +615,15 @@ def test_check_pending_testing_farm_runs(created):
     check_pending_testing_farm_runs()
 
 
-@pytest.mark.parametrize(
-    "status",
-    [TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running],
-)
-def test_check_pending_testing_farm_runs_timeout(status):
-    run = flexmock(
-        pipeline_id=1,
-        status=status,
-        submitted_time=datetime.datetime.utcnow() - datetime.timedelta(weeks=2),
-    )
-    run.should_receive("set_status").with_args(TestingFarmResult.error).once()
+def test_check_pending_testing_farm_runs_timeout():
+    flexmock(TFTTestRunTargetModel).should_receive("mark_timed_out_as_error").with_args(
+        datetime.timedelta(seconds=DEFAULT_JOB_TIMEOUT)
+    ).and_return([1]).once()
+    # the timed out run is not pending anymore
     flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
         TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running
-    ).and_return([run]).once()
+    ).and_return([]).once()
+    flexmock(requests.Session).should_receive("get").never()
     check_pending_testing_farm_runs()
 
 
@@ -522,6 +632,9 @@ def test_check_pending_testing_farm_runs_timeout(status):
     [None, "first", "second"],
 )
 def test_check_pending_testing_farm_runs_identifiers(identifier):
+    flexmock(TFTTestRunTargetModel).should_receive(
+        "mark_timed_out_as_error"
+    ).and_return([])
     pipeline_id = 1
     run = (
         flexmock(
@@ -556,7 +669,7 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
         pipeline_id=pipeline_id
     ).and_return(run)
     url = "https://api.dev.testing-farm.io/v0.1/requests/1"
-    flexmock(requests).should_receive("get").with_args(url).and_return(
+    flexmock(requests.Session).should_receive("get").with_args(url).and_return(
         flexmock(
             json=lambda: {
                 "id": pipeline_id,
@@ -598,3 +711,273 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
     )
     flexmock(TestingFarmResultsHandler).should_receive("run").and_return().once()
     check_pending_testing_farm_runs()
+
+
+def test_check_pending_testing_farm_runs_package_config_fetched_once():
+    flexmock(TFTTestRunTargetModel).should_receive(
+        "mark_timed_out_as_error"
+    ).and_return([])
+    runs = []
+    for pipeline_id in (1, 2):
+        runs.append(
+            flexmock(
+                pipeline_id=pipeline_id,
+                submitted_time=datetime.datetime.utcnow(),
+                commit_sha="123456",
+                target="fedora-rawhide-x86_64",
+                data={},
+                job_trigger=flexmock(type=JobTriggerModelType.pull_request),
+                identifier=None,
+            )
+            .should_receive("get_trigger_object")
+            .and_return(
+                flexmock(
+                    project=flexmock(
+                        repo_name="repo_name",
+                        namespace="the-namespace",
+                        project_url="https://github.com/the-namespace/repo_name",
+                    ),
+                    pr_id=5,
+                    job_config_trigger_type=JobConfigTriggerType.pull_request,
+                    job_trigger_model_type=JobTriggerModelType.pull_request,
+                    id=123,
+                )
+            )
+            .mock()
+        )
+    flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
+        TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running
+    ).and_return(runs).once()
+    for run in runs:
+        flexmock(TFTTestRunTargetModel).should_receive("get_by_pipeline_id").with_args(
+            pipeline_id=run.pipeline_id
+        ).and_return(run)
+        flexmock(requests.Session).should_receive("get").with_args(
+            f"https://api.dev.testing-farm.io/v0.1/requests/{run.pipeline_id}"
+        ).and_return(
+            flexmock(
+                json=lambda pipeline_id=run.pipeline_id: {
+                    "id": pipeline_id,
+                    "state": TestingFarmResult.passed,
+                    "created": "2021-11-01 17:22:36.061250",
+                },
+                ok=True,
+            )
+        ).once()
+    flexmock(TestingFarmResultsEvent).should_receive("get_package_config").and_return(
+        PackageConfig(
+            jobs=[
+                JobConfig(
+                    type=JobType.tests,
+                    trigger=JobConfigTriggerType.pull_request,
+                    packages={"package": CommonPackageConfig()},
+                )
+            ],
+            packages={"package": CommonPackageConfig()},
+        )
+    ).once()
+    flexmock(TestingFarmResultsHandler).should_receive("run").and_return().twice()
+    check_pending_testing_farm_runs()
+
+
+@pytest.fixture()
+def koji_hub():
+    """Local stub of the Koji hub serving the info about the tasks in `tasks`."""
+    tasks, calls, options = {}, [], {"delay": 0}
+
+    def multi_call(call_list):
+        calls.append([call["params"][0] for call in call_list])
+        time.sleep(options["delay"])
+        return [
+            [tasks[task_id]]
+            if task_id in tasks
+            else {"faultCode": 1000, "faultString": f"No such task: {task_id}"}
+            for task_id in (call["params"][0] for call in call_list)
+        ]
+
+    server = SimpleXMLRPCServer(("127.0.0.1", 0), allow_none=True, logRequests=False)
+    server.register_function(multi_call, "multiCall")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    host, port = server.server_address
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        flexmock(koji_hub_url=f"http://{host}:{port}")
+    )
+    packit_service.worker.helpers.build.babysit._koji_hub = None
+    yield flexmock(tasks=tasks, calls=calls, options=options)
+
+    packit_service.worker.helpers.build.babysit._koji_hub = None
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_koji_task_infos(koji_hub, monkeypatch):
+    koji_hub.tasks.update(
+        {1: {"id": 1, "state": 1}, 3: {"id": 3, "state": 2, "completion_ts": 1.5}}
+    )
+    monkeypatch.setattr(
+        packit_service.worker.helpers.build.babysit, "KOJI_MULTICALL_BATCH_SIZE", 2
+    )
+
+    infos = get_koji_task_infos([1, 2, 3])
+    assert infos == {
+        1: {"id": 1, "state": 1},
+        2: None,
+        3: {"id": 3, "state": 2, "completion_ts": 1.5},
+    }
+    assert koji_hub.calls == [[1, 2], [3]]
+
+
+def test_get_koji_task_infos_timeout(koji_hub, monkeypatch):
+    koji_hub.options["delay"] = 1
+    monkeypatch.setattr(
+        packit_service.worker.helpers.build.babysit, "KOJI_HUB_TIMEOUT", 0.1
+    )
+
+    with pytest.raises(OSError):
+        get_koji_task_infos([1])
+
+
+def test_check_pending_koji_builds_unknown_state(koji_hub):
+    flexmock(KojiBuildTargetModel).should_receive("mark_timed_out_as_error").and_return(
+        []
+    )
+    koji_hub.tasks.update(
+        {
+            1: {"id": 1, "state": 42, "start_ts": 10.0, "completion_ts": None},
+            2: {"id": 2, "state": 2, "start_ts": 10.0, "completion_ts": 20.0},
+        }
+    )
+    flexmock(KojiBuildTargetModel).should_receive("get_all_by_status").and_return(
+        [
+            flexmock(id=11, build_id="1", status="running"),
+            flexmock(id=12, build_id="2", status="running"),
+        ]
+    )
+    flexmock(KojiBuildTargetModel).should_receive("set_status_of_builds").never()
+
+    def check_event(event):
+        # the task in the unknown state is skipped
+        assert event.build_id == 2
+
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_koji_build_state"
+    ).replace_with(check_event).once()
+
+    check_pending_koji_builds()
+
+
+def test_check_pending_koji_builds_no_builds():
+    flexmock(KojiBuildTargetModel).should_receive("mark_timed_out_as_error").and_return(
+        []
+    )
+    flexmock(KojiBuildTargetModel).should_receive("get_all_by_status").with_args(
+        "pending", "running"
+    ).and_return([])
+    # No request should be performed
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "get_koji_task_infos"
+    ).never()
+    check_pending_koji_builds()
+
+
+def test_check_pending_koji_builds(koji_hub):
+    flexmock(KojiBuildTargetModel).should_receive("mark_timed_out_as_error").with_args(
+        datetime.timedelta(seconds=DEFAULT_JOB_TIMEOUT), "pending", "running"
+    ).and_return([]).once()
+    koji_hub.tasks.update(
+        {
+            # unchanged
+            1: {"id": 1, "state": 1, "start_ts": 10.0, "completion_ts": None},
+            # finished
+            2: {"id": 2, "state": 2, "start_ts": 10.0, "completion_ts": 20.0},
+            # assigned, not reported
+            3: {"id": 3, "state": 4, "start_ts": None, "completion_ts": None},
+        }
+    )
+    flexmock(KojiBuildTargetModel).should_receive("get_all_by_status").with_args(
+        "pending", "running"
+    ).and_return(
+        [
+            flexmock(id=11, build_id="1", status="running"),
+            flexmock(id=12, build_id="2", status="running"),
+            flexmock(id=13, build_id="3", status="pending"),
+            # the task no longer exists
+            flexmock(id=14, build_id="4", status="pending"),
+        ]
+    )
+    flexmock(KojiBuildTargetModel).should_receive("set_status_of_builds").with_args(
+        [14], BuildStatus.error
+    ).once()
+
+    def check_event(event):
+        assert isinstance(event, KojiTaskEvent)
+        assert event.build_id == 2
+        assert event.state == KojiTaskState.closed
+        assert event.old_state == KojiTaskState.open
+        assert event.start_time == 10.0
+        assert event.completion_time == 20.0
+
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_koji_build_state"
+    ).replace_with(check_event).once()
+
+    check_pending_koji_builds()
+    # all the tasks were obtained in a single call
+    assert koji_hub.calls == [[1, 2, 3, 4]]
+
+
+def test_check_pending_koji_builds_invalid_task_id(koji_hub):
+    flexmock(KojiBuildTargetModel).should_receive("mark_timed_out_as_error").and_return(
+        []
+    )
+    koji_hub.tasks.update(
+        {1: {"id": 1, "state": 2, "start_ts": 10.0, "completion_ts": 20.0}}
+    )
+    flexmock(KojiBuildTargetModel).should_receive("get_all_by_status").and_return(
+        [
+            flexmock(id=11, build_id="1", status="running"),
+            # submitted without obtaining the task ID
+            flexmock(id=12, build_id="None", status="pending"),
+            flexmock(id=13, build_id=None, status="pending"),
+        ]
+    )
+    flexmock(KojiBuildTargetModel).should_receive("set_status_of_builds").with_args(
+        [12, 13], BuildStatus.error
+    ).once()
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_koji_build_state"
+    ).once()
+
+    check_pending_koji_builds()
+    # only the valid task IDs were requested
+    assert koji_hub.calls == [[1]]
+
+
+def test_check_pending_koji_builds_timeout():
+    flexmock(KojiBuildTargetModel).should_receive("mark_timed_out_as_error").and_return(
+        [1, 2]
+    ).once()
+    flexmock(KojiBuildTargetModel).should_receive("get_all_by_status").and_return([])
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_koji_build_state"
+    ).never()
+    check_pending_koji_builds()
+
+
+def test_check_pending_koji_builds_hub_unavailable():
+    flexmock(KojiBuildTargetModel).should_receive("mark_timed_out_as_error").and_return(
+        []
+    )
+    flexmock(KojiBuildTargetModel).should_receive("get_all_by_status").and_return(
+        [flexmock(id=11, build_id="1", status="running")]
+    )
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "get_koji_task_infos"
+    ).and_raise(ConnectionRefusedError)
+    flexmock(KojiBuildTargetModel).should_receive("set_status_of_builds").never()
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_koji_build_state"
+    ).never()
+    check_pending_koji_builds()
@@ -1,30 +1,66 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from datetime import datetime, timezone
-from pathlib import Path
+import gzip
+from datetime import datetime
+from io import BytesIO
 
-from boto3.s3.transfer import S3Transfer
+import pytest
 from flexmock import flexmock
+from packit.exceptions import PackitCommandFailedError
 
+from packit_service.constants import SRPMBUILDS_DISCARD_BATCH_SIZE
 from packit_service.models import SRPMBuildModel
 from packit_service.worker import database
 
 
 def test_cleanup_old_srpm_build_logs():
-    srpm_build = flexmock(id=1, build_submitted_time=datetime.now(timezone.utc))
-    flexmock(srpm_build).should_receive("set_logs").with_args(None).once()
-    flexmock(srpm_build).should_receive("set_url").with_args(None).once()
-    flexmock(SRPMBuildModel).should_receive("get_older_than").and_return(
-        [srpm_build]
-    ).once()
-    database.discard_old_srpm_build_logs()
+    flexmock(SRPMBuildModel).should_receive("discard_logs").with_args(
+        submitted_before=datetime, after_id=0, batch_size=SRPMBUILDS_DISCARD_BATCH_SIZE
+    ).and_return([(1, 100), (3, 20)]).once()
+    flexmock(SRPMBuildModel).should_receive("discard_logs").with_args(
+        submitted_before=datetime, after_id=3, batch_size=SRPMBUILDS_DISCARD_BATCH_SIZE
+    ).and_return([(4, 1000)]).once()
+    flexmock(SRPMBuildModel).should_receive("discard_logs").with_args(
+        submitted_before=datetime, after_id=4, batch_size=SRPMBUILDS_DISCARD_BATCH_SIZE
+    ).and_return([]).once()
+    assert database.discard_old_srpm_build_logs() == (3, 1120)
 
 
 def test_backup():
     flexmock(database).should_receive("is_aws_configured").once().and_return(True)
-    flexmock(database).should_receive("dump_to").once()
-    flexmock(database).should_receive("gzip_file").once().and_return(Path("xyz"))
-    flexmock(S3Transfer).should_receive("upload_file").once()
-    flexmock(Path).should_receive("unlink").twice()
+    process = flexmock(stdout=BytesIO(b"dump"))
+    process.should_receive("poll").and_return(0)
+    process.should_receive("wait").and_return(0)
+    flexmock(database).should_receive("start_dump").once().and_return(process)
+    flexmock(database).should_receive("upload_to_s3").with_args(
+        database.CompressedDumpStream, str
+    ).replace_with(lambda stream, key: stream.read()).once()
     database.backup()
+    assert process.stdout.closed
+
+
+def test_compressed_dump_stream():
+    dump = bytes(range(256)) * 1000
+    process = flexmock(stdout=BytesIO(dump))
+    process.should_receive("wait").and_return(0).once()
+    stream = database.CompressedDumpStream(process, chunk_size=1000)
+
+    parts = []
+    while part := stream.read(100):
+        parts.append(part)
+
+    # all the parts but the last one have the requested size
+    assert all(len(part) == 100 for part in parts[:-1])
+    assert gzip.decompress(b"".join(parts)) == dump
+    assert stream.dumped_bytes == len(dump)
+    assert stream.compressed_bytes == sum(len(part) for part in parts)
+
+
+def test_compressed_dump_stream_pg_dump_failed():
+    process = flexmock(stdout=BytesIO(b"partial dump"))
+    process.should_receive("wait").and_return(1).once()
+    stream = database.CompressedDumpStream(process)
+
+    with pytest.raises(PackitCommandFailedError):
+        stream.read()
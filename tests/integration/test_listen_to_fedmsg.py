@@ -294,8 +294,9 @@ def test_copr_build_end(
     flexmock(CoprBuildTargetModel).should_receive("get_by_build_id").and_return(
         copr_build_pr
     )
-    copr_build_pr.should_call("set_status").with_args(BuildStatus.success).once()
-    copr_build_pr.should_receive("set_end_time").once()
+    copr_build_pr.should_call("update").with_args(
+        status=BuildStatus.success, build_finished_time=None, built_packages=[]
+    ).once()
 
     url = get_copr_build_info_url(1)
     flexmock(requests).should_receive("get").and_return(requests.Response())
@@ -323,8 +324,8 @@ def test_copr_build_end(
         .at_least()
         .once()
     )
-    flexmock(copr_build_pr._srpm_build_for_mocking).should_receive("set_url").with_args(
-        "https://my.host/my.srpm"
+    flexmock(copr_build_pr._srpm_build_for_mocking).should_receive("update").with_args(
+        url="https://my.host/my.srpm"
     ).mock()
 
     flexmock(Pushgateway).should_receive("push").once().and_return()
@@ -363,8 +364,9 @@ def test_copr_build_end_push(copr_build_end, pc_build_push, copr_build_branch_pu
         copr_build_branch_push
     )
 
-    copr_build_branch_push.should_receive("set_status").with_args(BuildStatus.success)
-    copr_build_branch_push.should_receive("set_end_time").once()
+    copr_build_branch_push.should_receive("update").with_args(
+        status=BuildStatus.success, build_finished_time=None, built_packages=[]
+    ).once()
     url = get_copr_build_info_url(1)
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
@@ -418,8 +420,9 @@ def test_copr_build_end_release(copr_build_end, pc_build_release, copr_build_rel
     flexmock(CoprBuildTargetModel).should_receive("get_by_build_id").and_return(
         copr_build_release
     )
-    copr_build_release.should_receive("set_status").with_args(BuildStatus.success)
-    copr_build_release.should_receive("set_end_time").once()
+    copr_build_release.should_receive("update").with_args(
+        status=BuildStatus.success, build_finished_time=None, built_packages=[]
+    ).once()
     url = get_copr_build_info_url(1)
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
@@ -525,8 +528,9 @@ def test_copr_build_end_testing_farm(copr_build_end, copr_build_pr):
         copr_build_pr
     )
     flexmock(CoprBuildTargetModel).should_receive("get_by_id").and_return(copr_build_pr)
-    copr_build_pr.should_call("set_status").with_args(BuildStatus.success).once()
-    copr_build_pr.should_receive("set_end_time").once()
+    copr_build_pr.should_call("update").with_args(
+        status=BuildStatus.success, build_finished_time=None, built_packages=[]
+    ).once()
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
     # check if packit-service set correct PR status
@@ -762,8 +766,9 @@ def test_copr_build_end_report_multiple_testing_farm_jobs(
         copr_build_pr
     )
     flexmock(CoprBuildTargetModel).should_receive("get_by_id").and_return(copr_build_pr)
-    copr_build_pr.should_call("set_status").with_args(BuildStatus.success).once()
-    copr_build_pr.should_receive("set_end_time").once()
+    copr_build_pr.should_call("update").with_args(
+        status=BuildStatus.success, build_finished_time=None, built_packages=[]
+    ).once()
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
     # check if packit-service set correct PR status
@@ -888,8 +893,9 @@ def test_copr_build_end_failed_testing_farm(copr_build_end, copr_build_pr):
         copr_build_pr
     )
     flexmock(CoprBuildTargetModel).should_receive("get_by_id").and_return(copr_build_pr)
-    copr_build_pr.should_call("set_status").with_args(BuildStatus.success).once()
-    copr_build_pr.should_receive("set_end_time").once()
+    copr_build_pr.should_call("update").with_args(
+        status=BuildStatus.success, build_finished_time=None, built_packages=[]
+    ).once()
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
     # check if packit-service set correct PR status
@@ -1040,8 +1046,9 @@ def test_copr_build_end_failed_testing_farm_no_json(copr_build_end, copr_build_p
         copr_build_pr
     )
     flexmock(CoprBuildTargetModel).should_receive("get_by_id").and_return(copr_build_pr)
-    copr_build_pr.should_call("set_status").with_args(BuildStatus.success).once()
-    copr_build_pr.should_receive("set_end_time").once()
+    copr_build_pr.should_call("update").with_args(
+        status=BuildStatus.success, build_finished_time=None, built_packages=[]
+    ).once()
     url = get_copr_build_info_url(1)
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
@@ -1152,9 +1159,9 @@ def test_copr_build_start(copr_build_start, pc_build_pr, copr_build_pr):
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
 
-    copr_build_pr.should_receive("set_start_time").once()
-    copr_build_pr.should_call("set_status").with_args(BuildStatus.pending).once()
-    copr_build_pr.should_receive("set_build_logs_url")
+    copr_build_pr.should_call("update").with_args(
+        status=BuildStatus.pending, build_start_time=None, build_logs_url=str
+    ).once()
 
     # check if packit-service set correct PR status
     flexmock(StatusReporter).should_receive("report").with_args(
@@ -1205,9 +1212,9 @@ def test_copr_build_just_tests_defined(copr_build_start, pc_tests, copr_build_pr
     url = get_copr_build_info_url(1)
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
-    copr_build_pr.should_receive("set_start_time").once()
-    copr_build_pr.should_call("set_status").with_args(BuildStatus.pending).once()
-    copr_build_pr.should_receive("set_build_logs_url")
+    copr_build_pr.should_call("update").with_args(
+        status=BuildStatus.pending, build_start_time=None, build_logs_url=str
+    ).once()
 
     # check if packit-service sets the correct PR status
     flexmock(StatusReporter).should_receive("report").with_args(
@@ -1259,8 +1266,9 @@ def test_copr_build_not_comment_on_success(copr_build_end, pc_build_pr, copr_bui
     flexmock(CoprBuildTargetModel).should_receive("get_by_build_id").and_return(
         copr_build_pr
     )
-    copr_build_pr.should_call("set_status").with_args(BuildStatus.success).once()
-    copr_build_pr.should_receive("set_end_time").once()
+    copr_build_pr.should_call("update").with_args(
+        status=BuildStatus.success, build_finished_time=None, built_packages=[]
+    ).once()
     url = get_copr_build_info_url(1)
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
@@ -1308,11 +1316,13 @@ def test_koji_build_start(koji_build_scratch_start, pc_koji_build_pr, koji_build
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
 
-    koji_build_pr.should_receive("set_build_start_time").once()
-    koji_build_pr.should_receive("set_build_finished_time").with_args(None).once()
-    koji_build_pr.should_receive("set_status").with_args("running").once()
-    koji_build_pr.should_receive("set_build_logs_url")
-    koji_build_pr.should_receive("set_web_url")
+    koji_build_pr.should_receive("update").with_args(
+        status="running",
+        build_start_time=datetime,
+        build_finished_time=None,
+        build_logs_url=str,
+        web_url=str,
+    ).once()
 
     # check if packit-service set correct PR status
     flexmock(StatusReporter).should_receive("report").with_args(
@@ -1370,11 +1380,13 @@ def test_koji_build_end(koji_build_scratch_end, pc_koji_build_pr, koji_build_pr)
     flexmock(requests).should_receive("get").and_return(requests.Response())
     flexmock(requests.Response).should_receive("raise_for_status").and_return(None)
 
-    koji_build_pr.should_receive("set_build_start_time").once()
-    koji_build_pr.should_receive("set_build_finished_time").once()
-    koji_build_pr.should_receive("set_status").with_args("success").once()
-    koji_build_pr.should_receive("set_build_logs_url")
-    koji_build_pr.should_receive("set_web_url")
+    koji_build_pr.should_receive("update").with_args(
+        status="success",
+        build_start_time=datetime,
+        build_finished_time=datetime,
+        build_logs_url=str,
+        web_url=str,
+    ).once()
 
     # check if packit-service set correct PR status
     flexmock(StatusReporter).should_receive("report").with_args(
@@ -1415,8 +1427,8 @@ def test_srpm_build_end(srpm_build_end, pc_build_pr, srpm_build_model):
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_build_id").and_return(
         [
             flexmock(target="fedora-33-x86_64")
-            .should_receive("set_status")
-            .with_args(BuildStatus.pending)
+            .should_receive("update")
+            .with_args(status=BuildStatus.pending)
             .mock()
         ]
     )
@@ -1433,8 +1445,11 @@ def test_srpm_build_end(srpm_build_end, pc_build_pr, srpm_build_model):
     flexmock(SRPMBuildModel).should_receive("get_by_copr_build_id").and_return(
         srpm_build_model
     )
-    srpm_build_model.should_call("set_status").with_args(BuildStatus.success).once()
-    srpm_build_model.should_receive("set_end_time").once()
+    srpm_build_model.should_call("update").with_args(
+        status=BuildStatus.success,
+        build_finished_time=None,
+        url="https://my.host/my.srpm",
+    ).once()
 
     url = get_srpm_build_info_url(1)
     flexmock(StatusReporter).should_receive("report").with_args(
@@ -1447,10 +1462,6 @@ def test_srpm_build_end(srpm_build_end, pc_build_pr, srpm_build_model):
 
     flexmock(Signature).should_receive("apply_async").once()
 
-    flexmock(srpm_build_model).should_receive("set_url").with_args(
-        "https://my.host/my.srpm"
-    ).mock()
-
     processing_results = SteveJobs().process_message(srpm_build_end)
     event_dict, job, job_config, package_config = get_parameters_from_results(
         processing_results
@@ -1494,8 +1505,11 @@ def test_srpm_build_end_failure(srpm_build_end, pc_build_pr, srpm_build_model):
     flexmock(SRPMBuildModel).should_receive("get_by_copr_build_id").and_return(
         srpm_build_model
     )
-    srpm_build_model.should_call("set_status").with_args(BuildStatus.failure).once()
-    srpm_build_model.should_receive("set_end_time").once()
+    srpm_build_model.should_call("update").with_args(
+        status=BuildStatus.failure,
+        build_finished_time=None,
+        url="https://my.host/my.srpm",
+    ).once()
 
     url = get_srpm_build_info_url(1)
     flexmock(StatusReporter).should_receive("report").with_args(
@@ -1508,10 +1522,6 @@ def test_srpm_build_end_failure(srpm_build_end, pc_build_pr, srpm_build_model):
 
     flexmock(Signature).should_receive("apply_async").once()
 
-    flexmock(srpm_build_model).should_receive("set_url").with_args(
-        "https://my.host/my.srpm"
-    ).mock()
-
     processing_results = SteveJobs().process_message(srpm_build_end)
     event_dict, job, job_config, package_config = get_parameters_from_results(
         processing_results
@@ -1545,8 +1555,9 @@ def test_srpm_build_start(srpm_build_start, pc_build_pr, srpm_build_model):
     flexmock(SRPMBuildModel).should_receive("get_by_copr_build_id").and_return(
         srpm_build_model
     )
-    flexmock(SRPMBuildModel).should_receive("set_start_time")
-    flexmock(SRPMBuildModel).should_receive("set_build_logs_url")
+    srpm_build_model.should_call("update").with_args(
+        build_start_time=None, logs_url=str
+    ).once()
 
     url = get_srpm_build_info_url(1)
     flexmock(StatusReporter).should_receive("report").with_args(
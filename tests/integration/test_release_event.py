@@ -31,6 +31,7 @@ from packit_service.models import (
 from packit_service.service.db_triggers import AddReleaseDbTrigger
 from packit_service.service.urls import get_propose_downstream_info_url
 from packit_service.worker.allowlist import Allowlist
+from packit_service.worker.handlers.distgit import ProposeDownstreamHandler
 from packit_service.worker.jobs import SteveJobs
 from packit_service.worker.monitoring import Pushgateway
 from packit_service.worker.helpers.propose_downstream import ProposeDownstreamJobHelper
@@ -301,6 +302,252 @@ def test_dist_git_push_release_handle_multiple_branches(
     assert first_dict_value(results["job"])["success"]
 
 
+def test_dist_git_push_release_handle_concurrently(
+    github_release_webhook, fedora_branches, propose_downstream_model, monkeypatch
+):
+    models = {}
+    for i, branch in enumerate(fedora_branches):
+        models[branch] = flexmock(status="queued", id=1000 + i, branch=branch)
+        flexmock(ProposeDownstreamTargetModel).should_receive("create").with_args(
+            status=ProposeDownstreamTargetStatus.queued, branch=branch
+        ).and_return(models[branch])
+        # the threads fetch the models using their own sessions
+        flexmock(ProposeDownstreamTargetModel).should_receive("get_by_id").with_args(
+            1000 + i
+        ).and_return(models[branch])
+    flexmock(ProposeDownstreamModel).should_receive("get_by_id").with_args(
+        123
+    ).and_return(propose_downstream_model)
+
+    packit_yaml = (
+        "{'specfile_path': 'hello-world.spec', 'synced_files': []"
+        ", jobs: [{trigger: release, job: propose_downstream, "
+        "metadata: {targets:[], dist-git-branch: fedora-all}}]}"
+    )
+    flexmock(Github, get_repo=lambda full_name_or_id: None)
+    project = flexmock(
+        get_file_content=lambda path, ref: packit_yaml,
+        full_repo_name="packit-service/hello-world",
+        repo="hello-world",
+        namespace="packit-service",
+        get_files=lambda ref, filter_regex: [],
+        get_sha_from_tag=lambda tag_name: "123456",
+        get_web_url=lambda: "https://github.com/packit/hello-world",
+        is_private=lambda: False,
+        default_branch="main",
+    )
+    flexmock(LocalProject, refresh_the_arguments=lambda: None)
+    flexmock(DistGit).should_receive("local_project").and_return(
+        flexmock(working_dir="")
+    )
+
+    flexmock(Allowlist, check_and_report=True)
+    ServiceConfig().get_service_config().get_project = lambda url: project
+    monkeypatch.setattr(
+        ServiceConfig.get_service_config(), "propose_downstream_concurrency", 3
+    )
+
+    # every branch is synced in its own worktree of the upstream clone
+    for branch in fedora_branches:
+        worktree = flexmock(
+            working_dir=f"/worktrees/{branch}",
+            git_repo=flexmock(
+                head=flexmock()
+                .should_receive("reset")
+                .with_args("HEAD", index=True, working_tree=True)
+                .once()
+                .mock(),
+            ),
+        )
+        flexmock(ProposeDownstreamHandler).should_receive("_create_worktree").with_args(
+            branch
+        ).and_return(worktree).once()
+        flexmock(ProposeDownstreamHandler).should_receive("_remove_worktree").with_args(
+            worktree
+        ).once()
+        flexmock(PackitAPI).should_receive("sync_release").with_args(
+            dist_git_branch=branch, tag="0.3.0", create_pr=True
+        ).and_return(flexmock(url="some_url")).once()
+    flexmock(PackitAPI).should_receive("clean").times(len(fedora_branches))
+    flexmock(shutil).should_receive("rmtree").with_args("").times(len(fedora_branches))
+
+    for branch, model in models.items():
+        flexmock(model).should_receive("set_status").with_args(
+            status=ProposeDownstreamTargetStatus.running
+        ).once()
+        flexmock(model).should_receive("set_downstream_pr_url").with_args(
+            downstream_pr_url="some_url"
+        ).once()
+        flexmock(model).should_receive("set_status").with_args(
+            status=ProposeDownstreamTargetStatus.submitted
+        ).once()
+        flexmock(model).should_receive("set_start_time").once()
+        flexmock(model).should_receive("set_finished_time").once()
+        flexmock(model).should_receive("set_logs").once()
+
+        url = get_propose_downstream_info_url(model.id)
+        flexmock(ProposeDownstreamJobHelper).should_receive(
+            "report_status_to_branch"
+        ).with_args(
+            branch=branch,
+            description="Starting propose downstream...",
+            state=BaseCommitStatus.running,
+            url=url,
+        ).once()
+        flexmock(ProposeDownstreamJobHelper).should_receive(
+            "report_status_to_branch"
+        ).with_args(
+            branch=branch,
+            description="Propose downstream finished successfully.",
+            state=BaseCommitStatus.success,
+            url=url,
+        ).once()
+    flexmock(propose_downstream_model).should_receive("set_status").with_args(
+        status=ProposeDownstreamStatus.finished
+    ).once()
+
+    flexmock(AddReleaseDbTrigger).should_receive("db_trigger").and_return(
+        flexmock(
+            job_config_trigger_type=JobConfigTriggerType.release,
+            id=123,
+            job_trigger_model_type=JobTriggerModelType.release,
+        )
+    )
+    flexmock(Signature).should_receive("apply_async").once()
+    flexmock(Pushgateway).should_receive("push").times(2).and_return()
+
+    processing_results = SteveJobs().process_message(github_release_webhook)
+    event_dict, job, job_config, package_config = get_parameters_from_results(
+        processing_results
+    )
+    assert json.dumps(event_dict)
+
+    results = run_propose_downstream_handler(
+        package_config=package_config,
+        event=event_dict,
+        job_config=job_config,
+    )
+    assert first_dict_value(results["job"])["success"]
+
+
+def test_retry_propose_downstream_task_concurrently(
+    github_release_webhook, fedora_branches, propose_downstream_model, monkeypatch
+):
+    statuses = {}
+    for i, branch in enumerate(fedora_branches):
+        model = flexmock(status="queued", id=1000 + i, branch=branch)
+        statuses[branch] = []
+        model.should_receive("set_status").replace_with(
+            lambda status, branch=branch: statuses[branch].append(status)
+        )
+        model.should_receive("set_start_time")
+        model.should_receive("set_finished_time")
+        model.should_receive("set_logs")
+        flexmock(ProposeDownstreamTargetModel).should_receive("create").with_args(
+            status=ProposeDownstreamTargetStatus.queued, branch=branch
+        ).and_return(model)
+        flexmock(ProposeDownstreamTargetModel).should_receive("get_by_id").with_args(
+            1000 + i
+        ).and_return(model)
+    flexmock(ProposeDownstreamModel).should_receive("get_by_id").with_args(
+        123
+    ).and_return(propose_downstream_model)
+
+    packit_yaml = (
+        "{'specfile_path': 'hello-world.spec', 'synced_files': []"
+        ", jobs: [{trigger: release, job: propose_downstream, "
+        "metadata: {targets:[], dist-git-branch: fedora-all}}]}"
+    )
+    flexmock(Github, get_repo=lambda full_name_or_id: None)
+    project = flexmock(
+        get_file_content=lambda path, ref: packit_yaml,
+        full_repo_name="packit-service/hello-world",
+        repo="hello-world",
+        namespace="packit-service",
+        get_files=lambda ref, filter_regex: [],
+        get_sha_from_tag=lambda tag_name: "123456",
+        get_web_url=lambda: "https://github.com/packit/hello-world",
+        is_private=lambda: False,
+        default_branch="main",
+    )
+    flexmock(LocalProject, refresh_the_arguments=lambda: None)
+    flexmock(DistGit).should_receive("local_project").and_return(
+        flexmock(working_dir="")
+    )
+
+    flexmock(Allowlist, check_and_report=True)
+    ServiceConfig().get_service_config().get_project = lambda url: project
+    monkeypatch.setattr(
+        ServiceConfig.get_service_config(), "propose_downstream_concurrency", 3
+    )
+
+    for branch in fedora_branches:
+        worktree = flexmock(
+            working_dir=f"/worktrees/{branch}",
+            git_repo=flexmock(
+                head=flexmock()
+                .should_receive("reset")
+                .with_args("HEAD", index=True, working_tree=True)
+                .mock(),
+            ),
+        )
+        flexmock(ProposeDownstreamHandler).should_receive("_create_worktree").with_args(
+            branch
+        ).and_return(worktree).once()
+        flexmock(ProposeDownstreamHandler).should_receive("_remove_worktree").with_args(
+            worktree
+        ).once()
+    flexmock(PackitAPI).should_receive("sync_release").and_raise(
+        PackitDownloadFailedException, "Failed to download source from example.com"
+    ).at_least().once()
+    flexmock(PackitAPI).should_receive("clean")
+    flexmock(shutil).should_receive("rmtree").with_args("")
+    flexmock(ProposeDownstreamJobHelper).should_receive("report_status_to_branch")
+    flexmock(propose_downstream_model).should_receive("set_status").never()
+
+    flexmock(AddReleaseDbTrigger).should_receive("db_trigger").and_return(
+        flexmock(
+            job_config_trigger_type=JobConfigTriggerType.release,
+            id=123,
+            job_trigger_model_type=JobTriggerModelType.release,
+        )
+    )
+    flexmock(Signature).should_receive("apply_async").once()
+    flexmock(Pushgateway).should_receive("push").times(2).and_return()
+
+    retries = []
+    flexmock(Task).should_receive("retry").replace_with(
+        lambda **kwargs: retries.append(kwargs)
+    ).once()
+
+    processing_results = SteveJobs().process_message(github_release_webhook)
+    event_dict, job, job_config, package_config = get_parameters_from_results(
+        processing_results
+    )
+
+    results = run_propose_downstream_handler(
+        package_config=package_config,
+        event=event_dict,
+        job_config=job_config,
+    )
+
+    assert first_dict_value(results["job"])["success"]
+    assert "Not able to download" in first_dict_value(results["job"])["details"]["msg"]
+    # the task is retried once, from the main thread, with the run to continue
+    assert isinstance(retries[0]["exc"], PackitDownloadFailedException)
+    assert retries[0]["kwargs"]["propose_downstream_run_id"] == 123
+    # the branches either stay queued or are marked to be retried, none failed
+    assert any(statuses.values())
+    for branch_statuses in statuses.values():
+        assert branch_statuses in (
+            [],
+            [
+                ProposeDownstreamTargetStatus.running,
+                ProposeDownstreamTargetStatus.retry,
+            ],
+        )
+
+
 def test_dist_git_push_release_handle_one_failed(
     github_release_webhook,
     fedora_branches,
@@ -28,7 +28,7 @@ from packit_service.models import (
     JobTriggerModel,
     JobTriggerModelType,
 )
-from packit_service.worker.allowlist import Allowlist
+from packit_service.worker.allowlist import Allowlist, allowlist_cache
 from packit_service.worker.events import (
     EventData,
     IssueCommentEvent,
@@ -120,14 +120,10 @@ def allowlist_entries():
 
 
 def mock_model(entries, namespaces):
-    for queried_namespace in namespaces:
-        (
-            flexmock(DBAllowlist)
-            .should_receive("get_namespace")
-            .with_args(queried_namespace)
-            .and_return(entries.get(queried_namespace))
-            .ordered()
-        )
+    flexmock(DBAllowlist).should_receive("get_all").and_return(
+        [entries[namespace] for namespace in namespaces if namespace in entries]
+    )
+    allowlist_cache.invalidate()
 
 
 @pytest.fixture()
@@ -638,3 +634,33 @@ def test_is_github_username_from_fas_account_matching(
         )
         is result
     )
+
+
+def test_allowlist_cached(allowlist_entries):
+    approved_konipas = flexmock(
+        id=5,
+        namespace="github.com/konipas",
+        status=AllowlistStatus.approved_manually.value,
+    )
+    flexmock(DBAllowlist).should_receive("get_all").and_return(
+        list(allowlist_entries.values())
+    ).and_return(
+        [
+            entry
+            for entry in allowlist_entries.values()
+            if entry.namespace != "github.com/konipas"
+        ]
+        + [approved_konipas]
+    ).twice()
+    flexmock(DBAllowlist).should_receive("add_namespace").with_args(
+        namespace="github.com/konipas", status=AllowlistStatus.approved_manually.value
+    ).once()
+    allowlist_cache.invalidate()
+
+    assert Allowlist.is_approved("github.com/fero/packit.git")
+    assert not Allowlist.is_approved("github.com/konipas/packit.git")
+    assert not Allowlist.is_approved("gitlab.com/packit/packit.git")
+
+    # the table has changed, the allowlist has to be loaded again
+    Allowlist.approve_namespace("github.com/konipas")
+    assert Allowlist.is_approved("github.com/konipas/packit.git")
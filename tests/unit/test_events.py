@@ -60,7 +60,7 @@ from packit_service.worker.events.enums import (
 from packit_service.worker.events.koji import KojiBuildEvent
 from packit_service.worker.events.pagure import PullRequestFlagPagureEvent
 from packit_service.worker.helpers.testing_farm import TestingFarmJobHelper
-from packit_service.worker.parser import Parser
+from packit_service.worker.parser import Parser, PARSERS, FEDMSG_PARSERS
 from tests.spellbook import DATA_DIR
 
 
@@ -276,6 +276,61 @@ class TestEvents:
             event_object.project_url == "https://github.com/packit-service/hello-world"
         )
 
+    def test_parse_event_dispatched_by_event_type(self, github_release_webhook):
+        event_object = Parser.parse_event(github_release_webhook, event_type="release")
+
+        assert isinstance(event_object, ReleaseEvent)
+        assert not Parser.parse_event(github_release_webhook, event_type="push")
+        assert not Parser.parse_event(github_release_webhook, event_type="star")
+
+    @pytest.mark.parametrize(
+        "event, event_type, parsers",
+        [
+            pytest.param(
+                {"object_kind": "note"},
+                None,
+                (
+                    Parser.parse_merge_request_comment_event,
+                    Parser.parse_gitlab_issue_comment_event,
+                ),
+                id="gitlab_object_kind",
+            ),
+            pytest.param(
+                {"object_kind": "push"},
+                "Push Hook",
+                (Parser.parse_gitlab_push_event,),
+                id="gitlab_header",
+            ),
+            pytest.param(
+                {"ref": "refs/heads/main"},
+                "push",
+                (Parser.parse_github_push_event,),
+                id="github_header",
+            ),
+            pytest.param(
+                {"topic": "org.fedoraproject.prod.copr.build.end"},
+                None,
+                (Parser.parse_copr_event,),
+                id="fedmsg_topic",
+            ),
+            pytest.param(
+                {"topic": "io.pagure.prod.pagure.pull-request.flag.added"},
+                None,
+                FEDMSG_PARSERS,
+                id="unknown_fedmsg_topic",
+            ),
+            pytest.param(
+                {"source": "testing-farm", "request_id": "1"},
+                None,
+                (Parser.parse_testing_farm_results_event,),
+                id="testing_farm",
+            ),
+            pytest.param({"action": "published"}, None, PARSERS, id="unknown"),
+        ],
+    )
+    def test_get_parsers(self, event, event_type, parsers):
+        assert Parser.get_parsers(event, event_type) == parsers
+
     def test_parse_mr(self, merge_request):
         event_object = Parser.parse_event(merge_request)
 
@@ -618,6 +673,35 @@ class TestEvents:
         ).once()
         assert event_object.package_config
 
+    def test_get_cached_dict(self, github_push_branch):
+        event_object = Parser.parse_event(github_push_branch)
+
+        event_dict = event_object.get_cached_dict()
+        assert event_dict == event_object.get_dict()
+        assert event_dict is not event_object.get_dict()
+        assert event_object.get_cached_dict() is event_dict
+
+        # changes of the event invalidate the cached dict
+        event_object.task_accepted_time = datetime(2022, 1, 1, tzinfo=timezone.utc)
+        assert event_object.get_cached_dict() is not event_dict
+        assert event_object.get_cached_dict()["task_accepted_time"] == 1640995200
+        assert "_cached_dict" not in event_object.get_dict()
+
+    def test_event_repr(self, github_push_branch):
+        event_object = Parser.parse_event(github_push_branch)
+        flexmock(event_object).should_receive("get_dict").never()
+
+        assert (
+            repr(event_object)
+            == str(event_object)
+            == (
+                "PushGitHubEvent("
+                "project_url='https://github.com/packit-service/hello-world', "
+                "git_ref='build-branch', "
+                "commit_sha='04885ff850b0fa0e206cd09db73565703d48f99b')"
+            )
+        )
+
     def test_parse_gitlab_push(self, gitlab_push):
         event_object = Parser.parse_event(gitlab_push)
 
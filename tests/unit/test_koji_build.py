@@ -165,7 +165,9 @@ def test_koji_build_check_names(github_pr_event):
             flexmock(),
         )
     )
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(flexmock(id=1))
+    flexmock(KojiBuildTargetModel).should_receive("create_for_targets").and_return(
+        [flexmock(id=1)]
+    )
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
 
     # koji build
@@ -240,7 +242,9 @@ def test_koji_build_failed_kerberos(github_pr_event):
             flexmock(),
         )
     )
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(flexmock(id=1))
+    flexmock(KojiBuildTargetModel).should_receive("create_for_targets").and_return(
+        [flexmock(id=1)]
+    )
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
 
     flexmock(PackitAPI).should_receive("init_kerberos_ticket").and_raise(
@@ -316,7 +320,9 @@ def test_koji_build_target_not_supported(github_pr_event):
             flexmock(),
         )
     )
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(flexmock(id=1))
+    flexmock(KojiBuildTargetModel).should_receive("create_for_targets").and_return(
+        [flexmock(id=1)]
+    )
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
 
     response = helper.run_koji_build()
@@ -371,9 +377,10 @@ def test_koji_build_with_multiple_targets(github_pr_event):
             flexmock(),
         )
     )
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(
-        flexmock(id=1)
-    ).and_return(flexmock(id=2))
+    # both builds are created at once
+    flexmock(KojiBuildTargetModel).should_receive("create_for_targets").and_return(
+        [flexmock(id=1), flexmock(id=2)]
+    ).once()
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
 
     # koji build
@@ -394,6 +401,24 @@ def test_koji_build_with_multiple_targets(github_pr_event):
     assert helper.run_koji_build()["success"]
 
 
+def test_submit_builds_ends_sessions_of_threads(github_pr_event):
+    helper = build_helper(event=github_pr_event)
+    helper._api = flexmock(up=flexmock())
+    flexmock(KojiBuildJobHelper).should_receive("create_srpm_if_needed")
+    flexmock(KojiBuildJobHelper).should_receive("run_build").with_args(
+        target="dark-past"
+    ).and_return((1, "url-1"))
+    flexmock(KojiBuildJobHelper).should_receive("run_build").with_args(
+        target="bright-future"
+    ).and_raise(PackitCommandFailedError, "failed")
+    # every thread ends its own DB session, even when the submission failed
+    flexmock(koji_build).should_receive("end_session").twice()
+
+    results = helper.submit_builds(["dark-past", "bright-future"])
+    assert results[0] == (1, "url-1")
+    assert isinstance(results[1], PackitCommandFailedError)
+
+
 def test_koji_build_failed(github_pr_event):
     trigger = flexmock(
         job_config_trigger_type=JobConfigTriggerType.pull_request,
@@ -454,7 +479,9 @@ def test_koji_build_failed(github_pr_event):
             flexmock(),
         )
     )
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(flexmock(id=1))
+    flexmock(KojiBuildTargetModel).should_receive("create_for_targets").and_return(
+        [flexmock(id=1)]
+    )
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
 
     # koji build
@@ -467,6 +494,183 @@ def test_koji_build_failed(github_pr_event):
     assert result["details"]["errors"]["bright-future"] == "some error"
 
 
+def test_koji_build_no_task_id(github_pr_event):
+    trigger = flexmock(
+        job_config_trigger_type=JobConfigTriggerType.pull_request,
+        id=123,
+        job_trigger_model_type=JobTriggerModelType.pull_request,
+    )
+    flexmock(JobTriggerModel).should_receive("get_or_create").with_args(
+        type=JobTriggerModelType.pull_request, trigger_id=123
+    ).and_return(flexmock(id=2, type=JobTriggerModelType.pull_request))
+    flexmock(AddPullRequestDbTrigger).should_receive("db_trigger").and_return(trigger)
+    helper = build_helper(
+        event=github_pr_event,
+        _targets=["bright-future"],
+        scratch=True,
+        db_trigger=trigger,
+    )
+    flexmock(koji_build).should_receive("get_all_koji_targets").and_return(
+        ["dark-past", "bright-future"]
+    ).once()
+
+    flexmock(StatusReporter).should_receive("set_status").with_args(
+        state=BaseCommitStatus.running,
+        description="Building SRPM ...",
+        check_name="koji-build:bright-future",
+        url="",
+        links_to_external_services=None,
+        markdown_content=None,
+    ).and_return()
+
+    srpm_build_url = get_srpm_build_info_url(2)
+    flexmock(StatusReporter).should_receive("set_status").with_args(
+        state=BaseCommitStatus.error,
+        description="Koji task ID not found in the output of the build submit.",
+        check_name="koji-build:bright-future",
+        url=srpm_build_url,
+        links_to_external_services=None,
+        markdown_content=None,
+    ).and_return()
+
+    flexmock(GitProject).should_receive("get_pr").and_return(
+        flexmock(source_project=flexmock())
+    )
+    flexmock(GitProject).should_receive("set_commit_status").and_return().never()
+    flexmock(SRPMBuildModel).should_receive("create_with_new_run").and_return(
+        (
+            flexmock(status="success", id=2)
+            .should_receive("set_url")
+            .with_args("https://some.host/my.srpm")
+            .mock()
+            .should_receive("set_start_time")
+            .mock()
+            .should_receive("set_status")
+            .mock()
+            .should_receive("set_logs")
+            .mock()
+            .should_receive("set_end_time")
+            .mock(),
+            flexmock(),
+        )
+    )
+    # no pending build without a task ID is stored
+    flexmock(KojiBuildTargetModel).should_receive("create_for_targets").never()
+    flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
+    flexmock(PackitAPI).should_receive("init_kerberos_ticket").once()
+
+    # koji build
+    flexmock(Upstream).should_receive("koji_build").and_return(
+        "Uploading srpm: /python-ogr-0.11.1.src.rpm\n"
+    )
+
+    result = helper.run_koji_build()
+    assert not result["success"]
+    assert result["details"]["errors"] == {
+        "bright-future": "Koji task ID not found in the output of the build submit."
+    }
+
+
+def test_koji_build_one_of_multiple_targets_failed(github_pr_event):
+    trigger = flexmock(
+        job_config_trigger_type=JobConfigTriggerType.pull_request,
+        id=123,
+        job_trigger_model_type=JobTriggerModelType.pull_request,
+    )
+    flexmock(JobTriggerModel).should_receive("get_or_create").with_args(
+        type=JobTriggerModelType.pull_request, trigger_id=123
+    ).and_return(flexmock(id=2, type=JobTriggerModelType.pull_request))
+    flexmock(AddPullRequestDbTrigger).should_receive("db_trigger").and_return(trigger)
+    helper = build_helper(
+        event=github_pr_event,
+        _targets=["bright-future", "dark-past"],
+        scratch=True,
+        db_trigger=trigger,
+    )
+    flexmock(koji_build).should_receive("get_all_koji_targets").and_return(
+        ["dark-past", "bright-future"]
+    ).once()
+
+    # 2x SRPM
+    flexmock(StatusReporter).should_receive("set_status").with_args(
+        state=BaseCommitStatus.running,
+        description="Building SRPM ...",
+        check_name=str,
+        url="",
+        links_to_external_services=None,
+        markdown_content=None,
+    ).and_return().times(2)
+    flexmock(StatusReporter).should_receive("set_status").with_args(
+        state=BaseCommitStatus.error,
+        description="Submit of the build failed: some error",
+        check_name="koji-build:dark-past",
+        url=get_srpm_build_info_url(2),
+        links_to_external_services=None,
+        markdown_content=None,
+    ).and_return().once()
+    flexmock(StatusReporter).should_receive("set_status").with_args(
+        state=BaseCommitStatus.running,
+        description="Building RPM ...",
+        check_name="koji-build:bright-future",
+        url=get_koji_build_info_url(1),
+        links_to_external_services=None,
+        markdown_content=None,
+    ).and_return().once()
+
+    flexmock(GitProject).should_receive("get_pr").and_return(
+        flexmock(source_project=flexmock())
+    )
+    flexmock(GitProject).should_receive("set_commit_status").and_return().never()
+    flexmock(SRPMBuildModel).should_receive("create_with_new_run").and_return(
+        (
+            flexmock(status="success", id=2)
+            .should_receive("set_url")
+            .with_args("https://some.host/my.srpm")
+            .mock()
+            .should_receive("set_start_time")
+            .mock()
+            .should_receive("set_status")
+            .mock()
+            .should_receive("set_logs")
+            .mock()
+            .should_receive("set_end_time")
+            .mock(),
+            flexmock(),
+        )
+    )
+    # only the submitted build is created
+    flexmock(KojiBuildTargetModel).should_receive("create_for_targets").with_args(
+        builds=[
+            (
+                "bright-future",
+                "43429338",
+                "https://koji.fedoraproject.org/koji/taskinfo?taskID=43429338",
+            )
+        ],
+        commit_sha=str,
+        status="pending",
+        scratch=True,
+        run_model=object,
+    ).and_return([flexmock(id=1)]).once()
+    flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
+
+    # koji build
+    def koji_build(scratch, nowait, koji_target, srpm_path):
+        if koji_target == "dark-past":
+            raise Exception("some error")
+        return (
+            "Created task: 43429338\n"
+            "Task info: https://koji.fedoraproject.org/koji/taskinfo?taskID=43429338\n"
+        )
+
+    flexmock(Upstream).should_receive("koji_build").replace_with(koji_build).times(2)
+    flexmock(sentry_integration).should_receive("send_to_sentry").and_return().once()
+
+    result = helper.run_koji_build()
+    assert not result["success"]
+    assert result["details"]["errors"] == {"dark-past": "some error"}
+
+
 def test_koji_build_failed_srpm(github_pr_event):
     trigger = flexmock(
         job_config_trigger_type=JobConfigTriggerType.pull_request,
@@ -523,7 +727,7 @@ def test_koji_build_failed_srpm(github_pr_event):
             flexmock(),
         )
     )
-    flexmock(KojiBuildTargetModel).should_receive("create").never()
+    flexmock(KojiBuildTargetModel).should_receive("create_for_targets").never()
     flexmock(sentry_integration).should_receive("send_to_sentry").and_return().once()
 
     result = helper.run_koji_build()
@@ -576,9 +780,9 @@ def test_koji_build_targets_override(github_pr_event):
             flexmock(),
         )
     )
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(
-        flexmock(id=1)
-    ).and_return(flexmock(id=2))
+    flexmock(KojiBuildTargetModel).should_receive("create_for_targets").and_return(
+        [flexmock(id=1)]
+    )
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
 
     # koji build
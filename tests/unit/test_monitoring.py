@@ -0,0 +1,106 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import threading
+
+import pytest
+from flexmock import flexmock
+from prometheus_client import CollectorRegistry
+
+from packit_service.worker import monitoring
+from packit_service.worker.monitoring import Pushgateway
+
+
+@pytest.fixture()
+def worker_env(monkeypatch):
+    monkeypatch.setenv("HOSTNAME", "packit-worker-0")
+    monkeypatch.delenv("METRICS_PORT", raising=False)
+
+
+def test_push_is_done_in_background(worker_env):
+    pushgateway = Pushgateway()
+    flexmock(threading.Thread).should_receive("start").once()
+    flexmock(monitoring).should_receive("push_to_gateway").never()
+
+    pushgateway.copr_builds_queued.inc()
+    pushgateway.push()
+    pushgateway.copr_builds_started.inc()
+    pushgateway.push()
+
+
+def test_flush(worker_env):
+    pushgateway = Pushgateway()
+    flexmock(threading.Thread).should_receive("start").once()
+    flexmock(monitoring).should_receive("push_to_gateway").with_args(
+        "http://pushgateway", job="packit-worker-0", registry=pushgateway.registry
+    ).once()
+
+    pushgateway.push()
+    pushgateway.push()
+    pushgateway.flush()
+    # nothing changed since the last push
+    pushgateway.flush()
+
+
+def test_flush_failed(worker_env):
+    pushgateway = Pushgateway()
+    flexmock(threading.Thread).should_receive("start").once()
+    flexmock(monitoring).should_receive("push_to_gateway").and_raise(
+        OSError
+    ).and_return(None).twice()
+
+    pushgateway.push()
+    pushgateway.flush()
+    # retried
+    pushgateway.flush()
+    pushgateway.flush()
+
+
+def test_metrics_served(worker_env, monkeypatch):
+    monkeypatch.setenv("METRICS_PORT", "8000")
+    pushgateway = Pushgateway()
+    flexmock(monitoring).should_receive("start_http_server").with_args(
+        8000, registry=pushgateway.registry
+    ).once()
+    flexmock(monitoring).should_receive("push_to_gateway").never()
+
+    pushgateway.start()
+    pushgateway.push()
+    pushgateway.flush()
+
+
+def test_metrics_server_not_started_by_push(worker_env, monkeypatch):
+    monkeypatch.setenv("METRICS_PORT", "8000")
+    pushgateway = Pushgateway()
+    flexmock(monitoring).should_receive("start_http_server").never()
+    flexmock(threading.Thread).should_receive("start").never()
+
+    pushgateway.copr_builds_queued.inc()
+    pushgateway.push()
+
+
+def test_metrics_server_failed(worker_env, monkeypatch):
+    monkeypatch.setenv("METRICS_PORT", "8000")
+    pushgateway = Pushgateway()
+    flexmock(monitoring).should_receive("start_http_server").and_raise(
+        OSError(98, "Address already in use")
+    ).once()
+
+    # logged, the worker keeps running
+    pushgateway.start()
+
+
+def test_metrics_served_multiprocess(worker_env, monkeypatch, tmp_path):
+    monkeypatch.setenv("METRICS_PORT", "8000")
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    pushgateway = Pushgateway()
+    flexmock(monitoring.multiprocess).should_receive("MultiProcessCollector").once()
+    flexmock(monitoring).should_receive("start_http_server").with_args(
+        8000, registry=CollectorRegistry
+    ).once()
+    flexmock(monitoring.multiprocess).should_receive("mark_process_dead").with_args(
+        1234
+    ).once()
+
+    pushgateway.start()
+    pushgateway.mark_process_dead(1234)
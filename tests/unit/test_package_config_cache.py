@@ -0,0 +1,131 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+from flexmock import flexmock
+
+from packit.config import (
+    CommonPackageConfig,
+    JobConfig,
+    JobConfigTriggerType,
+    JobType,
+    PackageConfig,
+)
+from packit_service.config import PackageConfigGetter
+from packit_service.package_config_cache import PackageConfigCache
+from packit_service.worker.monitoring import pushgateway
+from packit_service.worker.events import PushGitHubEvent
+
+PROJECT_URL = "https://github.com/packit/ogr"
+COMMIT_SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+@pytest.fixture()
+def package_config():
+    return PackageConfig(
+        jobs=[
+            JobConfig(
+                type=JobType.copr_build,
+                trigger=JobConfigTriggerType.pull_request,
+                packages={"package": CommonPackageConfig()},
+            )
+        ],
+        packages={"package": CommonPackageConfig()},
+    )
+
+
+@pytest.mark.parametrize(
+    "project_url,commit_sha,cacheable",
+    [
+        (PROJECT_URL, COMMIT_SHA, True),
+        (PROJECT_URL, "main", False),
+        (PROJECT_URL, "0123456", False),
+        (PROJECT_URL, None, False),
+        (None, COMMIT_SHA, False),
+    ],
+)
+def test_is_cacheable(project_url, commit_sha, cacheable):
+    assert PackageConfigCache.is_cacheable(project_url, commit_sha) == cacheable
+
+
+def test_get_set(package_config):
+    cache = PackageConfigCache(use_redis=False)
+    flexmock(pushgateway.package_config_cache_hits).should_receive("inc").twice()
+    flexmock(pushgateway.package_config_cache_misses).should_receive("inc").once()
+    assert cache.get(PROJECT_URL, COMMIT_SHA) is None
+    cache.set(PROJECT_URL, COMMIT_SHA, package_config)
+
+    cached = cache.get(PROJECT_URL, COMMIT_SHA)
+    assert cached == package_config
+    # every caller gets its own copy
+    assert cached is not package_config
+    assert cache.get(PROJECT_URL, COMMIT_SHA) is not cached
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_lru_eviction(package_config):
+    cache = PackageConfigCache(size=2, use_redis=False)
+    commits = [str(i) * 40 for i in range(3)]
+    cache.set(PROJECT_URL, commits[0], package_config)
+    cache.set(PROJECT_URL, commits[1], package_config)
+    # make the first one most recently used
+    assert cache.get(PROJECT_URL, commits[0])
+    cache.set(PROJECT_URL, commits[2], package_config)
+
+    assert cache.get(PROJECT_URL, commits[0])
+    assert cache.get(PROJECT_URL, commits[1]) is None
+    assert cache.get(PROJECT_URL, commits[2])
+
+
+def test_redis_layer(package_config):
+    cache = PackageConfigCache(use_redis=True)
+    stored = {}
+    redis = flexmock()
+    redis.should_receive("setex").replace_with(
+        lambda key, ttl, value: stored.update({key: value})
+    ).once()
+    redis.should_receive("get").replace_with(lambda key: stored.get(key))
+    cache._redis = redis
+
+    cache.set(PROJECT_URL, COMMIT_SHA, package_config)
+    assert json.loads(stored[f"package-config:{PROJECT_URL}:{COMMIT_SHA}"])
+
+    # another worker with an empty in-process cache
+    other_cache = PackageConfigCache(use_redis=True)
+    other_cache._redis = redis
+    assert other_cache.get(PROJECT_URL, COMMIT_SHA) == package_config
+
+
+def test_redis_failure_is_not_fatal(package_config):
+    cache = PackageConfigCache(use_redis=True)
+    cache._redis = (
+        flexmock()
+        .should_receive("get")
+        .and_raise(ConnectionError)
+        .mock()
+        .should_receive("setex")
+        .and_raise(ConnectionError)
+        .mock()
+    )
+    assert cache.get(PROJECT_URL, COMMIT_SHA) is None
+    cache.set(PROJECT_URL, COMMIT_SHA, package_config)
+    assert cache.get(PROJECT_URL, COMMIT_SHA) == package_config
+
+
+def test_event_uses_cache(package_config):
+    flexmock(PackageConfigGetter).should_receive(
+        "get_package_config_from_repo"
+    ).and_return(package_config).once()
+
+    for _ in range(2):
+        event = PushGitHubEvent(
+            repo_namespace="packit",
+            repo_name="ogr",
+            git_ref="main",
+            project_url=PROJECT_URL,
+            commit_sha=COMMIT_SHA,
+        )
+        event._project = flexmock()
+        assert event.get_package_config() == package_config
@@ -0,0 +1,86 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from flexmock import flexmock
+
+from packit_service.payload_store import (
+    PayloadNotFoundException,
+    PayloadStore,
+    PayloadStoreUnavailableException,
+)
+
+EVENT = {"event_type": "PushGitHubEvent", "commit_sha": "abcdef", "pr_id": None}
+
+
+@pytest.fixture()
+def redis():
+    stored, writes = {}, []
+
+    def setex(key, ttl, value):
+        writes.append(key)
+        stored[key] = value.encode()
+
+    redis = flexmock(stored=stored, writes=writes)
+    redis.should_receive("setex").replace_with(setex)
+    redis.should_receive("get").replace_with(lambda key: stored.get(key))
+    return redis
+
+
+def test_disabled():
+    store = PayloadStore(use_redis=False)
+    assert store.reference(EVENT) is EVENT
+    assert store.resolve(EVENT) is EVENT
+
+
+def test_reference_and_resolve(redis):
+    store = PayloadStore(use_redis=True)
+    store._redis = redis
+
+    reference = store.reference(EVENT)
+    assert PayloadStore.is_reference(reference)
+    # the same content, the same reference, stored only once
+    assert store.reference(dict(reversed(EVENT.items()))) == reference
+    assert len(redis.writes) == 1
+
+    # another worker with an empty in-process cache
+    other_store = PayloadStore(use_redis=True)
+    other_store._redis = redis
+    resolved = other_store.resolve(reference)
+    assert resolved == EVENT
+    # every caller gets its own copy
+    assert other_store.resolve(reference) is not resolved
+
+
+def test_resolve_cached(redis):
+    store = PayloadStore(use_redis=True)
+    store._redis = redis
+    reference = store.reference(EVENT)
+
+    redis.should_receive("get").never()
+    assert store.resolve(reference) == EVENT
+
+
+def test_resolve_expired(redis):
+    store = PayloadStore(use_redis=True)
+    store._redis = redis
+
+    with pytest.raises(PayloadNotFoundException):
+        store.resolve({"payload_ref": "payload:0123"})
+
+
+def test_resolve_redis_unavailable():
+    store = PayloadStore(use_redis=True)
+    store._redis = (
+        flexmock().should_receive("get").and_raise(RedisConnectionError).mock()
+    )
+
+    with pytest.raises(PayloadStoreUnavailableException):
+        store.resolve({"payload_ref": "payload:0123"})
+
+
+def test_redis_failure_is_not_fatal():
+    store = PayloadStore(use_redis=True)
+    store._redis = flexmock().should_receive("setex").and_raise(ConnectionError).mock()
+    assert store.reference(EVENT) is EVENT
@@ -15,6 +15,7 @@ from ogr.services.github.check_run import (
 from ogr.services.gitlab import GitlabProject
 from ogr.services.pagure import PagureProject
 
+from packit_service.models import PostedCommentModel
 from packit_service.worker.reporting import (
     StatusReporter,
     BaseCommitStatus,
@@ -22,6 +23,7 @@ from packit_service.worker.reporting import (
     StatusReporterGitlab,
     StatusReporterGithubChecks,
     DuplicateCheckMode,
+    reported_statuses,
 )
 
 create_table_content = StatusReporterGithubChecks._create_table
@@ -456,6 +458,127 @@ def test_status_instead_check(
     reporter.set_status(state, title, check_name, url)
 
 
+def test_report_multiple_checks():
+    project = GitlabProject(None, None, None)
+    reporter = StatusReporter.get_instance(
+        project=project, commit_sha="7654321", packit_user="packit"
+    )
+    check_names = [f"rpm-build:fedora-{version}-x86_64" for version in range(30, 40)]
+    for check_name in check_names:
+        flexmock(GitlabProject).should_receive("set_commit_status").with_args(
+            "7654321", CommitStatus.running, "url", "Building...", check_name, trim=True
+        ).once()
+
+    reporter.report(
+        BaseCommitStatus.running, "Building...", url="url", check_names=check_names
+    )
+
+
+@pytest.fixture()
+def reported_statuses_redis(monkeypatch):
+    stored = {}
+
+    def setex(key, ttl, value):
+        stored[key] = value.encode()
+
+    redis = flexmock(stored=stored)
+    redis.should_receive("setex").replace_with(setex)
+    redis.should_receive("mget").replace_with(
+        lambda keys: [stored.get(key) for key in keys]
+    )
+    monkeypatch.setattr(reported_statuses, "use_redis", True)
+    monkeypatch.setattr(reported_statuses, "_redis", redis)
+    return redis
+
+
+def test_report_skips_unchanged_status(reported_statuses_redis):
+    project = GitlabProject(None, None, None)
+    reporter = StatusReporter.get_instance(
+        project=project, commit_sha="7654321", packit_user="packit"
+    )
+    flexmock(GitlabProject).should_receive("set_commit_status").with_args(
+        "7654321", CommitStatus.running, "url", "Building...", "rpm-build", trim=True
+    ).once()
+    flexmock(GitlabProject).should_receive("set_commit_status").with_args(
+        "7654321", CommitStatus.success, "url", "Built.", "rpm-build", trim=True
+    ).once()
+
+    reporter.report(BaseCommitStatus.running, "Building...", "url", None, "rpm-build")
+    # reported by another worker
+    other_reporter = StatusReporter.get_instance(
+        project=project, commit_sha="7654321", packit_user="packit"
+    )
+    other_reporter.report(
+        BaseCommitStatus.running, "Building...", "url", None, "rpm-build"
+    )
+    reporter.report(BaseCommitStatus.success, "Built.", "url", None, "rpm-build")
+
+
+def test_report_skips_nothing_without_redis(monkeypatch):
+    project = GitlabProject(None, None, None)
+    reporter = StatusReporter.get_instance(
+        project=project, commit_sha="7654321", packit_user="packit"
+    )
+    monkeypatch.setattr(reported_statuses, "use_redis", False)
+    flexmock(GitlabProject).should_receive("set_commit_status").with_args(
+        "7654321", CommitStatus.running, "url", "Building...", "rpm-build", trim=True
+    ).twice()
+
+    # the duplicates in one report are still skipped
+    reporter.report(
+        BaseCommitStatus.running,
+        "Building...",
+        "url",
+        None,
+        ["rpm-build", "rpm-build"],
+    )
+    reporter.report(BaseCommitStatus.running, "Building...", "url", None, "rpm-build")
+
+
+def test_report_failed_status_not_remembered(reported_statuses_redis):
+    project = GitlabProject(None, None, None)
+    reporter = StatusReporter.get_instance(
+        project=project, commit_sha="7654321", packit_user="packit"
+    )
+    exception = GitlabAPIException()
+    exception.__cause__ = gitlab.GitlabError(response_code=500)
+    calls = []
+
+    def set_commit_status(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise exception
+
+    flexmock(GitlabProject).should_receive("set_commit_status").replace_with(
+        set_commit_status
+    )
+    flexmock(StatusReporter).should_receive("_add_commit_comment_with_status")
+
+    with pytest.raises(GitlabAPIException):
+        reporter.report(BaseCommitStatus.running, "Building...", check_names="build")
+
+    reporter.report(BaseCommitStatus.running, "Building...", check_names="build")
+    assert len(calls) == 2
+
+
+def test_report_commented_status_not_remembered(reported_statuses_redis):
+    project = GitlabProject(None, None, None)
+    reporter = StatusReporter.get_instance(
+        project=project, commit_sha="7654321", packit_user="packit"
+    )
+    exception = GitlabAPIException()
+    exception.__cause__ = gitlab.GitlabError(response_code=403)
+
+    flexmock(GitlabProject).should_receive("set_commit_status").and_raise(
+        exception
+    ).twice()
+    flexmock(StatusReporter).should_receive("_add_commit_comment_with_status").twice()
+
+    reporter.report(BaseCommitStatus.running, "Building...", check_names="build")
+    reporter.report(BaseCommitStatus.running, "Building...", check_names="build")
+    assert not reported_statuses_redis.stored
+
+
 def test_create_table():
     assert create_table_content(
         "dashboard.packit.dev-url",
@@ -621,3 +744,110 @@ def test_comment(pr_id, commit_sha, duplicate_check, existing_comments, should_c
             act_upon.should_receive("commit_comment").never()
 
     reporter.comment(body="foo", duplicate_check=duplicate_check)
+
+
+@pytest.mark.parametrize(
+    "posted_comments, should_comment",
+    [
+        (["foo", "bar"], False),
+        (["bar"], True),
+    ],
+)
+def test_comment_recorded(posted_comments, should_comment):
+    project = GithubProject(None, None, None)
+    reporter = StatusReporter.get_instance(
+        project=project,
+        commit_sha="1234abd",
+        pr_id=1,
+        packit_user="packit-as-a-service",
+        project_url="https://github.com/packit/ogr",
+    )
+    flexmock(PostedCommentModel).should_receive("get_body_hashes").with_args(
+        project_url="https://github.com/packit/ogr", pr_id=1, commit_sha=None
+    ).and_return([PostedCommentModel.hash_body(body) for body in posted_comments])
+
+    pr = flexmock()
+    flexmock(project).should_receive("get_pr").with_args(pr_id=1).and_return(pr)
+    # the comments are not listed from the forge
+    pr.should_receive("get_comments").never()
+    pr.should_receive("comment").times(1 if should_comment else 0)
+    flexmock(PostedCommentModel).should_receive("add_body_hashes").with_args(
+        project_url="https://github.com/packit/ogr",
+        body_hashes=[PostedCommentModel.hash_body("foo")],
+        only_if_recorded=False,
+        pr_id=1,
+        commit_sha=None,
+    ).times(1 if should_comment else 0)
+
+    reporter.comment(body="foo", duplicate_check=DuplicateCheckMode.check_all_comments)
+
+
+def test_comment_last_not_taken_from_record():
+    """Our last comment could have been posted outside the reporter or deleted."""
+    project = GithubProject(None, None, None)
+    reporter = StatusReporter.get_instance(
+        project=project,
+        commit_sha="1234abd",
+        pr_id=1,
+        packit_user="packit-as-a-service",
+        project_url="https://github.com/packit/ogr",
+    )
+    flexmock(PostedCommentModel).should_receive("get_body_hashes").never()
+
+    pr = flexmock()
+    flexmock(project).should_receive("get_pr").with_args(pr_id=1).and_return(pr)
+    pr.should_receive("get_comments").with_args(reverse=True).and_return(
+        [flexmock(author="packit-as-a-service", body="bar")]
+    ).once()
+    pr.should_receive("comment").once()
+    # the comment is added to the record only if there is one already
+    flexmock(PostedCommentModel).should_receive("add_body_hashes").with_args(
+        project_url="https://github.com/packit/ogr",
+        body_hashes=[PostedCommentModel.hash_body("foo")],
+        only_if_recorded=True,
+        pr_id=1,
+        commit_sha=None,
+    ).once()
+
+    reporter.comment(body="foo", duplicate_check=DuplicateCheckMode.check_last_comment)
+
+
+def test_comment_not_recorded():
+    project = GithubProject(None, None, None)
+    reporter = StatusReporter.get_instance(
+        project=project,
+        commit_sha="1234abd",
+        packit_user="packit-as-a-service",
+        project_url="https://github.com/packit/ogr",
+    )
+    flexmock(PostedCommentModel).should_receive("get_body_hashes").and_return(None)
+    flexmock(project).should_receive("get_commit_comments").with_args(
+        "1234abd"
+    ).and_return(
+        [
+            flexmock(author="packit-as-a-service", body="bar"),
+            flexmock(author="Foo"),
+            flexmock(author="packit-as-a-service", body="baz"),
+        ]
+    ).once()
+    flexmock(project).should_receive("commit_comment").once()
+
+    # comments listed from the forge are recorded, then the new one
+    flexmock(PostedCommentModel).should_receive("add_body_hashes").with_args(
+        project_url="https://github.com/packit/ogr",
+        body_hashes=[
+            PostedCommentModel.hash_body("bar"),
+            PostedCommentModel.hash_body("baz"),
+        ],
+        pr_id=None,
+        commit_sha="1234abd",
+    ).once().ordered()
+    flexmock(PostedCommentModel).should_receive("add_body_hashes").with_args(
+        project_url="https://github.com/packit/ogr",
+        body_hashes=[PostedCommentModel.hash_body("foo")],
+        only_if_recorded=False,
+        pr_id=None,
+        commit_sha="1234abd",
+    ).once().ordered()
+
+    reporter.comment(body="foo", duplicate_check=DuplicateCheckMode.check_all_comments)
@@ -7,8 +7,17 @@ from celery.app.task import Task
 from copr.v3 import CoprRequestException
 from flexmock import flexmock
 
+from packit_service import celery_config
+from packit_service.celerizer import celery_app
+from packit_service.constants import CELERY_TASK_LONG_RUNNING_QUEUE
+from packit_service.payload_store import (
+    PayloadNotFoundException,
+    PayloadStoreUnavailableException,
+    payload_store,
+)
 from packit_service.worker.tasks import run_copr_build_handler
 from packit_service.worker.handlers import CoprBuildHandler
+from packit_service.worker.handlers.abstract import TaskName
 
 
 def test_autoretry():
@@ -21,3 +30,45 @@ def test_autoretry():
     flexmock(Task).should_receive("retry").and_raise(CoprRequestException).once()
     with pytest.raises(CoprRequestException):
         run_copr_build_handler({}, {}, {})
+
+
+def test_no_retry_for_lost_payload():
+    reference = {"payload_ref": "payload:abcdef"}
+    flexmock(payload_store).should_receive("resolve").with_args(reference).and_raise(
+        PayloadNotFoundException
+    )
+    flexmock(payload_store).should_receive("resolve").with_args({}).and_return({})
+    flexmock(CoprBuildHandler).should_receive("run_job").never()
+    flexmock(Task).should_receive("retry").never()
+
+    with pytest.raises(PayloadNotFoundException):
+        run_copr_build_handler(reference, {}, {})
+
+
+def test_retry_for_unavailable_payload_store():
+    reference = {"payload_ref": "payload:abcdef"}
+    flexmock(payload_store).should_receive("resolve").with_args(reference).and_raise(
+        PayloadStoreUnavailableException
+    )
+    flexmock(payload_store).should_receive("resolve").with_args({}).and_return({})
+    flexmock(CoprBuildHandler).should_receive("run_job").never()
+
+    def retry(exc, **kwargs):
+        assert isinstance(exc, PayloadStoreUnavailableException)
+        raise exc
+
+    flexmock(Task).should_receive("retry").replace_with(retry).once()
+    with pytest.raises(PayloadStoreUnavailableException):
+        run_copr_build_handler(reference, {}, {})
+
+
+def test_task_routes_match_tasks():
+    # a typo in the routes would silently send the task to the default queue
+    assert set(celery_config.task_routes) <= set(celery_app.tasks)
+    long_running = {
+        name
+        for name, route in celery_config.task_routes.items()
+        if route["queue"] == CELERY_TASK_LONG_RUNNING_QUEUE
+    }
+    assert TaskName.copr_build.value in long_running
+    assert TaskName.copr_build_end.value not in long_running
@@ -137,11 +137,8 @@ def test_testing_farm_response(
         ),
         target="fedora-rawhide-x86_64",
     )
-    tft_test_run_model.should_receive("set_status").with_args(
-        tests_result, created=created_dt
-    ).and_return().once()
-    tft_test_run_model.should_receive("set_web_url").with_args(
-        "some url"
+    tft_test_run_model.should_receive("update").with_args(
+        status=tests_result, web_url="some url"
     ).and_return().once()
 
     flexmock(TFTTestRunTargetModel).should_receive("get_by_pipeline_id").and_return(
@@ -22,6 +22,7 @@ from packit_service.models import (
     CoprBuildTargetModel,
     JobTriggerModel,
     sa_session_transaction,
+    SRPMBuildLogsModel,
     SRPMBuildModel,
     PullRequestModel,
     GitProjectModel,
@@ -32,6 +33,7 @@ from packit_service.models import (
     PipelineModel,
     JobTriggerModelType,
     KojiBuildTargetModel,
+    MergedRunModel,
     TFTTestRunTargetModel,
     TestingFarmResult,
     GithubInstallationModel,
@@ -42,6 +44,7 @@ from packit_service.models import (
     ProposeDownstreamStatus,
     SourceGitPRDistGitPRModel,
     BuildStatus,
+    PostedCommentModel,
 )
 from packit_service.worker.events import InstallationEvent
 
@@ -155,16 +158,19 @@ def clean_db():
     with sa_session_transaction() as session:
 
         session.query(SourceGitPRDistGitPRModel).delete()
+        session.query(PostedCommentModel).delete()
 
         session.query(AllowlistModel).delete()
         session.query(GithubInstallationModel).delete()
 
+        session.query(MergedRunModel).delete()
         session.query(PipelineModel).delete()
         session.query(JobTriggerModel).delete()
 
         session.query(TFTTestRunTargetModel).delete()
         session.query(CoprBuildTargetModel).delete()
         session.query(KojiBuildTargetModel).delete()
+        session.query(SRPMBuildLogsModel).delete()
         session.query(SRPMBuildModel).delete()
         session.query(ProposeDownstreamTargetModel).delete()
         session.query(ProposeDownstreamModel).delete()
@@ -0,0 +1,105 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Query-plan regression tests: the hot queries have to be able to use an index.
+
+Sequential scans are disabled for the EXPLAIN, so the planner picks one
+only if there is no index usable for the query.
+"""
+from datetime import timedelta
+from typing import Callable
+
+import pytest
+from sqlalchemy import event, text
+
+from packit_service.models import (
+    BuildStatus,
+    CoprBuildTargetModel,
+    JobTriggerModel,
+    JobTriggerModelType,
+    SRPMBuildModel,
+    TFTTestRunTargetModel,
+    TestingFarmResult,
+    engine,
+    sa_session,
+    sa_session_transaction,
+)
+from tests_openshift.conftest import SampleValues
+
+
+def get_query_plan(run_query: Callable[[], None]) -> str:
+    """
+    Run the query, capture the (first) SELECT statement sent to the database
+    and return its plan.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        run_query()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert statements, "No SELECT statement was executed."
+    statement, parameters = statements[0]
+
+    with sa_session_transaction() as session:
+        session.execute(text("SET LOCAL enable_seqscan = off"))
+        cursor = session.connection().connection.cursor()
+        cursor.execute(f"EXPLAIN {statement}", parameters)
+        return "\n".join(row[0] for row in cursor.fetchall())
+
+
+@pytest.mark.parametrize(
+    "run_query",
+    [
+        pytest.param(
+            lambda: JobTriggerModel.get_or_create(
+                type=JobTriggerModelType.pull_request, trigger_id=SampleValues.pr_id
+            ),
+            id="JobTriggerModel.get_or_create",
+        ),
+        pytest.param(
+            lambda: CoprBuildTargetModel.get_all_by(
+                project_name=SampleValues.project,
+                commit_sha=SampleValues.commit_sha,
+                owner=SampleValues.owner,
+                target=SampleValues.target,
+            ).all(),
+            id="CoprBuildTargetModel.get_all_by",
+        ),
+        pytest.param(
+            lambda: CoprBuildTargetModel.get_all_by_status(BuildStatus.pending).all(),
+            id="CoprBuildTargetModel.get_all_by_status",
+        ),
+        pytest.param(
+            lambda: TFTTestRunTargetModel.get_all_by_status(
+                TestingFarmResult.new,
+                TestingFarmResult.queued,
+                TestingFarmResult.running,
+            ).all(),
+            id="TFTTestRunTargetModel.get_all_by_status",
+        ),
+        pytest.param(
+            lambda: TFTTestRunTargetModel.get_all_by_commit_target(
+                commit_sha=SampleValues.commit_sha, target=SampleValues.target
+            ).all(),
+            id="TFTTestRunTargetModel.get_all_by_commit_target",
+        ),
+        pytest.param(
+            lambda: SRPMBuildModel.get_older_than(timedelta(days=90)).all(),
+            id="SRPMBuildModel.get_older_than",
+        ),
+    ],
+)
+def test_no_sequential_scan(clean_before_and_after, a_new_test_run_pr, run_query):
+    sa_session().expire_all()
+
+    plan = get_query_plan(run_query)
+
+    assert "Seq Scan" not in plan, plan
@@ -11,15 +11,19 @@ from packit_service.models import (
     GitBranchModel,
     GitProjectModel,
     GithubInstallationModel,
+    JobTriggerModel,
     JobTriggerModelType,
     KojiBuildTargetModel,
+    MergedRunModel,
     ProjectAuthenticationIssueModel,
     ProjectReleaseModel,
     PullRequestModel,
+    SRPMBuildLogsModel,
     SRPMBuildModel,
     SourceGitPRDistGitPRModel,
     TFTTestRunTargetModel,
     TestingFarmResult,
+    sa_session,
     sa_session_transaction,
     PipelineModel,
     ProposeDownstreamTargetStatus,
@@ -28,6 +32,7 @@ from packit_service.models import (
     ProposeDownstreamModel,
     Session,
     BuildStatus,
+    PostedCommentModel,
 )
 from tests_openshift.conftest import SampleValues
 
@@ -105,6 +110,25 @@ def test_copr_build_get_branch(
     assert not copr_builds_with_different_triggers[2].get_branch_name()
 
 
+def test_copr_build_get_by_ids(clean_before_and_after, multiple_copr_builds):
+    ids = [build.id for build in multiple_copr_builds[:2]]
+    builds = list(CoprBuildTargetModel.get_by_ids(ids))
+    assert {build.id for build in builds} == set(ids)
+    assert all(build.get_job_trigger_model() for build in builds)
+
+
+def test_get_trigger_objects(
+    clean_before_and_after, copr_builds_with_different_triggers
+):
+    job_triggers = [
+        build.get_job_trigger_model() for build in copr_builds_with_different_triggers
+    ]
+    trigger_objects = JobTriggerModel.get_trigger_objects(job_triggers)
+    assert len(trigger_objects) == 3
+    for job_trigger in job_triggers:
+        assert trigger_objects[job_trigger.id] == job_trigger.get_trigger_object()
+
+
 def test_get_merged_chroots(clean_before_and_after, too_many_copr_builds):
     # fetch 10 merged groups of builds
     builds_list = list(CoprBuildTargetModel.get_merged_chroots(10, 20))
@@ -155,6 +179,25 @@ def test_copr_build_set_status(clean_before_and_after, a_copr_build_for_pr):
     assert b.status == BuildStatus.success
 
 
+def test_copr_build_mark_timed_out_as_error(
+    clean_before_and_after, a_copr_build_for_pr
+):
+    timeout = timedelta(days=1)
+    assert CoprBuildTargetModel.mark_timed_out_as_error(timeout) == []
+
+    a_copr_build_for_pr.update(
+        build_submitted_time=datetime.utcnow() - timedelta(days=2)
+    )
+    assert CoprBuildTargetModel.mark_timed_out_as_error(timeout) == [
+        a_copr_build_for_pr.id
+    ]
+    assert a_copr_build_for_pr.status == BuildStatus.error
+    assert not list(CoprBuildTargetModel.get_all_by_status(BuildStatus.pending))
+
+    # only the pending builds are marked
+    assert CoprBuildTargetModel.mark_timed_out_as_error(timeout) == []
+
+
 def test_copr_build_set_build_logs_url(clean_before_and_after, a_copr_build_for_pr):
     url = "https://copr.fp.o/logs/12456/build.log"
     a_copr_build_for_pr.set_build_logs_url(url)
@@ -280,6 +323,64 @@ def test_get_srpm_builds_in_give_range(
     assert builds_list[0].status == "success"
 
 
+def test_get_srpm_builds_before(
+    clean_before_and_after, srpm_build_model_with_new_run_for_pr
+):
+    srpm_build, _ = srpm_build_model_with_new_run_for_pr
+    assert list(SRPMBuildModel.get_range(0, 10, before=srpm_build.id + 1)) == [
+        srpm_build
+    ]
+    assert not list(SRPMBuildModel.get_range(0, 10, before=srpm_build.id))
+
+
+def test_srpm_build_logs(clean_before_and_after, srpm_build_model_with_new_run_for_pr):
+    srpm_build, _ = srpm_build_model_with_new_run_for_pr
+    assert srpm_build.logs == SampleValues.srpm_logs
+    assert srpm_build.srpm_build_logs.compressed_logs != SampleValues.srpm_logs.encode()
+
+    logs = "\N{PACKAGE} building...\n" * 1000
+    srpm_build.set_logs(logs)
+    build = SRPMBuildModel.get_by_id(srpm_build.id)
+    assert build.logs == logs
+    assert "".join(build.get_logs_chunks(chunk_size=7)) == logs
+
+    srpm_build.set_logs(None)
+    assert SRPMBuildModel.get_by_id(srpm_build.id).logs is None
+    assert not list(srpm_build.get_logs_chunks())
+    assert not sa_session().query(SRPMBuildLogsModel).all()
+
+
+def test_srpm_build_discard_logs(
+    clean_before_and_after,
+    srpm_build_model_with_new_run_for_pr,
+    srpm_build_model_with_new_run_for_branch,
+):
+    old_build, _ = srpm_build_model_with_new_run_for_pr
+    new_build, _ = srpm_build_model_with_new_run_for_branch
+    old_build.update(
+        build_submitted_time=datetime.utcnow() - timedelta(days=100),
+        url="https://some.host/my.srpm",
+    )
+    submitted_before = datetime.utcnow() - timedelta(days=30)
+
+    discarded = SRPMBuildModel.discard_logs(
+        submitted_before=submitted_before, after_id=0, batch_size=10
+    )
+    assert [id_ for id_, _ in discarded] == [old_build.id]
+    assert all(size > 0 for _, size in discarded)
+    assert old_build.logs is None
+    assert old_build.url is None
+    assert new_build.logs == SampleValues.srpm_logs
+
+    # already discarded
+    assert (
+        SRPMBuildModel.discard_logs(
+            submitted_before=submitted_before, after_id=0, batch_size=10
+        )
+        == []
+    )
+
+
 def test_get_all_builds(clean_before_and_after, multiple_copr_builds):
     builds_list = list(CoprBuildTargetModel.get_all())
     assert len({builds_list[i].id for i in range(4)})
@@ -500,6 +601,22 @@ def test_tmt_test_run_set_status(clean_before_and_after, a_new_test_run_pr):
     assert b.status == TestingFarmResult.running
 
 
+def test_tmt_test_run_mark_timed_out_as_error(
+    clean_before_and_after, a_new_test_run_pr
+):
+    timeout = timedelta(days=1)
+    assert TFTTestRunTargetModel.mark_timed_out_as_error(timeout) == []
+
+    a_new_test_run_pr.update(submitted_time=datetime.utcnow() - timedelta(days=2))
+    assert TFTTestRunTargetModel.mark_timed_out_as_error(timeout) == [
+        a_new_test_run_pr.id
+    ]
+    assert a_new_test_run_pr.status == TestingFarmResult.error
+
+    # only the not completed runs are marked
+    assert TFTTestRunTargetModel.mark_timed_out_as_error(timeout) == []
+
+
 def test_tmt_test_run_get_project(clean_before_and_after, a_new_test_run_pr):
     assert a_new_test_run_pr.status == TestingFarmResult.new
     assert a_new_test_run_pr.get_project().namespace == "the-namespace"
@@ -647,6 +764,25 @@ def test_get_project(clean_before_and_after, a_copr_build_for_pr):
     assert project.project_url == "https://github.com/the-namespace/the-repo-name"
 
 
+def test_get_summaries(clean_before_and_after, a_copr_build_for_pr, branch_model):
+    summaries = GitProjectModel.get_summaries(
+        forge="github.com", namespace="the-namespace", repo_name="the-repo-name"
+    )
+    assert len(summaries) == 1
+    assert summaries[0].project.project_url == SampleValues.project_url
+    assert summaries[0].prs_handled == 1
+    assert summaries[0].branches_handled == 1
+    assert summaries[0].releases_handled == 0
+    assert summaries[0].issues_handled == 0
+
+
+def test_get_summaries_by_forge(clean_before_and_after, multiple_forge_projects):
+    assert len(GitProjectModel.get_summaries(0, 10)) == 4
+    assert len(GitProjectModel.get_summaries(0, 1)) == 1
+    assert len(GitProjectModel.get_summaries(0, 10, forge="github.com")) == 2
+    assert len(GitProjectModel.get_summaries(0, 10, forge="gitlab.com")) == 1
+
+
 def test_get_by_forge(clean_before_and_after, multiple_forge_projects):
     projects = list(GitProjectModel.get_by_forge(0, 10, "github.com"))
     assert projects
@@ -790,21 +926,56 @@ def test_project_token_model(clean_before_and_after):
 
 def test_merged_runs(clean_before_and_after, few_runs):
     for i, run_id in enumerate(few_runs, 1):
-        merged_run = PipelineModel.get_merged_run(run_id)
+        merged_run = MergedRunModel.get_by_id(run_id)
         srpm_build_id = merged_run.srpm_build_id
 
-        # for different_pr (i=1) there are Copr builds twice, since the second
-        # run of TFT from the same Copr build produces new row with same SRPM
-        # and Copr IDs, but different Testing Farm IDs
-        # ^ handled in API by iterating over set of IDs instead of list
-        assert len(merged_run.copr_build_id) == 2 * i
+        # for different_pr (i=2) the second run of TFT from the same Copr build
+        # produces new row with same SRPM and Copr IDs, but different Testing Farm IDs
+        assert len(merged_run.copr_build_ids) == 2
 
         for copr_build in map(
-            lambda ids: CoprBuildTargetModel.get_by_id(ids[0]), merged_run.copr_build_id
+            CoprBuildTargetModel.get_by_id, merged_run.copr_build_ids
         ):
             assert copr_build.get_srpm_build().id == srpm_build_id
 
-        assert len(merged_run.test_run_id) == 2 * i
+        assert len(merged_run.test_run_ids) == 2 * i
+
+
+def test_get_merged_chroots_before(clean_before_and_after, too_many_copr_builds):
+    first_page = list(CoprBuildTargetModel.get_merged_chroots(0, 10))
+    second_page = list(CoprBuildTargetModel.get_merged_chroots(10, 20))
+
+    keyset_page = list(
+        CoprBuildTargetModel.get_merged_chroots(0, 10, before=first_page[-1].new_id)
+    )
+    assert [build.new_id for build in keyset_page] == [
+        build.new_id for build in second_page
+    ]
+    assert [build.packit_id_per_chroot for build in keyset_page] == [
+        build.packit_id_per_chroot for build in second_page
+    ]
+    # 40 unique build IDs
+    assert not list(
+        CoprBuildTargetModel.get_merged_chroots(
+            0, 10, before=min(build.id for build in too_many_copr_builds)
+        )
+    )
+
+
+def test_merged_runs_before(clean_before_and_after, too_many_copr_builds):
+    runs = list(PipelineModel.get_merged_chroots(0, 100))
+    # one run per SRPM build
+    assert len(runs) == 60
+
+    keyset_page = list(
+        PipelineModel.get_merged_chroots(0, 10, before=runs[9].merged_id)
+    )
+    assert [run.merged_id for run in keyset_page] == [
+        run.merged_id for run in runs[10:20]
+    ]
+    assert [run.copr_build_id for run in keyset_page] == [
+        run.copr_build_id for run in runs[10:20]
+    ]
 
 
 def test_merged_chroots_on_tests_without_build(
@@ -816,6 +987,90 @@ def test_merged_chroots_on_tests_without_build(
         assert len(item.test_run_id[0]) == 1
 
 
+def aggregated_runs():
+    """Merged runs aggregated from the pipelines, in the form of the summaries."""
+
+    def ids(nested_ids):
+        return sorted({ids[0] for ids in nested_ids if ids[0]})
+
+    return [
+        (
+            run.merged_id,
+            run.srpm_build_id,
+            ids(run.copr_build_id),
+            ids(run.koji_build_id),
+            ids(run.test_run_id),
+            ids(run.propose_downstream_run_id),
+        )
+        for run in PipelineModel.get_merged_chroots(0, 1000)
+    ]
+
+
+def summarized_runs():
+    return [
+        (
+            run.id,
+            run.srpm_build_id,
+            run.copr_build_ids,
+            run.koji_build_ids,
+            run.test_run_ids,
+            run.propose_downstream_run_ids,
+        )
+        for run in MergedRunModel.get_range(0, 1000)
+    ]
+
+
+def test_merged_run_summaries(clean_before_and_after, few_runs, runs_without_build):
+    summaries = summarized_runs()
+    assert summaries == aggregated_runs()
+    # 2 runs with SRPM builds, 2 without builds
+    assert len(summaries) == 4
+    assert MergedRunModel.get_by_id(few_runs[0]).srpm_build_id is not None
+
+
+def test_merged_run_summaries_backfill(clean_before_and_after, too_many_copr_builds):
+    summaries = summarized_runs()
+    first_run = summaries[-1][0]
+    with sa_session_transaction() as session:
+        session.query(MergedRunModel).filter(MergedRunModel.id != first_run).delete()
+
+    assert MergedRunModel.backfill(batch_size=7) == len(summaries) - 1
+    assert summarized_runs() == summaries == aggregated_runs()
+    # nothing is missing anymore
+    assert MergedRunModel.backfill() == 0
+
+
+def test_create_koji_builds_for_targets(
+    clean_before_and_after, srpm_build_model_with_new_run_for_pr
+):
+    srpm_build, run_model = srpm_build_model_with_new_run_for_pr
+    builds = KojiBuildTargetModel.create_for_targets(
+        builds=[
+            ("f36", "1", "https://koji/1"),
+            ("f37", "2", None),
+            ("rawhide", "3", "https://koji/3"),
+        ],
+        commit_sha=SampleValues.commit_sha,
+        status="pending",
+        scratch=True,
+        run_model=run_model,
+    )
+
+    assert [(build.target, build.build_id) for build in builds] == [
+        ("f36", "1"),
+        ("f37", "2"),
+        ("rawhide", "3"),
+    ]
+    # the first build uses the pipeline of the SRPM build, the others its clones
+    assert builds[0].runs == [run_model]
+    pipelines = [build.runs[0] for build in builds]
+    assert len({pipeline.id for pipeline in pipelines}) == 3
+    assert all(pipeline.srpm_build == srpm_build for pipeline in pipelines)
+    assert MergedRunModel.get_by_id(run_model.id).koji_build_ids == sorted(
+        build.id for build in builds
+    )
+
+
 def test_tf_get_all_by_commit_target(clean_before_and_after, multiple_new_test_runs):
     test_list = list(
         TFTTestRunTargetModel.get_all_by_commit_target(
@@ -994,3 +1249,33 @@ def test_get_by_dist_git_id(
     assert SourceGitPRDistGitPRModel.get_by_dist_git_id(
         source_git_dist_git_pr_new_relationship.dist_git_pull_request_id
     )
+
+
+def test_posted_comments(clean_before_and_after):
+    project_url = SampleValues.project_url
+    assert PostedCommentModel.get_body_hashes(project_url, pr_id=1) is None
+
+    # not recorded yet
+    PostedCommentModel.add_body_hashes(
+        project_url, ["first"], pr_id=1, only_if_recorded=True
+    )
+    assert PostedCommentModel.get_body_hashes(project_url, pr_id=1) is None
+
+    PostedCommentModel.add_body_hashes(project_url, ["first", "second"], pr_id=1)
+    PostedCommentModel.add_body_hashes(
+        project_url, ["third"], pr_id=1, only_if_recorded=True
+    )
+    assert PostedCommentModel.get_body_hashes(project_url, pr_id=1) == [
+        "first",
+        "second",
+        "third",
+    ]
+
+    # other PR and commit comments are kept separately
+    assert PostedCommentModel.get_body_hashes(project_url, pr_id=2) is None
+    assert (
+        PostedCommentModel.get_body_hashes(
+            project_url, commit_sha=SampleValues.commit_sha
+        )
+        is None
+    )
@@ -0,0 +1,98 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Stress test of the task-scoped sessions: many "tasks" running in a thread pool
+(as in a worker with the threads pool) have to get their own sessions
+and must not leave any connection checked out.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, get_ident
+
+from sqlalchemy import text
+
+from packit_service.models import (
+    GitProjectModel,
+    PullRequestModel,
+    Session,
+    end_session,
+    engine,
+    sa_session,
+)
+from tests_openshift.conftest import SampleValues
+
+THREADS = 8
+TASKS = 200
+
+
+def run_task(pr_id: int, barrier: Barrier):
+    session = sa_session()
+    # the session is the same for the whole task
+    assert sa_session() is session
+    backend_pid = session.execute(text("SELECT pg_backend_pid()")).scalar()
+
+    try:
+        PullRequestModel.get_or_create(
+            pr_id=pr_id,
+            namespace=SampleValues.repo_namespace,
+            repo_name=SampleValues.repo_name,
+            project_url=SampleValues.project_url,
+        )
+        # make the first tasks of all the threads run at once
+        if barrier:
+            barrier.wait(timeout=30)
+        assert {
+            pr.pr_id
+            for pr in sa_session()
+            .query(PullRequestModel)
+            .filter(PullRequestModel.pr_id == pr_id)
+        } == {pr_id}
+    finally:
+        end_session()
+
+    assert not Session.registry.has()
+    return get_ident(), session, backend_pid
+
+
+def test_task_scoped_sessions(clean_before_and_after):
+    # creating the same project concurrently would be a race in get_or_create
+    GitProjectModel.get_or_create(
+        namespace=SampleValues.repo_namespace,
+        repo_name=SampleValues.repo_name,
+        project_url=SampleValues.project_url,
+    )
+    end_session()
+
+    barrier = Barrier(THREADS)
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(
+            executor.map(
+                lambda pr_id: run_task(pr_id, barrier if pr_id < THREADS else None),
+                range(TASKS),
+            )
+        )
+
+    threads = {thread for thread, _, _ in results}
+    sessions = {id(session) for _, session, _ in results}
+    assert len(threads) == THREADS
+    # every task got a new session (the sessions are kept alive in the results,
+    # so their IDs can't be reused)
+    assert len(sessions) == TASKS
+    # the concurrently running tasks used different connections
+    assert len({pid for _, _, pid in results[:THREADS]}) == THREADS
+    # nothing leaked
+    assert engine.pool.checkedout() == 0
+    assert sa_session().query(PullRequestModel).count() == TASKS
+
+
+def test_end_session_rollback(clean_before_and_after):
+    pr = PullRequestModel.get_or_create(
+        pr_id=SampleValues.pr_id,
+        namespace=SampleValues.repo_namespace,
+        repo_name=SampleValues.repo_name,
+        project_url=SampleValues.project_url,
+    )
+    pr.pr_id = SampleValues.pr_id + 1
+    end_session(commit=False)
+
+    assert sa_session().query(PullRequestModel).one().pr_id == SampleValues.pr_id
@@ -1,10 +1,14 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+from collections import Counter
+
 import pytest
 from copr.v3 import Client, BuildProxy, BuildChrootProxy
 from flexmock import flexmock
 from munch import Munch
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 import packit_service
 from ogr.services.github import GithubProject
@@ -20,6 +24,7 @@ from packit_service.models import (
     SRPMBuildModel,
     PullRequestModel,
     BuildStatus,
+    engine,
 )
 from packit_service.worker.events import AbstractCoprBuildEvent
 from packit_service.worker.helpers.build.babysit import check_copr_build
@@ -52,6 +57,28 @@ BUILD_ID = 1300329
 #     PersistentObjectStorage().dump()
 
 
+@pytest.fixture()
+def db_writes():
+    """
+    Counts the commits (under the `commits` key) and the UPDATE statements
+    per table.
+    """
+    writes = Counter()
+
+    def count_commit(session):
+        writes["commits"] += 1
+
+    def count_update(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            writes[statement.split()[1]] += 1
+
+    event.listen(Session, "after_commit", count_commit)
+    event.listen(engine, "before_cursor_execute", count_update)
+    yield writes
+    event.remove(engine, "before_cursor_execute", count_update)
+    event.remove(Session, "after_commit", count_commit)
+
+
 @pytest.fixture()
 def packit_build_752():
     pr_model = PullRequestModel.get_or_create(
@@ -81,7 +108,7 @@ def packit_build_752():
     )
 
 
-def test_check_copr_build(clean_before_and_after, packit_build_752):
+def test_check_copr_build(clean_before_and_after, packit_build_752, db_writes):
     flexmock(Client).should_receive("create_from_config_file").and_return(
         Client(
             config={
@@ -212,5 +239,13 @@ def test_check_copr_build(clean_before_and_after, packit_build_752):
         }
     )
 
+    db_writes.clear()
     check_copr_build(BUILD_ID)
     assert packit_build_752.status == BuildStatus.success
+
+    # all the changes of a build are committed at once
+    assert db_writes["copr_build_targets"] == 1
+    assert db_writes["srpm_builds"] == 1
+    # committed per attribute, the status, end time and built packages of the build
+    # and the URL of the SRPM would take 4 commits
+    assert db_writes["commits"] <= 3
@@ -2,13 +2,18 @@
 # SPDX-License-Identifier: MIT
 
 from flask import url_for
+from sqlalchemy import event
 
 from packit_service.models import (
     TestingFarmResult,
-    PipelineModel,
+    MergedRunModel,
+    end_session,
+    engine,
+    sa_session,
     ProposeDownstreamStatus,
     ProposeDownstreamTargetStatus,
 )
+from packit_service.service.api.parsers import encode_cursor
 from packit_service.service.api.runs import process_runs
 from tests_openshift.conftest import SampleValues
 
@@ -77,6 +82,46 @@ def test_pagination(client, clean_before_and_after, too_many_copr_builds):
     assert len(response_dict_2) == 30  # three builds, but two unique build ids
 
 
+def test_pagination_cursor(client, clean_before_and_after, too_many_copr_builds):
+    url = url_for("api.copr-builds_copr_builds_list") + "?per_page=30"
+    response_1 = client.get(url)
+    assert len(response_1.json) == 30
+    assert response_1.json == client.get(url + "&page=1").json
+
+    response_2 = client.get(url + f"&cursor={response_1.headers['X-Next-Cursor']}")
+    assert response_2.json == client.get(url + "&page=2").json
+    # 40 unique build IDs
+    assert len(response_2.json) == 10
+    assert "X-Next-Cursor" not in response_2.headers
+    assert {build["build_id"] for build in response_1.json + response_2.json} == {
+        build.build_id for build in too_many_copr_builds
+    }
+
+
+def test_pagination_invalid_cursor(client, clean_before_and_after):
+    response = client.get(
+        url_for("api.copr-builds_copr_builds_list") + "?cursor=not-a-cursor"
+    )
+    assert response.status_code == 400
+
+    # cursor of a list paginated by a single key
+    response = client.get(
+        url_for("api.projects_projects_list") + f"?cursor={encode_cursor([1])}"
+    )
+    assert response.status_code == 400
+
+    # cursor with a key of a wrong type
+    response = client.get(
+        url_for("api.copr-builds_copr_builds_list") + f"?cursor={encode_cursor(['a'])}"
+    )
+    assert response.status_code == 400
+
+    response = client.get(
+        url_for("api.projects_projects_list") + f"?cursor={encode_cursor([1, 'a'])}"
+    )
+    assert response.status_code == 400
+
+
 # Test detailed build info
 def test_detailed_copr_build_info(client, clean_before_and_after, a_copr_build_for_pr):
     response = client.get(
@@ -220,6 +265,46 @@ def test_srpm_build_info(
     assert "release" in response_dict
 
 
+def test_srpm_build_logs(
+    client, clean_before_and_after, srpm_build_model_with_new_run_for_pr
+):
+    srpm_build_model, _ = srpm_build_model_with_new_run_for_pr
+    response = client.get(
+        url_for("api.srpm-builds_srpm_build_logs", id=srpm_build_model.id)
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    assert response.get_data(as_text=True) == SampleValues.srpm_logs
+
+
+def test_srpm_build_logs_sent_after_session_ended(
+    client, clean_before_and_after, srpm_build_model_with_new_run_for_pr
+):
+    srpm_build_model, _ = srpm_build_model_with_new_run_for_pr
+    response = client.get(
+        url_for("api.srpm-builds_srpm_build_logs", id=srpm_build_model.id),
+        buffered=False,
+    )
+    # the response is sent after the request has ended its DB session
+    end_session()
+
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == SampleValues.srpm_logs
+
+
+def test_srpm_build_logs_discarded(
+    client, clean_before_and_after, srpm_build_model_with_new_run_for_pr
+):
+    srpm_build_model, _ = srpm_build_model_with_new_run_for_pr
+    srpm_build_model.set_logs(None)
+    response = client.get(
+        url_for("api.srpm-builds_srpm_build_logs", id=srpm_build_model.id)
+    )
+
+    assert response.status_code == 404
+
+
 def test_srpm_build_in_copr_info(
     client, clean_before_and_after, srpm_build_in_copr_model
 ):
@@ -460,7 +545,7 @@ def test_meta(client, clean_before_and_after, a_copr_build_for_pr):
 
 
 def test_process_runs_without_build(clean_before_and_after, runs_without_build):
-    merged_runs = PipelineModel.get_merged_chroots(0, 10)
+    merged_runs = MergedRunModel.get_range(0, 10)
     result = process_runs(merged_runs)
     for item in result:
         assert not item["srpm"]
@@ -469,6 +554,39 @@ def test_process_runs_without_build(clean_before_and_after, runs_without_build):
         assert item["trigger"]
 
 
+def test_process_runs_multiple_builds(clean_before_and_after, multiple_copr_builds):
+    result = process_runs(MergedRunModel.get_range(0, 10))
+    assert len(result) == 3
+    for item in result:
+        assert item["srpm"]
+        assert item["trigger"]["repo_name"] == SampleValues.repo_name
+        assert item["trigger"]["pr_id"] in (SampleValues.pr_id, 4)
+    assert sorted(len(item["copr"]) for item in result) == [1, 1, 2]
+
+
+def test_process_runs_constant_number_of_queries(
+    clean_before_and_after, multiple_copr_builds
+):
+    statements = []
+
+    def count(*args, **kwargs):
+        statements.append(args)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        sa_session().expire_all()
+        process_runs(MergedRunModel.get_range(0, 1))
+        queries_for_one_run = len(statements)
+        statements.clear()
+        sa_session().expire_all()
+        process_runs(MergedRunModel.get_range(0, 10))
+        queries_for_more_runs = len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert queries_for_more_runs == queries_for_one_run
+
+
 def test_propose_downstream_list_releases(
     client,
     clean_before_and_after,